@@ -2,35 +2,33 @@ import json
 import logging
 import os
 from datetime import timedelta, datetime, timezone
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
 from airflow import DAG
 from airflow.models import Variable
 from airflow.models.dagrun import DagRun
 from airflow.operators.python import ShortCircuitOperator
 
+from ejp_xml_pipeline.dag_pipeline_config.config_loader import load_data_config
 from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
-from ejp_xml_pipeline.etl_state import get_stored_ejp_xml_processing_state
-from ejp_xml_pipeline.etl import (
-    etl_ejp_xml_zip,
-    download_load2bq_cleanup_temp_files
-)
-from ejp_xml_pipeline.utils import (
-    NamedDataPipelineLiterals as named_literals,
-    get_yaml_file_as_dict
-)
-from ejp_xml_pipeline.etl_state import (
-    update_state,
-    update_object_latest_dates,
-)
+from ejp_xml_pipeline.processed_object_manifest import ProcessedObjectManifest
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
 from ejp_xml_pipeline.utils.dags.airflow_s3_util_extension import (
-    S3NewKeyFromLastDataDownloadDateSensor,
-    S3HookNewFileMonitor
+    S3NewKeyFromLastDataDownloadDateSensor
+)
+from ejp_xml_pipeline.utils.s3_object_snapshot import (
+    NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY,
+    get_new_object_key_names_from_snapshot
 )
 from ejp_xml_pipeline.utils.dags.data_pipeline_dag_utils import (
     get_default_args,
+    get_task_run_instance_fullname,
     create_python_task
 )
 
+# the etl modules and the s3 hook (bigquery, boto3, lxml) are imported
+# inside the task callables to keep dag file parsing by the scheduler fast
+# pylint: disable=import-outside-toplevel
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -43,6 +41,10 @@ S3_BUCKET_POLLING_INTERVAL_IN_MINUTES_ENV_VAR_NAME = (
 S3_BUCKET_POLLING_TIMEOUT_IN_MINUTES_ENV_VAR_NAME = (
     "S3_EJP_XML_BUCKET_POLLING_TIMEOUT_IN_MINUTES"
 )
+S3_SENSOR_SNAPSHOT_MAX_AGE_IN_MINUTES_ENV_VAR_NAME = (
+    "S3_EJP_XML_SENSOR_SNAPSHOT_MAX_AGE_IN_MINUTES"
+)
+S3_SENSOR_DEFERRABLE_ENV_VAR_NAME = "S3_EJP_XML_SENSOR_DEFERRABLE"
 
 DEFAULT_INITIAL_S3_XML_FILE_LAST_MODIFIED_DATE = "2020-01-01 00:00:00"
 
@@ -52,6 +54,7 @@ DEFAULT_DEPLOYMENT_ENV_VALUE = "ci"
 NOTIFICATION_EMAILS_ENV_NAME = "AIRFLOW_NOTIFICATION_EMAIL_XML_LIST"
 
 DAG_ID = "S3_XML_Data_Pipeline"
+S3_KEY_SENSOR_TASK_ID = "S3_Key_Sensor_Task"
 
 
 def get_default_args_with_notification_emails():
@@ -92,11 +95,7 @@ def get_config() -> eJPXmlDataConfig:
         DEPLOYMENT_ENV_ENV_NAME, DEFAULT_DEPLOYMENT_ENV_VALUE
     )
     conf_file_path = os.environ[named_literals.EJP_XML_CONFIG_FILE_PATH_ENV_NAME]
-
-    data_config_dict = get_yaml_file_as_dict(
-        conf_file_path
-    )
-    return eJPXmlDataConfig(data_config_dict, dep_env)
+    return load_data_config(conf_file_path, dep_env)
 
 
 # pylint: disable='unused-argument'
@@ -132,7 +131,30 @@ def update_prev_run_id_var_val(**context):
     )
 
 
+def get_stored_ejp_xml_processing_state(
+        data_config: eJPXmlDataConfig,
+        default_latest_file_date
+):
+    from ejp_xml_pipeline import etl_state
+    return etl_state.get_stored_ejp_xml_processing_state(
+        data_config, default_latest_file_date
+    )
+
+
+def get_stored_processed_object_manifest(
+        data_config: eJPXmlDataConfig
+) -> Optional[ProcessedObjectManifest]:
+    from ejp_xml_pipeline import etl_state
+    return etl_state.get_stored_processed_object_manifest(data_config)
+
+
 def etl_new_ejp_xml_files(**context):
+    from ejp_xml_pipeline.etl import etl_ejp_xml_zip
+    from ejp_xml_pipeline.etl_state import (
+        update_state,
+        update_object_latest_dates,
+        update_processed_object_manifest
+    )
     data_config = get_config()
     obj_pattern_with_latest_dates = (
         get_stored_ejp_xml_processing_state(
@@ -140,10 +162,18 @@ def etl_new_ejp_xml_files(**context):
             get_default_initial_s3_last_modified_date()
         )
     )
+    processed_object_manifest = get_stored_processed_object_manifest(
+        data_config
+    )
     matching_file_metadata_iter = etl_s3_object_pattern(
         data_config,
         obj_pattern_with_latest_dates,
         data_config.s3_bucket,
+        processed_object_manifest=processed_object_manifest,
+        new_s3_objects_snapshot=context['ti'].xcom_pull(
+            task_ids=S3_KEY_SENSOR_TASK_ID,
+            key=NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY
+        )
     )
 
     for matching_file_metadata, object_key_pattern in matching_file_metadata_iter:
@@ -154,6 +184,11 @@ def etl_new_ejp_xml_files(**context):
             data_config, object_key,
         )
 
+        processed_object_manifest = update_processed_object_manifest(
+            processed_object_manifest,
+            matching_file_metadata,
+            data_config
+        )
         updated_obj_pattern_with_latest_dates = (
             update_object_latest_dates(
                 obj_pattern_with_latest_dates,
@@ -170,7 +205,16 @@ def etl_new_ejp_xml_files(**context):
         )
 
 
+def upload_task_profile(profile_bytes: bytes, context: dict):
+    from ejp_xml_pipeline.etl_state import update_stored_task_profile
+    data_config = get_config()
+    profile_name = get_task_run_instance_fullname(context)
+    LOGGER.info('uploading task profile: %s', profile_name)
+    update_stored_task_profile(profile_bytes, data_config, profile_name)
+
+
 def load_temp_ejp_json_files_to_bq(**context):
+    from ejp_xml_pipeline.etl import download_load2bq_cleanup_temp_files
     data_config = get_config()
     batch_size_limit = 100000
 
@@ -190,24 +234,44 @@ def load_temp_ejp_json_files_to_bq(**context):
             data_config.gcp_project,
             data_config.dataset,
             entity_type.table_name,
-            batch_size_limit
+            batch_size_limit,
+            json_schema=entity_type.json_schema
         )
 
 
 def etl_s3_object_pattern(
         data_config: eJPXmlDataConfig,
         obj_pattern_with_latest_dates: dict,
-        s3_bucket_name: str
+        s3_bucket_name: str,
+        processed_object_manifest: Optional[ProcessedObjectManifest] = None,
+        new_s3_objects_snapshot: Optional[dict] = None
 ) -> Iterable[Tuple]:
 
-    hook = S3HookNewFileMonitor(
-        aws_conn_id=named_literals.DEFAULT_AWS_CONN_ID,
-        verify=None
-    )
-    new_s3_files = hook.get_new_object_key_names(
+    new_s3_files = get_new_object_key_names_from_snapshot(
+        new_s3_objects_snapshot,
         obj_pattern_with_latest_dates,
-        s3_bucket_name
+        max_age=get_sensor_snapshot_max_age(),
+        now=datetime.now(timezone.utc),
+        processed_object_manifest=processed_object_manifest
     )
+    if new_s3_files is not None:
+        LOGGER.info('using new s3 objects found by sensor')
+    else:
+        from ejp_xml_pipeline.utils.dags.s3_new_file_monitor import (
+            S3HookNewFileMonitor
+        )
+        hook = S3HookNewFileMonitor(
+            aws_conn_id=named_literals.DEFAULT_AWS_CONN_ID,
+            verify=None,
+            date_partitioned_listing=data_config.date_partitioned_s3_listing,
+            max_list_workers=data_config.s3_listing_max_concurrency,
+            probe_max_keys=data_config.s3_listing_probe_max_keys
+        )
+        new_s3_files = hook.get_new_object_key_names(
+            obj_pattern_with_latest_dates,
+            s3_bucket_name,
+            processed_object_manifest=processed_object_manifest
+        )
 
     for object_key_pattern, matching_files_list in new_s3_files.items():
         sorted_matching_files_list = (
@@ -239,6 +303,20 @@ def etl_s3_object_pattern(
             yield matching_file_metadata, object_key_pattern
 
 
+def get_sensor_snapshot_max_age() -> timedelta:
+    return timedelta(minutes=int(
+        os.getenv(
+            S3_SENSOR_SNAPSHOT_MAX_AGE_IN_MINUTES_ENV_VAR_NAME, "30"
+        )
+    ))
+
+
+def is_sensor_deferrable() -> bool:
+    return os.getenv(
+        S3_SENSOR_DEFERRABLE_ENV_VAR_NAME, "false"
+    ).lower() == "true"
+
+
 def get_default_initial_s3_last_modified_date():
     return os.getenv(
         INITIAL_S3_XML_FILE_LAST_MODIFIED_DATE_ENV_NAME,
@@ -253,7 +331,7 @@ SHOULD_REMAINING_TASK_EXECUTE = ShortCircuitOperator(
 
 
 NEW_S3_FILE_SENSOR = S3NewKeyFromLastDataDownloadDateSensor(
-    task_id='S3_Key_Sensor_Task',
+    task_id=S3_KEY_SENSOR_TASK_ID,
     poke_interval=60 * int(
         os.getenv(
             S3_BUCKET_POLLING_INTERVAL_IN_MINUTES_ENV_VAR_NAME, "5"
@@ -266,7 +344,11 @@ NEW_S3_FILE_SENSOR = S3NewKeyFromLastDataDownloadDateSensor(
         )
     ),
     retries=0,
+    deferrable=is_sensor_deferrable(),
     state_info_extract_from_config_callable=get_stored_ejp_xml_processing_state,
+    processed_object_manifest_extract_from_config_callable=(
+        get_stored_processed_object_manifest
+    ),
     default_initial_s3_last_modified_date=(
         get_default_initial_s3_last_modified_date()
     ),
@@ -286,14 +368,16 @@ LOCK_DAGRUN_UPDATE_PREVIOUS_RUNID = create_python_task(
 ETL_XML_TO_S3_JSON = create_python_task(
     S3_XML_ETL_DAG, "ETL_eJP_XML_To_S3_JSON",
     etl_new_ejp_xml_files,
-    email_on_failure=True
+    email_on_failure=True,
+    profile_output_handler=upload_task_profile
 )
 
 
 LOAD_TEMP_FILE_TO_BQ = create_python_task(
     S3_XML_ETL_DAG, "Load_S3_JSON_To_BQ",
     load_temp_ejp_json_files_to_bq,
-    email_on_failure=True
+    email_on_failure=True,
+    profile_output_handler=upload_task_profile
 )
 
 # pylint: disable=pointless-statement
@@ -0,0 +1,60 @@
+import hashlib
+import os
+import threading
+from typing import Dict, NamedTuple, Tuple
+
+import yaml
+
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+
+
+class CachedDataConfig(NamedTuple):
+    mtime_ns: int
+    size: int
+    content_digest: str
+    data_config: eJPXmlDataConfig
+
+
+_DATA_CONFIG_CACHE: Dict[Tuple[str, str], CachedDataConfig] = {}
+_DATA_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def get_content_digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def clear_data_config_cache():
+    with _DATA_CONFIG_CACHE_LOCK:
+        _DATA_CONFIG_CACHE.clear()
+
+
+def load_data_config(
+        conf_file_path: str,
+        deployment_env: str
+) -> eJPXmlDataConfig:
+    cache_key = (os.path.abspath(conf_file_path), deployment_env)
+    file_stat = os.stat(conf_file_path)
+    with _DATA_CONFIG_CACHE_LOCK:
+        cached = _DATA_CONFIG_CACHE.get(cache_key)
+    if (
+            cached
+            and cached.mtime_ns == file_stat.st_mtime_ns
+            and cached.size == file_stat.st_size
+    ):
+        return cached.data_config
+    with open(conf_file_path, 'rb') as conf_file:
+        content = conf_file.read()
+    content_digest = get_content_digest(content)
+    if cached and cached.content_digest == content_digest:
+        # touched but unchanged, keep the parsed config
+        data_config = cached.data_config
+    else:
+        data_config = eJPXmlDataConfig(yaml.safe_load(content), deployment_env)
+    with _DATA_CONFIG_CACHE_LOCK:
+        _DATA_CONFIG_CACHE[cache_key] = CachedDataConfig(
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+            content_digest=content_digest,
+            data_config=data_config
+        )
+    return data_config
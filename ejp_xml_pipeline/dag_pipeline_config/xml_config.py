@@ -1,11 +1,19 @@
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import List, Optional, Type
 from ejp_xml_pipeline.model.entities import (
+    BaseEntity,
     ManuscriptVersion,
     PersonV2,
     Person,
     Manuscript
 )
+from ejp_xml_pipeline.model.record_schema import get_record_json_schema
+from ejp_xml_pipeline.utils.xml_transform_util.xml_parser_pool import (
+    DEFAULT_XML_PARSER_OPTIONS,
+    XmlParserOptions
+)
 
 
 class EntityDBLoadConfig:
@@ -13,11 +21,12 @@ class EntityDBLoadConfig:
             self,
             file_name: str,
             table_name,
-            s3_object_prefix: str
+            s3_object_prefix: str,
+            json_schema: Optional[List[dict]] = None
     ):
         self.file_name = file_name
         self.table_name = table_name
-        self.file_directory = None
+        self.json_schema = json_schema
         obj_name = (
             s3_object_prefix.strip()
             if s3_object_prefix.strip().endswith('/')
@@ -26,17 +35,23 @@ class EntityDBLoadConfig:
         self.s3_object_prefix = obj_name + file_name + '/'
         self.s3_object_wildcard_prefix = self.s3_object_prefix + '*'
 
-    def set_directory(self, file_directory):
-        self.file_directory = file_directory
-
-    def get_full_file_location(self):
+    def get_full_file_location(self, file_directory: str) -> str:
         return os.fspath(
-            Path(self.file_directory, self.file_name)
+            Path(file_directory, self.file_name)
         )
 
-    def set_directory_get_full_file_location(self, file_directory):
-        self.set_directory(file_directory)
-        return self.get_full_file_location()
+
+def get_entity_db_load_config(
+        entity_class: Type[BaseEntity],
+        table_name,
+        s3_object_prefix: str
+) -> EntityDBLoadConfig:
+    return EntityDBLoadConfig(
+        entity_class.__name__,
+        table_name,
+        s3_object_prefix,
+        json_schema=get_record_json_schema(entity_class.record_class)
+    )
 
 
 # pylint: disable=invalid-name,too-many-instance-attributes
@@ -62,6 +77,15 @@ class eJPXmlDataConfig:
         self.s3_object_key_pattern = updated_config.get(
             "eJPXmlObjectKeyPattern", ""
         )
+        self.date_partitioned_s3_listing = updated_config.get(
+            "eJPXmlObjectKeyDatePartitionedListing", False
+        )
+        self.s3_listing_max_concurrency = updated_config.get(
+            "eJPXmlObjectListingMaxConcurrency", 4
+        )
+        self.s3_listing_probe_max_keys = updated_config.get(
+            "eJPXmlObjectListingProbeMaxKeys"
+        )
         self.xml_filename_exclusion_regex_pattern = updated_config.get(
             "eJPXmlFileNameExclusionRegexPattern", ""
         )
@@ -72,6 +96,40 @@ class eJPXmlDataConfig:
             "stateFile", {}).get("bucket")
         self.state_file_object = updated_config.get(
             "stateFile", {}).get("object")
+        self.state_manifest_file_object = updated_config.get(
+            "stateFile", {}).get(
+                "manifestObject",
+                get_sibling_object_key(
+                    self.state_file_object, "-manifest.jsonl"
+                )
+        )
+        self.etl_metrics_object_prefix = updated_config.get(
+            "stateFile", {}).get(
+                "metricsObjectPrefix",
+                get_sibling_object_key(
+                    self.state_file_object, "-metrics/"
+                )
+        )
+        self.task_profile_object_prefix = updated_config.get(
+            "stateFile", {}).get(
+                "profileObjectPrefix",
+                get_sibling_object_key(
+                    self.state_file_object, "-profiles/"
+                )
+        )
+        self.member_digest_index_object = updated_config.get(
+            "memberDigestIndex", {}).get("object")
+        self.force_full_reprocess = updated_config.get(
+            "memberDigestIndex", {}).get("forceFullReprocess", False)
+        self.member_resource_report_top_n = updated_config.get(
+            "memberResourceReport", {}).get("topN", 10)
+        self.member_resource_report_trace_memory = updated_config.get(
+            "memberResourceReport", {}).get("traceMemory", False)
+        self.zip_read_ahead_queue_size = updated_config.get(
+            "zipReadAhead", {}).get("queueSize", 2)
+        self.xml_parser_options = get_xml_parser_options(
+            updated_config.get("xmlParser", {})
+        )
         self.manuscript_table = updated_config.get(
             "manuscriptTable"
         )
@@ -88,28 +146,83 @@ class eJPXmlDataConfig:
         self.temp_file_s3_obj_prefix = updated_config.get(
             'tempS3FileStorage', {}
         ).get('objectPrefix')
-        self.entity_type_mapping = {
-            ManuscriptVersion: EntityDBLoadConfig(
-                ManuscriptVersion.__name__,
+        # completed members of a zip are uploaded as parts, to resume from,
+        # unless memberCount is 0
+        self.zip_checkpoint_member_count = updated_config.get(
+            "zipCheckpoint", {}).get("memberCount", 0)
+        self.zip_progress_object_prefix = get_zip_progress_object_prefix(
+            self.temp_file_s3_obj_prefix
+        )
+        # entities are streamed to s3 while parsing, unless maxConcurrency is 0
+        self.multipart_upload_part_size = updated_config.get(
+            "multipartUpload", {}).get("partSizeBytes", 8 * 1024 * 1024)
+        self.multipart_upload_max_concurrency = updated_config.get(
+            "multipartUpload", {}).get("maxConcurrency", 0)
+        self.entity_type_mapping = MappingProxyType({
+            ManuscriptVersion: get_entity_db_load_config(
+                ManuscriptVersion,
                 self.manuscript_version_table,
                 self.temp_file_s3_obj_prefix
             ),
-            Manuscript: EntityDBLoadConfig(
-                Manuscript.__name__,
+            Manuscript: get_entity_db_load_config(
+                Manuscript,
                 self.manuscript_table,
                 self.temp_file_s3_obj_prefix
             ),
-            Person: EntityDBLoadConfig(
-                Person.__name__,
+            Person: get_entity_db_load_config(
+                Person,
                 self.person_table,
                 self.temp_file_s3_obj_prefix
             ),
-            PersonV2: EntityDBLoadConfig(
-                PersonV2.__name__,
+            PersonV2: get_entity_db_load_config(
+                PersonV2,
                 self.person_v2_table,
                 self.temp_file_s3_obj_prefix
             )
-        }
+        })
+        self._is_frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_is_frozen', False):
+            raise AttributeError(
+                f'eJPXmlDataConfig is immutable, cannot set {name}'
+            )
+        super().__setattr__(name, value)
+
+
+def get_zip_progress_object_prefix(
+        temp_file_s3_obj_prefix: Optional[str]
+) -> Optional[str]:
+    # not below an entity prefix, which would load it as entity data
+    if not temp_file_s3_obj_prefix or not temp_file_s3_obj_prefix.strip():
+        return None
+    return temp_file_s3_obj_prefix.strip().rstrip('/') + '/zip-progress/'
+
+
+def get_xml_parser_options(xml_parser_config: dict) -> XmlParserOptions:
+    return XmlParserOptions(
+        remove_blank_text=xml_parser_config.get(
+            "removeBlankText", DEFAULT_XML_PARSER_OPTIONS.remove_blank_text
+        ),
+        remove_comments=xml_parser_config.get(
+            "removeComments", DEFAULT_XML_PARSER_OPTIONS.remove_comments
+        ),
+        huge_tree=xml_parser_config.get(
+            "hugeTree", DEFAULT_XML_PARSER_OPTIONS.huge_tree
+        ),
+        collect_ids=xml_parser_config.get(
+            "collectIds", DEFAULT_XML_PARSER_OPTIONS.collect_ids
+        )
+    )
+
+
+def get_sibling_object_key(
+        object_key: Optional[str],
+        suffix: str
+) -> Optional[str]:
+    if not object_key:
+        return None
+    return os.path.splitext(object_key)[0] + suffix
 
 
 def update_deployment_env_placeholder(
@@ -0,0 +1,47 @@
+from abc import ABCMeta, abstractmethod
+from typing import List, Optional
+
+
+class BigQueryBackend(metaclass=ABCMeta):
+    # the bigquery operations used by the pipeline, selected once per configuration
+
+    @abstractmethod
+    def load_file(  # pylint: disable=too-many-arguments
+            self,
+            filename: str,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            source_format: str,
+            write_mode: str,
+            auto_detect_schema: bool = False,
+            rows_to_skip: int = 0
+    ):
+        pass
+
+    @abstractmethod
+    def get_table_schema(
+            self, project_name: str, dataset_name: str, table_name: str
+    ) -> Optional[List[dict]]:
+        # returns None if the table doesn't exist
+        pass
+
+    @abstractmethod
+    def create_table(
+            self,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            json_schema: List[dict]
+    ):
+        pass
+
+    @abstractmethod
+    def update_table_schema(
+            self,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            json_schema: List[dict]
+    ):
+        pass
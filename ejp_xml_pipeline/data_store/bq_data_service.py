@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import List
+import threading
+from typing import Dict, List, Optional
 from google.cloud import bigquery
 from google.cloud.bigquery import (
     LoadJobConfig, Client,
@@ -10,9 +11,119 @@ from google.cloud.bigquery.schema import SchemaField
 from google.cloud.exceptions import NotFound
 from bigquery_schema_generator.generate_schema import SchemaGenerator
 
+from ejp_xml_pipeline.data_store.bq_backend import BigQueryBackend
+from ejp_xml_pipeline.data_store.local_bq_data_service import (
+    LocalBigQueryBackend,
+    get_local_bq_root_dir
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
+class GoogleBigQueryBackend(BigQueryBackend):
+    def load_file(  # pylint: disable=too-many-arguments
+            self,
+            filename: str,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            source_format: str,
+            write_mode: str,
+            auto_detect_schema: bool = False,
+            rows_to_skip: int = 0
+    ):
+        client = Client(project=project_name)
+        dataset_ref = client.dataset(dataset_name)
+        table_ref = dataset_ref.table(table_name)
+        job_config = LoadJobConfig()
+        job_config.source_format = source_format
+        job_config.write_disposition = write_mode
+        job_config.autodetect = auto_detect_schema
+        if source_format is bigquery.SourceFormat.CSV:
+            job_config.skip_leading_rows = rows_to_skip
+        with open(filename, "rb") as source_file:
+
+            job = client.load_table_from_file(
+                source_file, destination=table_ref, job_config=job_config
+            )
+
+            # Waits for table cloud_data_store to complete
+            job.result()
+            LOGGER.info(
+                "Loaded %s rows into %s:%s.",
+                job.output_rows,
+                dataset_name,
+                table_name
+            )
+
+    def get_table_schema(
+            self, project_name: str, dataset_name: str, table_name: str
+    ) -> Optional[List[dict]]:
+        client = bigquery.Client(project=project_name)
+        try:
+            table = client.get_table(
+                compose_full_table_name(project_name, dataset_name, table_name)
+            )
+        except NotFound:
+            return None
+        return [schema_field.to_api_repr() for schema_field in table.schema]
+
+    def create_table(
+            self,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            json_schema: List[dict]
+    ):
+        client = bigquery.Client(project=project_name)
+        table = bigquery.Table(
+            compose_full_table_name(project_name, dataset_name, table_name),
+            schema=get_schemafield_list_from_json_list(json_schema)
+        )
+        table = client.create_table(table, True)  # API request
+        LOGGER.info(
+            "Created table %s.%s.%s",
+            table.project,
+            table.dataset_id,
+            table.table_id
+        )
+
+    def update_table_schema(
+            self,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            json_schema: List[dict]
+    ):
+        client = bigquery.Client(project=project_name)
+        table = client.get_table(
+            compose_full_table_name(project_name, dataset_name, table_name)
+        )
+        table.schema = get_schemafield_list_from_json_list(json_schema)
+        client.update_table(table, ["schema"])  # Make an API request.
+
+
+# one backend per local root dir, None being bigquery itself
+_BQ_BACKEND_BY_LOCAL_ROOT_DIR: Dict[Optional[str], BigQueryBackend] = {}
+_BQ_BACKEND_LOCK = threading.Lock()
+
+
+def create_bq_backend(local_bq_root_dir: Optional[str]) -> BigQueryBackend:
+    if local_bq_root_dir:
+        return LocalBigQueryBackend(local_bq_root_dir)
+    return GoogleBigQueryBackend()
+
+
+def get_bq_backend() -> BigQueryBackend:
+    local_bq_root_dir = get_local_bq_root_dir()
+    with _BQ_BACKEND_LOCK:
+        bq_backend = _BQ_BACKEND_BY_LOCAL_ROOT_DIR.get(local_bq_root_dir)
+        if bq_backend is None:
+            bq_backend = create_bq_backend(local_bq_root_dir)
+            _BQ_BACKEND_BY_LOCAL_ROOT_DIR[local_bq_root_dir] = bq_backend
+        return bq_backend
+
+
 # pylint: disable=too-many-arguments
 def load_file_into_bq(
         filename: str,
@@ -27,64 +138,18 @@ def load_file_into_bq(
     if os.path.isfile(filename) and os.path.getsize(filename) == 0:
         LOGGER.info("File %s is empty.", filename)
         return
-    client = Client(project=project_name)
-    dataset_ref = client.dataset(dataset_name)
-    table_ref = dataset_ref.table(table_name)
-    job_config = LoadJobConfig()
-    job_config.source_format = source_format
-    job_config.write_disposition = write_mode
-    job_config.autodetect = auto_detect_schema
-    if source_format is bigquery.SourceFormat.CSV:
-        job_config.skip_leading_rows = rows_to_skip
-    with open(filename, "rb") as source_file:
-
-        job = client.load_table_from_file(
-            source_file, destination=table_ref, job_config=job_config
-        )
-
-        # Waits for table cloud_data_store to complete
-        job.result()
-        LOGGER.info(
-            "Loaded %s rows into %s:%s.",
-            job.output_rows,
-            dataset_name,
-            table_name
-        )
-
-
-def create_table(
-        project_name: str,
-        dataset_name: str,
-        table_name: str,
-        json_schema: list
-):
-    client = bigquery.Client(project=project_name)
-    table_id = compose_full_table_name(
-        project_name, dataset_name, table_name
-    )
-    schema = get_schemafield_list_from_json_list(json_schema)
-    table = bigquery.Table(table_id, schema=schema)
-    table = client.create_table(table, True)  # API request
-    LOGGER.info(
-        "Created table %s.%s.%s",
-        table.project,
-        table.dataset_id,
-        table.table_id
+    get_bq_backend().load_file(
+        filename=filename,
+        project_name=project_name,
+        dataset_name=dataset_name,
+        table_name=table_name,
+        source_format=source_format,
+        write_mode=write_mode,
+        auto_detect_schema=auto_detect_schema,
+        rows_to_skip=rows_to_skip
     )
 
 
-def does_bigquery_table_exist(
-        project_name: str, dataset_name: str, table_name: str
-) -> bool:
-    table_id = compose_full_table_name(project_name, dataset_name, table_name)
-    client = bigquery.Client(project=project_name)
-    try:
-        client.get_table(table_id)
-        return True
-    except NotFound:
-        return False
-
-
 def compose_full_table_name(
         project_name: str, dataset_name: str, table_name: str
 ) -> str:
@@ -98,47 +163,6 @@ def get_schemafield_list_from_json_list(
     return schema
 
 
-def get_table_schema_field_names(
-        project_name: str,
-        dataset_name: str,
-        table_name: str
-):
-    client = bigquery.Client(project=project_name)
-
-    dataset_ref = client.dataset(dataset_name, project=project_name)
-    table_ref = dataset_ref.table(table_name)
-    try:
-        table = client.get_table(table_ref)  # API Request
-        return [field.name for field in table.schema]
-    except NotFound:
-        return []
-
-
-def extend_table_schema_with_nested_schema(
-        project_name: str, dataset_name: str,
-        table_name: str, new_fields: list
-):
-    client = bigquery.Client(project=project_name)
-    dataset_ref = client.dataset(dataset_name, project=project_name)
-    table_ref = dataset_ref.table(table_name)
-    table = client.get_table(table_ref)  # Make an API request.
-    original_schema = table.schema
-    original_schema_dict = [
-        schema_field.to_api_repr()
-        for schema_field in original_schema
-    ]
-    new_schema_dict = get_new_merged_schema(
-        original_schema_dict, new_fields
-    )
-
-    new_schema = [
-        SchemaField.from_api_repr(schema_field_dict)
-        for schema_field_dict in new_schema_dict
-    ]
-    table.schema = new_schema
-    client.update_table(table, ["schema"])  # Make an API request.
-
-
 def get_new_merged_schema(
         existing_schema: list,
         update_schema: list,
@@ -205,27 +229,25 @@ def create_or_extend_table_schema(
         gcp_project,
         dataset_name,
         table_name,
-        full_temp_file_location,
+        full_temp_file_location: Optional[str] = None,
+        json_schema: Optional[List[dict]] = None
 ):
-    schema = generate_schema_from_file(
-        full_temp_file_location
+    schema = (
+        json_schema
+        if json_schema is not None
+        else generate_schema_from_file(full_temp_file_location)
     )
 
-    if does_bigquery_table_exist(
-            gcp_project,
-            dataset_name,
-            table_name,
-    ):
-        extend_table_schema_with_nested_schema(
-            gcp_project,
-            dataset_name,
-            table_name,
-            schema
-        )
+    bq_backend = get_bq_backend()
+    existing_schema = bq_backend.get_table_schema(
+        gcp_project, dataset_name, table_name
+    )
+    if existing_schema is None:
+        bq_backend.create_table(gcp_project, dataset_name, table_name, schema)
     else:
-        create_table(
+        bq_backend.update_table_schema(
             gcp_project,
             dataset_name,
             table_name,
-            schema
+            get_new_merged_schema(existing_schema, schema)
         )
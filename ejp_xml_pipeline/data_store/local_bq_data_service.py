@@ -0,0 +1,240 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from ejp_xml_pipeline.data_store.bq_backend import BigQueryBackend
+
+LOGGER = logging.getLogger(__name__)
+
+
+# when set, bigquery tables are ndjson files below this directory
+LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME = "EJP_XML_LOCAL_BQ_ROOT_DIR"
+
+NEWLINE_DELIMITED_JSON_SOURCE_FORMAT = "NEWLINE_DELIMITED_JSON"
+
+WRITE_APPEND = "WRITE_APPEND"
+WRITE_TRUNCATE = "WRITE_TRUNCATE"
+WRITE_EMPTY = "WRITE_EMPTY"
+
+MAX_REPORTED_SCHEMA_ERRORS = 10
+
+
+def get_local_bq_root_dir() -> Optional[str]:
+    return os.getenv(LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME) or None
+
+
+def get_local_table_path(
+        root_dir: str, project_name: str, dataset_name: str, table_name: str
+) -> Path:
+    return Path(root_dir, project_name, dataset_name, table_name)
+
+
+def get_local_table_schema_path(table_path: Path) -> Path:
+    return table_path.with_name(table_path.name + ".schema.json")
+
+
+def get_local_table_data_path(table_path: Path) -> Path:
+    return table_path.with_name(table_path.name + ".ndjson")
+
+
+def get_local_table_schema(
+        root_dir: str, project_name: str, dataset_name: str, table_name: str
+) -> Optional[List[dict]]:
+    schema_path = get_local_table_schema_path(
+        get_local_table_path(root_dir, project_name, dataset_name, table_name)
+    )
+    if not schema_path.is_file():
+        return None
+    return json.loads(schema_path.read_text(encoding="UTF-8"))
+
+
+# pylint: disable=too-many-arguments
+def update_local_table_schema(
+        root_dir: str,
+        project_name: str,
+        dataset_name: str,
+        table_name: str,
+        json_schema: List[dict]
+):
+    schema_path = get_local_table_schema_path(
+        get_local_table_path(root_dir, project_name, dataset_name, table_name)
+    )
+    schema_path.parent.mkdir(parents=True, exist_ok=True)
+    schema_path.write_text(json.dumps(json_schema, indent=2), encoding="UTF-8")
+    LOGGER.info(
+        "Updated local table schema %s.%s.%s",
+        project_name,
+        dataset_name,
+        table_name
+    )
+
+
+def is_value_of_field_type(value, field_type: str) -> bool:
+    if field_type in ("RECORD", "STRUCT"):
+        return isinstance(value, dict)
+    if field_type in ("INTEGER", "INT64"):
+        return isinstance(value, int) and not isinstance(value, bool)
+    if field_type in ("FLOAT", "FLOAT64", "NUMERIC"):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if field_type in ("BOOLEAN", "BOOL"):
+        return isinstance(value, bool)
+    return isinstance(value, str)
+
+
+def get_record_schema_errors(
+        record: dict,
+        json_schema: List[dict],
+        parent_field_path: str = ""
+) -> List[str]:
+    errors = []
+    field_by_name = {field["name"].lower(): field for field in json_schema}
+    for required_field in json_schema:
+        if (
+                required_field.get("mode") == "REQUIRED"
+                and record.get(required_field["name"]) is None
+        ):
+            errors.append(
+                f"missing required field: {parent_field_path}{required_field['name']}"
+            )
+    for key, value in record.items():
+        field_path = parent_field_path + key
+        field = field_by_name.get(key.lower())
+        if field is None:
+            errors.append(f"no such field: {field_path}")
+            continue
+        if value is None:
+            continue
+        if field.get("mode") == "REPEATED":
+            if not isinstance(value, list):
+                errors.append(f"expected array: {field_path}")
+                continue
+            values = value
+        else:
+            values = [value]
+        for item in values:
+            if not is_value_of_field_type(item, field["type"]):
+                errors.append(f"expected {field['type']}: {field_path}")
+            elif isinstance(item, dict):
+                errors.extend(get_record_schema_errors(
+                    item, field.get("fields", []), field_path + "."
+                ))
+    return errors
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def local_load_file_into_table(
+        root_dir: str,
+        filename: str,
+        project_name: str,
+        dataset_name: str,
+        table_name: str,
+        source_format: str = NEWLINE_DELIMITED_JSON_SOURCE_FORMAT,
+        write_mode: str = WRITE_APPEND
+) -> int:
+    if source_format != NEWLINE_DELIMITED_JSON_SOURCE_FORMAT:
+        raise ValueError(f"unsupported local source format: {source_format}")
+    json_schema = get_local_table_schema(
+        root_dir, project_name, dataset_name, table_name
+    )
+    if json_schema is None:
+        raise ValueError(
+            f"local table not found: {project_name}.{dataset_name}.{table_name}"
+        )
+    # validate all rows first, a failed load job does not write any rows either
+    errors: List[str] = []
+    row_count = 0
+    with open(filename, "r", encoding="UTF-8") as source_file:
+        for line_number, line in enumerate(source_file, start=1):
+            if not line.strip():
+                continue
+            row_count += 1
+            errors.extend(
+                f"line {line_number}: {error}"
+                for error in get_record_schema_errors(json.loads(line), json_schema)
+            )
+            if len(errors) >= MAX_REPORTED_SCHEMA_ERRORS:
+                break
+    if errors:
+        raise ValueError(
+            f"rows do not match schema of {dataset_name}.{table_name}: "
+            + "; ".join(errors[:MAX_REPORTED_SCHEMA_ERRORS])
+        )
+    data_path = get_local_table_data_path(
+        get_local_table_path(root_dir, project_name, dataset_name, table_name)
+    )
+    if (
+            write_mode == WRITE_EMPTY
+            and data_path.is_file()
+            and data_path.stat().st_size > 0
+    ):
+        raise ValueError(f"local table is not empty: {dataset_name}.{table_name}")
+    with open(
+            data_path, "w" if write_mode == WRITE_TRUNCATE else "a", encoding="UTF-8"
+    ) as data_file, open(filename, "r", encoding="UTF-8") as source_file:
+        for line in source_file:
+            if line.strip():
+                data_file.write(line if line.endswith("\n") else line + "\n")
+    LOGGER.info(
+        "Loaded %s rows into local table %s:%s.",
+        row_count,
+        dataset_name,
+        table_name
+    )
+    return row_count
+
+
+class LocalBigQueryBackend(BigQueryBackend):
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def load_file(  # pylint: disable=too-many-arguments
+            self,
+            filename: str,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            source_format: str,
+            write_mode: str,
+            auto_detect_schema: bool = False,
+            rows_to_skip: int = 0
+    ):
+        local_load_file_into_table(
+            self.root_dir,
+            filename=filename,
+            project_name=project_name,
+            dataset_name=dataset_name,
+            table_name=table_name,
+            source_format=source_format,
+            write_mode=write_mode
+        )
+
+    def get_table_schema(
+            self, project_name: str, dataset_name: str, table_name: str
+    ) -> Optional[List[dict]]:
+        return get_local_table_schema(
+            self.root_dir, project_name, dataset_name, table_name
+        )
+
+    def create_table(
+            self,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            json_schema: List[dict]
+    ):
+        update_local_table_schema(
+            self.root_dir, project_name, dataset_name, table_name, json_schema
+        )
+
+    def update_table_schema(
+            self,
+            project_name: str,
+            dataset_name: str,
+            table_name: str,
+            json_schema: List[dict]
+    ):
+        update_local_table_schema(
+            self.root_dir, project_name, dataset_name, table_name, json_schema
+        )
@@ -0,0 +1,234 @@
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from botocore.exceptions import ClientError
+
+from ejp_xml_pipeline.data_store.s3_backend import S3Backend
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
+
+
+# when set, s3 buckets are directories below this directory
+LOCAL_S3_ROOT_DIR_ENV_VAR_NAME = "EJP_XML_LOCAL_S3_ROOT_DIR"
+
+
+def get_local_s3_root_dir() -> Optional[str]:
+    return os.getenv(LOCAL_S3_ROOT_DIR_ENV_VAR_NAME) or None
+
+
+def get_local_s3_object_path(
+        root_dir: str, bucket: str, object_key: str
+) -> Path:
+    return Path(root_dir, bucket, object_key)
+
+
+def get_no_such_key_error(bucket: str, object_key: str) -> ClientError:
+    return ClientError(
+        {
+            "Error": {
+                "Code": "NoSuchKey",
+                "Message": f"The specified key does not exist: {bucket}/{object_key}"
+            }
+        },
+        "GetObject"
+    )
+
+
+@contextmanager
+def local_s3_open_binary_read(
+        root_dir: str, bucket: str, object_key: str
+) -> Iterator[BinaryIO]:
+    object_path = get_local_s3_object_path(root_dir, bucket, object_key)
+    if not object_path.is_file():
+        raise get_no_such_key_error(bucket, object_key)
+    with open(object_path, "rb") as streaming_body:
+        yield streaming_body
+
+
+def local_upload_s3_object(
+        root_dir: str, bucket: str, object_key: str,
+        data_object: Union[str, bytes]
+) -> bool:
+    object_path = get_local_s3_object_path(root_dir, bucket, object_key)
+    object_path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data_object, str):
+        data_object = data_object.encode("utf-8")
+    object_path.write_bytes(data_object)
+    return True
+
+
+def local_upload_file_into_s3(
+        root_dir: str, bucket: str, object_key: str, full_file_path: str
+) -> bool:
+    object_path = get_local_s3_object_path(root_dir, bucket, object_key)
+    object_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(full_file_path, object_path)
+    return True
+
+
+def get_local_multipart_upload_path(root_dir: str, upload_id: str) -> Path:
+    # outside of the bucket directories, so that incomplete uploads aren't listed
+    return Path(root_dir, '.multipart-uploads', upload_id)
+
+
+def local_create_multipart_upload(
+        root_dir: str, bucket: str, object_key: str  # pylint: disable=unused-argument
+) -> str:
+    upload_id = uuid.uuid4().hex
+    get_local_multipart_upload_path(root_dir, upload_id).mkdir(parents=True)
+    return upload_id
+
+
+def local_upload_part(  # pylint: disable=too-many-arguments
+        root_dir: str, bucket: str, object_key: str,  # pylint: disable=unused-argument
+        upload_id: str, part_number: int, data: bytes
+) -> str:
+    part_path = get_local_multipart_upload_path(root_dir, upload_id) / str(part_number)
+    part_path.write_bytes(data)
+    return f'"{part_number:x}-{len(data):x}"'
+
+
+def local_complete_multipart_upload(
+        root_dir: str, bucket: str, object_key: str,
+        upload_id: str, parts: List[dict]
+):
+    upload_path = get_local_multipart_upload_path(root_dir, upload_id)
+    object_path = get_local_s3_object_path(root_dir, bucket, object_key)
+    object_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(object_path, 'wb') as object_file:
+        for part in parts:
+            with open(upload_path / str(part['PartNumber']), 'rb') as part_file:
+                shutil.copyfileobj(part_file, object_file)
+    shutil.rmtree(upload_path)
+
+
+def local_abort_multipart_upload(
+        root_dir: str, bucket: str, object_key: str,  # pylint: disable=unused-argument
+        upload_id: str
+):
+    shutil.rmtree(
+        get_local_multipart_upload_path(root_dir, upload_id), ignore_errors=True
+    )
+
+
+def local_delete_s3_objects(
+        root_dir: str, bucket: str, keys: List[str]
+):
+    for key in keys:
+        get_local_s3_object_path(root_dir, bucket, key).unlink(missing_ok=True)
+
+
+def get_local_s3_object_meta(bucket_path: Path, object_path: Path) -> dict:
+    stat_result = object_path.stat()
+    return {
+        named_literals.S3_FILE_METADATA_NAME_KEY: (
+            object_path.relative_to(bucket_path).as_posix()
+        ),
+        named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY: datetime.fromtimestamp(
+            stat_result.st_mtime, tz=timezone.utc
+        ),
+        named_literals.S3_FILE_METADATA_ETAG_KEY: (
+            f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+        ),
+        named_literals.S3_FILE_METADATA_SIZE_KEY: stat_result.st_size
+    }
+
+
+def iter_local_s3_object_metas(
+        root_dir: str, bucket: str, prefix: str = ""
+) -> Iterable[dict]:
+    bucket_path = Path(root_dir, bucket)
+    # same order as list_objects_v2, which sorts by key
+    object_keys_and_paths = sorted(
+        (object_path.relative_to(bucket_path).as_posix(), object_path)
+        for object_path in bucket_path.rglob("*")
+        if object_path.is_file()
+    )
+    for object_key, object_path in object_keys_and_paths:
+        if object_key.startswith(prefix):
+            yield get_local_s3_object_meta(bucket_path, object_path)
+
+
+class LocalS3Backend(S3Backend):
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def open_binary_read(self, bucket: str, object_key: str):
+        return local_s3_open_binary_read(self.root_dir, bucket, object_key)
+
+    def upload_object(
+            self, bucket: str, object_key: str, data_object: Union[str, bytes]
+    ) -> bool:
+        return local_upload_s3_object(self.root_dir, bucket, object_key, data_object)
+
+    def upload_file(self, bucket: str, object_key: str, full_file_path: str) -> bool:
+        return local_upload_file_into_s3(
+            self.root_dir, bucket, object_key, full_file_path
+        )
+
+    def delete_objects(self, bucket: str, keys: List[str]):
+        local_delete_s3_objects(self.root_dir, bucket, keys)
+
+    def iter_object_metas(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            prefix: str = "",
+            start_after: Optional[str] = None,
+            delimiter: str = "",
+            page_size: Optional[int] = None,
+            max_items: Optional[int] = None
+    ) -> Iterable[dict]:
+        if delimiter:
+            raise ValueError(f"unsupported local listing delimiter: {delimiter}")
+        s3_object_metas: Iterable[dict] = (
+            s3_object_meta
+            for s3_object_meta in iter_local_s3_object_metas(self.root_dir, bucket, prefix)
+            if not start_after
+            or s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY] > start_after
+        )
+        if max_items is not None:
+            s3_object_metas = islice(s3_object_metas, max_items)
+        yield from s3_object_metas
+
+    def list_object_metas(
+            self,
+            bucket: str,
+            prefix: str,
+            start_after: Optional[str],
+            max_keys: int
+    ) -> Tuple[List[dict], bool]:
+        s3_object_metas = list(self.iter_object_metas(
+            bucket, prefix=prefix, start_after=start_after, max_items=max_keys + 1
+        ))
+        return s3_object_metas[:max_keys], len(s3_object_metas) > max_keys
+
+    def create_multipart_upload(self, bucket: str, object_key: str) -> str:
+        return local_create_multipart_upload(self.root_dir, bucket, object_key)
+
+    def upload_part(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            object_key: str,
+            upload_id: str,
+            part_number: int,
+            data: bytes
+    ) -> dict:
+        etag = local_upload_part(
+            self.root_dir, bucket, object_key, upload_id, part_number, data
+        )
+        return {"PartNumber": part_number, "ETag": etag}
+
+    def complete_multipart_upload(
+            self, bucket: str, object_key: str, upload_id: str, parts: List[dict]
+    ):
+        local_complete_multipart_upload(
+            self.root_dir, bucket, object_key, upload_id, parts
+        )
+
+    def abort_multipart_upload(self, bucket: str, object_key: str, upload_id: str):
+        local_abort_multipart_upload(self.root_dir, bucket, object_key, upload_id)
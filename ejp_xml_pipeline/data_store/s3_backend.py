@@ -0,0 +1,74 @@
+from abc import ABCMeta, abstractmethod
+from typing import BinaryIO, ContextManager, Iterable, List, Optional, Tuple, Union
+
+
+class S3Backend(metaclass=ABCMeta):
+    # the s3 operations used by the pipeline, selected once per configuration
+
+    @abstractmethod
+    def open_binary_read(
+            self, bucket: str, object_key: str
+    ) -> ContextManager[BinaryIO]:
+        pass
+
+    @abstractmethod
+    def upload_object(
+            self, bucket: str, object_key: str, data_object: Union[str, bytes]
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    def upload_file(self, bucket: str, object_key: str, full_file_path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete_objects(self, bucket: str, keys: List[str]):
+        pass
+
+    @abstractmethod
+    def iter_object_metas(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            prefix: str = "",
+            start_after: Optional[str] = None,
+            delimiter: str = "",
+            page_size: Optional[int] = None,
+            max_items: Optional[int] = None
+    ) -> Iterable[dict]:
+        pass
+
+    @abstractmethod
+    def list_object_metas(
+            self,
+            bucket: str,
+            prefix: str,
+            start_after: Optional[str],
+            max_keys: int
+    ) -> Tuple[List[dict], bool]:
+        # returns a single page of object metas and whether it was truncated
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, bucket: str, object_key: str) -> str:
+        pass
+
+    @abstractmethod
+    def upload_part(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            object_key: str,
+            upload_id: str,
+            part_number: int,
+            data: bytes
+    ) -> dict:
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(
+            self, bucket: str, object_key: str, upload_id: str, parts: List[dict]
+    ):
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, bucket: str, object_key: str, upload_id: str):
+        pass
@@ -1,19 +1,169 @@
 import json
 import logging
+import threading
 from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import boto3
 from botocore.exceptions import ClientError
 
+from ejp_xml_pipeline.data_store.local_s3_data_service import (
+    LocalS3Backend,
+    get_local_s3_root_dir
+)
+from ejp_xml_pipeline.data_store.s3_backend import S3Backend
+from ejp_xml_pipeline.utils.s3_key_partition import (
+    S3KeyPartition,
+    get_list_objects_partition_kwargs
+)
+
+
+def create_default_s3_client():
+    return boto3.client("s3")
+
+
+class Boto3S3Backend(S3Backend):
+    def __init__(self, s3_client_factory: Callable[[], Any] = create_default_s3_client):
+        self._s3_client_factory = s3_client_factory
+        self._s3_client = None
+        # creating clients isn't thread-safe, using them is
+        self._s3_client_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        # created once and reused, e.g. by the multipart upload threads
+        if self._s3_client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = self._s3_client_factory()
+        return self._s3_client
+
+    @contextmanager
+    def open_binary_read(self, bucket: str, object_key: str):
+        response = self.s3_client.get_object(Bucket=bucket, Key=object_key)
+        streaming_body = response["Body"]
+        try:
+            yield streaming_body
+        finally:
+            streaming_body.close()
+
+    def upload_object(
+            self, bucket: str, object_key: str, data_object: Union[str, bytes]
+    ) -> bool:
+        self.s3_client.put_object(Body=data_object, Bucket=bucket, Key=object_key)
+        return True
+
+    def upload_file(self, bucket: str, object_key: str, full_file_path: str) -> bool:
+        try:
+            self.s3_client.upload_file(full_file_path, bucket, object_key)
+        except ClientError as err:
+            logging.error(err)
+            return False
+        return True
+
+    def delete_objects(self, bucket: str, keys: List[str]):
+        for key in keys:
+            self.s3_client.delete_object(
+                Bucket=bucket,
+                Key=key
+            )
+
+    def iter_object_metas(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            prefix: str = "",
+            start_after: Optional[str] = None,
+            delimiter: str = "",
+            page_size: Optional[int] = None,
+            max_items: Optional[int] = None
+    ) -> Iterable[dict]:
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+                Bucket=bucket,
+                Delimiter=delimiter,
+                PaginationConfig={
+                    "PageSize": page_size,
+                    "MaxItems": max_items,
+                },
+                **get_list_objects_partition_kwargs(
+                    S3KeyPartition(prefix, start_after)
+                )
+        ):
+            yield from page.get("Contents", [])
+
+    def list_object_metas(
+            self,
+            bucket: str,
+            prefix: str,
+            start_after: Optional[str],
+            max_keys: int
+    ) -> Tuple[List[dict], bool]:
+        response = self.s3_client.list_objects_v2(
+            Bucket=bucket,
+            MaxKeys=max_keys,
+            **get_list_objects_partition_kwargs(S3KeyPartition(prefix, start_after))
+        )
+        return response.get("Contents", []), bool(response.get("IsTruncated"))
+
+    def create_multipart_upload(self, bucket: str, object_key: str) -> str:
+        response = self.s3_client.create_multipart_upload(
+            Bucket=bucket, Key=object_key
+        )
+        return response["UploadId"]
+
+    def upload_part(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            object_key: str,
+            upload_id: str,
+            part_number: int,
+            data: bytes
+    ) -> dict:
+        etag = self.s3_client.upload_part(
+            Body=data, Bucket=bucket, Key=object_key,
+            UploadId=upload_id, PartNumber=part_number
+        )["ETag"]
+        return {"PartNumber": part_number, "ETag": etag}
+
+    def complete_multipart_upload(
+            self, bucket: str, object_key: str, upload_id: str, parts: List[dict]
+    ):
+        self.s3_client.complete_multipart_upload(
+            Bucket=bucket, Key=object_key, UploadId=upload_id,
+            MultipartUpload={"Parts": parts}
+        )
+
+    def abort_multipart_upload(self, bucket: str, object_key: str, upload_id: str):
+        self.s3_client.abort_multipart_upload(
+            Bucket=bucket, Key=object_key, UploadId=upload_id
+        )
+
+
+# one backend per local root dir, None being s3 itself
+_S3_BACKEND_BY_LOCAL_ROOT_DIR: Dict[Optional[str], S3Backend] = {}
+_S3_BACKEND_LOCK = threading.Lock()
+
+
+def create_s3_backend(
+        local_s3_root_dir: Optional[str],
+        s3_client_factory: Callable[[], Any] = create_default_s3_client
+) -> S3Backend:
+    if local_s3_root_dir:
+        return LocalS3Backend(local_s3_root_dir)
+    return Boto3S3Backend(s3_client_factory)
+
+
+def get_s3_backend() -> S3Backend:
+    local_s3_root_dir = get_local_s3_root_dir()
+    with _S3_BACKEND_LOCK:
+        s3_backend = _S3_BACKEND_BY_LOCAL_ROOT_DIR.get(local_s3_root_dir)
+        if s3_backend is None:
+            s3_backend = create_s3_backend(local_s3_root_dir)
+            _S3_BACKEND_BY_LOCAL_ROOT_DIR[local_s3_root_dir] = s3_backend
+        return s3_backend
+
 
-@contextmanager
 def s3_open_binary_read(bucket: str, object_key: str):
-    s3_client = boto3.client("s3")
-    response = s3_client.get_object(Bucket=bucket, Key=object_key)
-    streaming_body = response["Body"]
-    try:
-        yield streaming_body
-    finally:
-        streaming_body.close()
+    return get_s3_backend().open_binary_read(bucket, object_key)
 
 
 def download_s3_json_object(bucket: str, object_key: str) -> dict:
@@ -24,37 +174,57 @@ def download_s3_json_object(bucket: str, object_key: str) -> dict:
 
 
 def upload_s3_object(bucket: str, object_key: str, data_object) -> bool:
-    s3_client = boto3.client("s3")
-    s3_client.put_object(Body=data_object, Bucket=bucket, Key=object_key)
-    return True
+    return get_s3_backend().upload_object(bucket, object_key, data_object)
 
 
 def upload_file_into_s3(bucket: str, object_key: str, full_file_path: str) -> bool:
-    s3_client = boto3.client("s3")
-    try:
-        s3_client.upload_file(full_file_path, bucket, object_key)
-    except ClientError as err:
-        logging.error(err)
-        return False
-    return True
+    return get_s3_backend().upload_file(bucket, object_key, full_file_path)
 
 
-def download_s3_object_as_string(
+def create_s3_multipart_upload(bucket: str, object_key: str) -> str:
+    return get_s3_backend().create_multipart_upload(bucket, object_key)
+
+
+def upload_s3_multipart_part(
+        bucket: str, object_key: str, upload_id: str, part_number: int, data: bytes
+) -> dict:
+    return get_s3_backend().upload_part(
+        bucket, object_key, upload_id, part_number, data
+    )
+
+
+def complete_s3_multipart_upload(
+        bucket: str, object_key: str, upload_id: str, parts: List[dict]
+):
+    get_s3_backend().complete_multipart_upload(bucket, object_key, upload_id, parts)
+
+
+def abort_s3_multipart_upload(bucket: str, object_key: str, upload_id: str):
+    get_s3_backend().abort_multipart_upload(bucket, object_key, upload_id)
+
+
+def download_s3_object_as_bytes(
         bucket: str, object_key: str
-) -> str:
+) -> bytes:
     with s3_open_binary_read(
             bucket=bucket, object_key=object_key
     ) as streaming_body:
-        file_content = streaming_body.read()
-        return file_content.decode("utf-8")
+        return streaming_body.read()
+
+
+def download_s3_object_as_string(
+        bucket: str, object_key: str
+) -> str:
+    return download_s3_object_as_bytes(
+        bucket=bucket, object_key=object_key
+    ).decode("utf-8")
 
 
 def delete_s3_objects(bucket, keys):
-    s3_client = boto3.client('s3')
     if not isinstance(keys, list):
         keys = [keys]
-    for key in keys:
-        s3_client.delete_object(
-            Bucket=bucket,
-            Key=key
-        )
+    get_s3_backend().delete_objects(bucket, keys)
+
+
+def iter_s3_object_metas(bucket: str, prefix: str = "") -> Iterable[dict]:
+    return get_s3_backend().iter_object_metas(bucket, prefix)
@@ -0,0 +1,206 @@
+import io
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from ejp_xml_pipeline.data_store.s3_data_service import (
+    abort_s3_multipart_upload,
+    complete_s3_multipart_upload,
+    create_s3_multipart_upload,
+    upload_s3_multipart_part,
+    upload_s3_object
+)
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class UploadedPart(NamedTuple):
+    part: dict
+    size: int
+    upload_seconds: float
+
+
+def upload_part(
+        bucket: str,
+        object_key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes
+) -> UploadedPart:
+    start_time = time.perf_counter()
+    part = upload_s3_multipart_part(bucket, object_key, upload_id, part_number, data)
+    return UploadedPart(
+        part=part,
+        size=len(data),
+        upload_seconds=time.perf_counter() - start_time
+    )
+
+
+class S3MultipartUploader:
+    # uploads the parts of all sinks in background threads,
+    # parts waiting for a thread are held in memory and are bounded
+    def __init__(
+            self,
+            max_concurrency: int,
+            max_pending_part_count: Optional[int] = None
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix='s3-multipart-upload'
+        )
+        self._pending_part_semaphore = threading.BoundedSemaphore(
+            max_pending_part_count or max_concurrency
+        )
+
+    def __enter__(self) -> 'S3MultipartUploader':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def _release_pending_part(self, _: 'Future[UploadedPart]'):
+        # also called for cancelled parts
+        self._pending_part_semaphore.release()
+
+    def submit_part(  # pylint: disable=too-many-arguments
+            self,
+            bucket: str,
+            object_key: str,
+            upload_id: str,
+            part_number: int,
+            data: bytes
+    ) -> 'Future[UploadedPart]':
+        # blocks while the maximum number of parts are waiting to be uploaded
+        self._pending_part_semaphore.acquire()  # pylint: disable=consider-using-with
+        try:
+            part_future = self._executor.submit(
+                upload_part, bucket, object_key, upload_id, part_number, data
+            )
+        except BaseException:
+            self._pending_part_semaphore.release()
+            raise
+        part_future.add_done_callback(self._release_pending_part)
+        return part_future
+
+
+class S3MultipartUploadSink:  # pylint: disable=too-many-instance-attributes
+    # a text writer whose content is uploaded in parts while it is being written,
+    # s3 requires parts of at least 5 MiB, except for the last part
+    def __init__(
+            self,
+            s3_multipart_uploader: S3MultipartUploader,
+            bucket: str,
+            object_key: str,
+            part_size: int
+    ):
+        self.s3_multipart_uploader = s3_multipart_uploader
+        self.bucket = bucket
+        self.object_key = object_key
+        self.part_size = part_size
+        self.upload_id: Optional[str] = None
+        self.uploaded_parts: List[UploadedPart] = []
+        self.wait_seconds = 0.0
+        self._buffer = io.BytesIO()
+        self._part_futures: List['Future[UploadedPart]'] = []
+        self._is_closed = False
+
+    @property
+    def uploaded_bytes(self) -> int:
+        return sum(uploaded_part.size for uploaded_part in self.uploaded_parts)
+
+    @property
+    def upload_seconds(self) -> float:
+        return sum(uploaded_part.upload_seconds for uploaded_part in self.uploaded_parts)
+
+    def write(self, text: str) -> int:
+        self._buffer.write(text.encode('utf-8'))
+        if self._buffer.tell() >= self.part_size:
+            self._submit_buffered_part()
+        return len(text)
+
+    def flush(self):
+        # parts are only uploaded once they reach the part size
+        pass
+
+    def _raise_failed_part_error(self):
+        for part_future in self._part_futures:
+            if part_future.done() and part_future.exception() is not None:
+                part_future.result()
+
+    def _submit_buffered_part(self):
+        self._raise_failed_part_error()
+        data = self._buffer.getvalue()
+        self._buffer = io.BytesIO()
+        if self.upload_id is None:
+            self.upload_id = create_s3_multipart_upload(self.bucket, self.object_key)
+        start_time = time.perf_counter()
+        self._part_futures.append(self.s3_multipart_uploader.submit_part(
+            self.bucket,
+            self.object_key,
+            self.upload_id,
+            len(self._part_futures) + 1,
+            data
+        ))
+        self.wait_seconds += time.perf_counter() - start_time
+
+    def _wait_for_parts(self) -> List[UploadedPart]:
+        start_time = time.perf_counter()
+        try:
+            return [part_future.result() for part_future in self._part_futures]
+        finally:
+            self.wait_seconds += time.perf_counter() - start_time
+
+    def close(self) -> bool:
+        # returns whether an object was uploaded, nothing is uploaded if nothing was written
+        if self._is_closed:
+            return bool(self.uploaded_parts)
+        try:
+            if self.upload_id is None:
+                data = self._buffer.getvalue()
+                self._buffer = io.BytesIO()
+                if data:
+                    start_time = time.perf_counter()
+                    upload_s3_object(self.bucket, self.object_key, data)
+                    self.uploaded_parts = [UploadedPart(
+                        part={'PartNumber': 1},
+                        size=len(data),
+                        upload_seconds=time.perf_counter() - start_time
+                    )]
+            else:
+                if self._buffer.tell():
+                    self._submit_buffered_part()
+                uploaded_parts = self._wait_for_parts()
+                complete_s3_multipart_upload(
+                    self.bucket,
+                    self.object_key,
+                    self.upload_id,
+                    [uploaded_part.part for uploaded_part in uploaded_parts]
+                )
+                self.uploaded_parts = uploaded_parts
+        except BaseException:
+            self.abort()
+            raise
+        self._is_closed = True
+        return bool(self.uploaded_parts)
+
+    def abort(self):
+        if self._is_closed:
+            return
+        self._is_closed = True
+        self._buffer = io.BytesIO()
+        if self.upload_id is None:
+            return
+        for part_future in self._part_futures:
+            part_future.cancel()
+        # parts still being uploaded would otherwise outlive the aborted upload
+        for part_future in self._part_futures:
+            if not part_future.cancelled():
+                part_future.exception()
+        LOGGER.info('aborting multipart upload: %s/%s', self.bucket, self.object_key)
+        abort_s3_multipart_upload(self.bucket, self.object_key, self.upload_id)
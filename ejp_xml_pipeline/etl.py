@@ -1,8 +1,7 @@
 import os
 import io
 import logging
-from typing import List
-import json
+from typing import IO, Dict, Iterator, List, Optional, Union
 
 from contextlib import contextmanager
 from contextlib import ExitStack
@@ -16,11 +15,35 @@ from ejp_xml_pipeline.data_store.s3_data_service import (
     delete_s3_objects,
     upload_file_into_s3
 )
+from ejp_xml_pipeline.data_store.s3_multipart_upload import (
+    S3MultipartUploader,
+    S3MultipartUploadSink
+)
+from ejp_xml_pipeline.member_digest_index import (
+    MemberDigestIndex,
+    get_member_digest
+)
+from ejp_xml_pipeline.member_resource_report import MemberResourceReport
 from ejp_xml_pipeline.transform_zip_xml.ejp_zip import (
     iter_parse_xml_in_zip,
 )
-from ejp_xml_pipeline.transform_json import remove_key_with_null_value
+from ejp_xml_pipeline.transform_json import ProvenanceJsonEncoder
+from ejp_xml_pipeline.etl_metrics import (
+    EtlCounterNames,
+    EtlMetrics,
+    EtlStageNames,
+    get_entity_counter_name
+)
+from ejp_xml_pipeline.etl_state import (
+    delete_stored_zip_progress,
+    get_stored_member_digest_index,
+    get_stored_zip_progress,
+    update_stored_member_digest_index,
+    update_stored_etl_metrics,
+    update_stored_zip_progress
+)
 from ejp_xml_pipeline.dag_pipeline_config.xml_config import (
+    EntityDBLoadConfig,
     eJPXmlDataConfig
 )
 from ejp_xml_pipeline.data_store.bq_data_service import (
@@ -29,77 +52,405 @@ from ejp_xml_pipeline.data_store.bq_data_service import (
 from ejp_xml_pipeline.utils import (
     NamedDataPipelineLiterals as named_literals,
 )
+from ejp_xml_pipeline.utils.xml_transform_util.xml_parser_pool import (
+    get_xml_parser_pool
+)
+from ejp_xml_pipeline.zip_progress import ZipProgress
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+class EtlRunContext:
+    def __init__(
+            self,
+            ejp_xml_data_config: eJPXmlDataConfig,
+            file_directory: str,
+            etl_metrics: Optional[EtlMetrics] = None
+    ):
+        self.ejp_xml_data_config = ejp_xml_data_config
+        self.file_directory = file_directory
+        self.etl_metrics = etl_metrics or EtlMetrics()
+
+    def get_entity_file_location(
+            self,
+            ent_db_load_config: EntityDBLoadConfig
+    ) -> str:
+        return ent_db_load_config.get_full_file_location(self.file_directory)
+
+
 def write_entities_in_parsed_doc_to_file(
         parsed_document_entities,
-        opened_file_for_entity_type
+        opened_file_for_entity_type,
+        etl_metrics: Optional[EtlMetrics] = None
 ):
-
-    for entity in parsed_document_entities:
-        writer = opened_file_for_entity_type.get(
-            type(entity)
-        )
-        writer.write(json.dumps(
-            remove_key_with_null_value(entity.data)
-        ))
-        writer.write("\n")
+    if etl_metrics is None:
+        etl_metrics = EtlMetrics()
+    provenance_json_encoder = ProvenanceJsonEncoder()
+    with etl_metrics.timer(EtlStageNames.JSON_ENCODE):
+        for entity in parsed_document_entities:
+            writer = opened_file_for_entity_type.get(
+                type(entity)
+            )
+            json_str = provenance_json_encoder.get_record_json(entity.record)
+            writer.write(json_str)
+            writer.write("\n")
+            etl_metrics.increment(get_entity_counter_name(type(entity)))
+            etl_metrics.increment(
+                EtlCounterNames.JSON_BYTES, len(json_str) + 1
+            )
 
 
 @contextmanager
 def get_opened_temp_file_for_entity_types(
-        ejp_xml_data_config: eJPXmlDataConfig,
-        file_dir: str
+        run_context: EtlRunContext
 ):
     with ExitStack() as stack:
-        for ent_db_load_config \
-                in ejp_xml_data_config.entity_type_mapping.values():
-            ent_db_load_config.set_directory(file_dir)
         opened_files = {
             ent_type: stack.enter_context(
-                open(ent_conf.get_full_file_location(), "w", encoding="UTF-8")
+                open(
+                    run_context.get_entity_file_location(ent_conf),
+                    "w",
+                    encoding="UTF-8"
+                )
             )
             for ent_type, ent_conf
-            in ejp_xml_data_config.entity_type_mapping.items()
+            in run_context.ejp_xml_data_config.entity_type_mapping.items()
         }
         yield opened_files
 
 
+class TempFileEntityOutput:
+    # writes the entities to local files, uploaded once the part is complete
+    def __init__(
+            self,
+            run_context: EtlRunContext,
+            opened_file_for_entity_type: Dict[type, IO[str]]
+    ):
+        self.run_context = run_context
+        self.writer_by_entity_type = opened_file_for_entity_type
+        self.object_key: Optional[str] = None
+
+    def start_part(self, object_key: str):
+        self.object_key = object_key
+
+    def complete_part(self) -> Dict[str, str]:
+        assert self.object_key is not None
+        for writer in self.writer_by_entity_type.values():
+            writer.flush()
+        uploaded_object_key_by_entity_name = load_entities_file_to_s3(
+            self.run_context, self.object_key
+        )
+        for writer in self.writer_by_entity_type.values():
+            writer.seek(0)
+            writer.truncate()
+        return uploaded_object_key_by_entity_name
+
+    def abort_part(self):
+        pass
+
+
+class StreamingEntityOutput:
+    # streams the entities to s3 as multipart uploads while parsing continues
+    def __init__(
+            self,
+            run_context: EtlRunContext,
+            s3_multipart_uploader: S3MultipartUploader
+    ):
+        self.run_context = run_context
+        self.s3_multipart_uploader = s3_multipart_uploader
+        # updated in place, the same dict is passed to the entity writer
+        self.writer_by_entity_type: Dict[type, S3MultipartUploadSink] = {}
+
+    def start_part(self, object_key: str):
+        ejp_xml_data_config = self.run_context.ejp_xml_data_config
+        self.writer_by_entity_type.clear()
+        self.writer_by_entity_type.update({
+            ent_type: S3MultipartUploadSink(
+                self.s3_multipart_uploader,
+                bucket=ejp_xml_data_config.temp_file_s3_bucket,
+                object_key=get_temp_s3_object_name(
+                    ent_conf.s3_object_prefix, object_key
+                ),
+                part_size=ejp_xml_data_config.multipart_upload_part_size
+            )
+            for ent_type, ent_conf
+            in ejp_xml_data_config.entity_type_mapping.items()
+        })
+
+    def complete_part(self) -> Dict[str, str]:
+        ejp_xml_data_config = self.run_context.ejp_xml_data_config
+        etl_metrics = self.run_context.etl_metrics
+        uploaded_object_key_by_entity_name = {}
+        try:
+            for ent_type, ent_conf in ejp_xml_data_config.entity_type_mapping.items():
+                sink = self.writer_by_entity_type[ent_type]
+                is_uploaded = sink.close()
+                etl_metrics.add_duration(EtlStageNames.S3_UPLOAD_WAIT, sink.wait_seconds)
+                if is_uploaded:
+                    etl_metrics.add_duration(EtlStageNames.S3_UPLOAD, sink.upload_seconds)
+                    etl_metrics.increment(
+                        EtlCounterNames.UPLOADED_BYTES, sink.uploaded_bytes
+                    )
+                    etl_metrics.increment(EtlCounterNames.UPLOADED_FILES)
+                    etl_metrics.increment(
+                        EtlCounterNames.UPLOADED_PARTS, len(sink.uploaded_parts)
+                    )
+                    uploaded_object_key_by_entity_name[ent_conf.file_name] = (
+                        sink.object_key
+                    )
+        except BaseException:
+            self.abort_part()
+            raise
+        return uploaded_object_key_by_entity_name
+
+    def abort_part(self):
+        for sink in self.writer_by_entity_type.values():
+            sink.abort()
+
+
+EntityOutput = Union[TempFileEntityOutput, StreamingEntityOutput]
+
+
+@contextmanager
+def get_entity_output(run_context: EtlRunContext) -> Iterator[EntityOutput]:
+    max_concurrency = run_context.ejp_xml_data_config.multipart_upload_max_concurrency
+    if max_concurrency:
+        with S3MultipartUploader(max_concurrency) as s3_multipart_uploader:
+            yield StreamingEntityOutput(run_context, s3_multipart_uploader)
+        return
+    with get_opened_temp_file_for_entity_types(
+            run_context
+    ) as opened_file_for_entity_type:
+        yield TempFileEntityOutput(run_context, opened_file_for_entity_type)
+
+
+def get_part_object_name(object_key: str, part_number: int) -> str:
+    return f'{object_key}.part-{part_number:05d}'
+
+
+def get_resumable_zip_progress(
+        ejp_xml_data_config: eJPXmlDataConfig,
+        object_key: str,
+        zip_digest: str
+) -> ZipProgress:
+    zip_progress = get_stored_zip_progress(ejp_xml_data_config, object_key)
+    if zip_progress is None:
+        return ZipProgress(zip_digest)
+    if zip_progress.zip_digest != zip_digest:
+        LOGGER.info('zip changed since its last checkpoint, restarting: %s', object_key)
+        if zip_progress.uploaded_object_keys:
+            delete_s3_objects(
+                ejp_xml_data_config.temp_file_s3_bucket,
+                zip_progress.uploaded_object_keys
+            )
+        return ZipProgress(zip_digest)
+    LOGGER.info(
+        'resuming %s after %d members (%d parts)',
+        object_key, zip_progress.completed_member_count, zip_progress.part_count
+    )
+    return zip_progress
+
+
+class ZipCheckpointer:
+    # uploads the entities of completed members as numbered parts,
+    # a retry then resumes with the next member
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            run_context: EtlRunContext,
+            object_key: str,
+            zip_progress: ZipProgress,
+            entity_output: EntityOutput,
+            member_digest_index: Optional[MemberDigestIndex] = None
+    ):
+        self.run_context = run_context
+        self.object_key = object_key
+        self.zip_progress = zip_progress
+        self.entity_output = entity_output
+        self.member_digest_index = member_digest_index
+        self.checkpoint_member_count = (
+            run_context.ejp_xml_data_config.zip_checkpoint_member_count
+        )
+        self.completed_member_count = zip_progress.completed_member_count
+
+    @property
+    def part_object_key(self) -> str:
+        return get_part_object_name(self.object_key, self.zip_progress.next_part_number)
+
+    def on_member_completed(self, completed_member_count: int):
+        self.completed_member_count = completed_member_count
+        if (
+                completed_member_count - self.zip_progress.completed_member_count
+                >= self.checkpoint_member_count
+        ):
+            self.checkpoint()
+
+    def checkpoint(self):
+        ejp_xml_data_config = self.run_context.ejp_xml_data_config
+        uploaded_object_key_by_entity_name = self.entity_output.complete_part()
+        self.zip_progress.add_part(
+            self.completed_member_count, uploaded_object_key_by_entity_name
+        )
+        update_stored_zip_progress(
+            self.zip_progress, ejp_xml_data_config, self.object_key
+        )
+        # only stored after the progress, otherwise a retry would skip members
+        # of a part that may not have been uploaded
+        if self.member_digest_index is not None:
+            update_stored_member_digest_index(
+                self.member_digest_index, ejp_xml_data_config
+            )
+        self.run_context.etl_metrics.increment(EtlCounterNames.CHECKPOINTS)
+        self.entity_output.start_part(self.part_object_key)
+
+    def finish(self):
+        if self.completed_member_count > self.zip_progress.completed_member_count:
+            self.checkpoint()
+
+
+def is_zip_checkpoint_enabled(ejp_xml_data_config: eJPXmlDataConfig) -> bool:
+    return bool(
+        ejp_xml_data_config.zip_checkpoint_member_count
+        and ejp_xml_data_config.zip_progress_object_prefix
+    )
+
+
 def etl_ejp_xml_zip(
         ejp_xml_data_config: eJPXmlDataConfig, object_key: str,
-):
-    with TemporaryDirectory() as file_dir:
-        with get_opened_temp_file_for_entity_types(
-                ejp_xml_data_config, file_dir
-        ) as temp_opened_file_for_entity_type:
-            with s3_open_binary_read(
-                    bucket=ejp_xml_data_config.s3_bucket,
-                    object_key=object_key
-            ) as streaming_body:
-                with io.BytesIO(streaming_body.read()) as zip_buffer:
-                    zip_buffer.seek(0)
-                    with ZipFile(zip_buffer, mode='r') as zip_file:
-                        parsed_documents = (
-                            iter_parse_xml_in_zip(
-                                zip_file,
-                                zip_filename=object_key,
-                                xml_filename_exclusion_regex_pattern=(
-                                    ejp_xml_data_config.xml_filename_exclusion_regex_pattern
-                                )
-                            )
-                        )
-                        for parsed_document in parsed_documents:
-                            write_entities_in_parsed_doc_to_file(
-                                parsed_document.get_entities(),
-                                temp_opened_file_for_entity_type
-                            )
-        load_entities_file_to_s3(
-            ejp_xml_data_config,
-            object_key
+) -> Dict[str, List[str]]:
+    member_resource_report = MemberResourceReport(
+        top_n=ejp_xml_data_config.member_resource_report_top_n,
+        trace_memory=ejp_xml_data_config.member_resource_report_trace_memory
+    )
+    etl_metrics = EtlMetrics(
+        object_key, member_resource_report=member_resource_report
+    )
+    member_resource_report.start()
+    try:
+        uploaded_object_keys_by_entity_name = etl_ejp_xml_zip_with_metrics(
+            ejp_xml_data_config, object_key, etl_metrics
         )
+    finally:
+        member_resource_report.stop()
+    etl_metrics.log_summary()
+    update_stored_etl_metrics(etl_metrics, ejp_xml_data_config, object_key)
+    return uploaded_object_keys_by_entity_name
+
+
+def write_entities_in_zip(
+        run_context: EtlRunContext,
+        object_key: str,
+        zip_bytes: bytes,
+        entity_output: EntityOutput,
+        member_digest_index: Optional[MemberDigestIndex] = None,
+        zip_checkpointer: Optional[ZipCheckpointer] = None
+):  # pylint: disable=too-many-arguments
+    ejp_xml_data_config = run_context.ejp_xml_data_config
+    etl_metrics = run_context.etl_metrics
+    with io.BytesIO(zip_bytes) as zip_buffer:
+        zip_buffer.seek(0)
+        with ZipFile(zip_buffer, mode='r') as zip_file:
+            parsed_documents = iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=object_key,
+                xml_filename_exclusion_regex_pattern=(
+                    ejp_xml_data_config.xml_filename_exclusion_regex_pattern
+                ),
+                member_digest_index=member_digest_index,
+                etl_metrics=etl_metrics,
+                member_resource_report=etl_metrics.member_resource_report,
+                xml_parser_pool=get_xml_parser_pool(
+                    ejp_xml_data_config.xml_parser_options
+                ),
+                read_ahead_queue_size=ejp_xml_data_config.zip_read_ahead_queue_size,
+                start_member_index=(
+                    zip_checkpointer.completed_member_count
+                    if zip_checkpointer is not None
+                    else 0
+                ),
+                on_member_completed=(
+                    zip_checkpointer.on_member_completed
+                    if zip_checkpointer is not None
+                    else None
+                )
+            )
+            for parsed_document in parsed_documents:
+                write_entities_in_parsed_doc_to_file(
+                    parsed_document.get_entities(),
+                    entity_output.writer_by_entity_type,
+                    etl_metrics=etl_metrics
+                )
+
+
+def etl_ejp_xml_zip_with_metrics(
+        ejp_xml_data_config: eJPXmlDataConfig,
+        object_key: str,
+        etl_metrics: EtlMetrics
+) -> Dict[str, List[str]]:
+    with etl_metrics.timer(EtlStageNames.TOTAL):
+        member_digest_index = get_stored_member_digest_index(
+            ejp_xml_data_config
+        )
+        with s3_open_binary_read(
+                bucket=ejp_xml_data_config.s3_bucket,
+                object_key=object_key
+        ) as streaming_body:
+            with etl_metrics.timer(EtlStageNames.S3_DOWNLOAD):
+                zip_bytes = streaming_body.read()
+        etl_metrics.increment(EtlCounterNames.ZIP_BYTES, len(zip_bytes))
+        zip_checkpointer: Optional[ZipCheckpointer] = None
+        with TemporaryDirectory() as file_dir:
+            run_context = EtlRunContext(
+                ejp_xml_data_config, file_dir, etl_metrics=etl_metrics
+            )
+            with get_entity_output(run_context) as entity_output:
+                if is_zip_checkpoint_enabled(ejp_xml_data_config):
+                    zip_checkpointer = ZipCheckpointer(
+                        run_context,
+                        object_key,
+                        get_resumable_zip_progress(
+                            ejp_xml_data_config,
+                            object_key,
+                            get_member_digest(zip_bytes)
+                        ),
+                        entity_output,
+                        member_digest_index=member_digest_index
+                    )
+                    entity_output.start_part(zip_checkpointer.part_object_key)
+                else:
+                    entity_output.start_part(object_key)
+                try:
+                    write_entities_in_zip(
+                        run_context,
+                        object_key,
+                        zip_bytes,
+                        entity_output,
+                        member_digest_index=member_digest_index,
+                        zip_checkpointer=zip_checkpointer
+                    )
+                    if zip_checkpointer is not None:
+                        zip_checkpointer.finish()
+                        uploaded_object_keys_by_entity_name = (
+                            zip_checkpointer.zip_progress.uploaded_object_keys_by_entity_name
+                        )
+                    else:
+                        uploaded_object_keys_by_entity_name = {
+                            entity_name: [uploaded_object_key]
+                            for entity_name, uploaded_object_key
+                            in entity_output.complete_part().items()
+                        }
+                except BaseException:
+                    # otherwise incomplete multipart uploads are kept (and charged for)
+                    entity_output.abort_part()
+                    raise
+        if member_digest_index is not None:
+            update_stored_member_digest_index(
+                member_digest_index,
+                ejp_xml_data_config
+            )
+        if zip_checkpointer is not None:
+            delete_stored_zip_progress(ejp_xml_data_config, object_key)
+    return uploaded_object_keys_by_entity_name
 
 
 def get_temp_s3_object_name(
@@ -112,35 +463,49 @@ def get_temp_s3_object_name(
 
 
 def load_entities_file_to_s3(
-        ejp_xml_load_config: eJPXmlDataConfig,
+        run_context: EtlRunContext,
         original_obj_key
-):
+) -> Dict[str, str]:
+    ejp_xml_load_config = run_context.ejp_xml_data_config
+    etl_metrics = run_context.etl_metrics
+    uploaded_object_key_by_entity_name = {}
     for entity in ejp_xml_load_config.entity_type_mapping.values():
-        if os.path.getsize(entity.get_full_file_location()) > 0:
+        entity_file_location = run_context.get_entity_file_location(entity)
+        entity_file_size = os.path.getsize(entity_file_location)
+        if entity_file_size > 0:
             obj_key = get_temp_s3_object_name(
                 entity.s3_object_prefix,
                 original_obj_key
             )
-            upload_file_into_s3(
-                bucket=ejp_xml_load_config.temp_file_s3_bucket,
-                object_key=obj_key,
-                full_file_path=entity.get_full_file_location()
+            with etl_metrics.timer(EtlStageNames.S3_UPLOAD):
+                upload_file_into_s3(
+                    bucket=ejp_xml_load_config.temp_file_s3_bucket,
+                    object_key=obj_key,
+                    full_file_path=entity_file_location
+                )
+            etl_metrics.increment(
+                EtlCounterNames.UPLOADED_BYTES, entity_file_size
             )
+            etl_metrics.increment(EtlCounterNames.UPLOADED_FILES)
+            uploaded_object_key_by_entity_name[entity.file_name] = obj_key
+    return uploaded_object_key_by_entity_name
 
 
 def load_entity_file_to_bq(
         gcp_project: str,
         dataset: str,
         table_name: str,
-        file_path: str
+        file_path: str,
+        json_schema: Optional[List[dict]] = None
 ):
     if os.path.getsize(file_path) > 0:
-        create_or_extend_table_schema(
-            gcp_project,
-            dataset,
-            table_name,
-            file_path
-        )
+        if json_schema is None:
+            create_or_extend_table_schema(
+                gcp_project,
+                dataset,
+                table_name,
+                file_path
+            )
         load_file_into_bq(
             filename=file_path,
             table_name=table_name,
@@ -153,8 +518,17 @@ def load_entity_file_to_bq(
 def download_load2bq_cleanup_temp_files(
         matching_file_metadata_iter, s3_bucket: str,
         gcp_project: str, dataset: str,
-        bq_table: str, batch_size_limit: int = 100000
+        bq_table: str, batch_size_limit: int = 100000,
+        json_schema: Optional[List[dict]] = None
 ):
+    if json_schema is not None:
+        # the table schema is known up front and doesn't need to be inferred from the data
+        create_or_extend_table_schema(
+            gcp_project,
+            dataset,
+            bq_table,
+            json_schema=json_schema
+        )
     written_file_row_count = 0
     s3_objects_written_to_file = []
     with TemporaryDirectory() as tmp_dir:
@@ -182,7 +556,8 @@ def download_load2bq_cleanup_temp_files(
                     load_and_delete_temp_objects(
                         gcp_project, dataset,
                         bq_table, temp_file_name,
-                        s3_bucket, s3_objects_written_to_file
+                        s3_bucket, s3_objects_written_to_file,
+                        json_schema=json_schema
                     )
                     writer.truncate()
                     s3_objects_written_to_file = []
@@ -191,7 +566,8 @@ def download_load2bq_cleanup_temp_files(
             load_and_delete_temp_objects(
                 gcp_project, dataset,
                 bq_table, temp_file_name,
-                s3_bucket, s3_objects_written_to_file
+                s3_bucket, s3_objects_written_to_file,
+                json_schema=json_schema
             )
 
 
@@ -202,11 +578,13 @@ def get_number_of_lines(jsonl_string: str):
 def load_and_delete_temp_objects(
         gcp_project: str, dataset: str,
         bq_table: str, tempfile_name: str,
-        s3_bucket: str, s3_objects_written_to_file: List[str]
+        s3_bucket: str, s3_objects_written_to_file: List[str],
+        json_schema: Optional[List[dict]] = None
 ):
     load_entity_file_to_bq(
         gcp_project, dataset,
-        bq_table, tempfile_name
+        bq_table, tempfile_name,
+        json_schema=json_schema
     )
     delete_s3_objects(
         s3_bucket, s3_objects_written_to_file
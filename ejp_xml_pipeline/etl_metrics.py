@@ -0,0 +1,146 @@
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, TypeVar
+
+from ejp_xml_pipeline.member_resource_report import MemberResourceReport
+
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class EtlStageNames:
+    TOTAL = 'total'
+    S3_DOWNLOAD = 's3_download'
+    ZIP_INFLATE = 'zip_inflate'
+    ZIP_READ_AHEAD_WAIT = 'zip_read_ahead_wait'
+    XML_PARSE = 'xml_parse'
+    FIELD_MAPPING = 'field_mapping'
+    JSON_ENCODE = 'json_encode'
+    # summed over the background threads when streaming the upload
+    S3_UPLOAD = 's3_upload'
+    S3_UPLOAD_WAIT = 's3_upload_wait'
+
+
+class EtlCounterNames:
+    ZIP_BYTES = 'zip_bytes'
+    XML_BYTES = 'xml_bytes'
+    DOCUMENTS = 'documents'
+    SKIPPED_DOCUMENTS = 'skipped_documents'
+    MISSING_MEMBERS = 'missing_members'
+    UNLISTED_MEMBERS = 'unlisted_members'
+    RESUMED_MEMBERS = 'resumed_members'
+    CHECKPOINTS = 'checkpoints'
+    JSON_BYTES = 'json_bytes'
+    UPLOADED_BYTES = 'uploaded_bytes'
+    UPLOADED_FILES = 'uploaded_files'
+    UPLOADED_PARTS = 'uploaded_parts'
+    INTERNED_STRINGS = 'interned_strings'
+    INTERNED_STRING_BYTES = 'interned_string_bytes'
+    RECOVERED_XML_ERRORS = 'recovered_xml_errors'
+    RECOVERED_XML_ERRORS_PREFIX = 'recovered_xml_errors.'
+    ENTITIES_PREFIX = 'entities.'
+
+
+THROUGHPUT_COUNTER_AND_STAGE_BY_NAME = {
+    'zip_bytes_per_second': (
+        EtlCounterNames.ZIP_BYTES, EtlStageNames.S3_DOWNLOAD
+    ),
+    'xml_bytes_per_second': (
+        EtlCounterNames.XML_BYTES, EtlStageNames.XML_PARSE
+    ),
+    'documents_per_second': (
+        EtlCounterNames.DOCUMENTS, EtlStageNames.TOTAL
+    ),
+    'json_bytes_per_second': (
+        EtlCounterNames.JSON_BYTES, EtlStageNames.JSON_ENCODE
+    ),
+    'uploaded_bytes_per_second': (
+        EtlCounterNames.UPLOADED_BYTES, EtlStageNames.S3_UPLOAD
+    )
+}
+
+
+def get_entity_counter_name(entity_type: type) -> str:
+    return EtlCounterNames.ENTITIES_PREFIX + entity_type.__name__
+
+
+def get_recovered_xml_error_counter_name(error_type_name: str) -> str:
+    return EtlCounterNames.RECOVERED_XML_ERRORS_PREFIX + error_type_name
+
+
+class EtlMetrics:
+    def __init__(
+            self,
+            name: Optional[str] = None,
+            member_resource_report: Optional[MemberResourceReport] = None
+    ):
+        self.name = name
+        self.duration_by_stage: Dict[str, float] = defaultdict(float)
+        self.count_by_counter: Dict[str, int] = defaultdict(int)
+        self.member_resource_report = member_resource_report
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.duration_by_stage[stage] += time.perf_counter() - start_time
+
+    def add_duration(self, stage: str, seconds: float):
+        self.duration_by_stage[stage] += seconds
+
+    def iter_timed(self, values: Iterable[T], stage: str) -> Iterator[T]:
+        # times retrieving each value, e.g. waiting for a background thread
+        iterator = iter(values)
+        while True:
+            with self.timer(stage):
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    return
+            yield value
+
+    def increment(self, counter: str, value: int = 1):
+        self.count_by_counter[counter] += value
+
+    def get_throughput(self) -> Dict[str, float]:
+        throughput = {}
+        for name, (counter, stage) in THROUGHPUT_COUNTER_AND_STAGE_BY_NAME.items():
+            duration = self.duration_by_stage.get(stage)
+            if duration and counter in self.count_by_counter:
+                throughput[name] = round(
+                    self.count_by_counter[counter] / duration, 3
+                )
+        return throughput
+
+    def get_summary(self) -> dict:
+        summary = {
+            'name': self.name,
+            'duration_seconds_by_stage': {
+                stage: round(duration, 6)
+                for stage, duration in self.duration_by_stage.items()
+            },
+            'count_by_counter': dict(self.count_by_counter),
+            'throughput': self.get_throughput()
+        }
+        if self.member_resource_report is not None:
+            summary['member_resource_report'] = (
+                self.member_resource_report.get_summary()
+            )
+        return summary
+
+    def log_summary(self):
+        LOGGER.info(
+            'etl metrics: %s',
+            json.dumps(self.get_summary(), sort_keys=True)
+        )
+
+
+def serialize_etl_metrics(etl_metrics: EtlMetrics) -> str:
+    return json.dumps(etl_metrics.get_summary(), indent=2, sort_keys=True)
@@ -1,10 +1,31 @@
 import json
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 from botocore.exceptions import ClientError
 from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
 from ejp_xml_pipeline.data_store.s3_data_service import (
-    download_s3_json_object, upload_s3_object
+    delete_s3_objects,
+    download_s3_json_object,
+    download_s3_object_as_bytes,
+    download_s3_object_as_string,
+    upload_s3_object
+)
+from ejp_xml_pipeline.etl_metrics import EtlMetrics, serialize_etl_metrics
+from ejp_xml_pipeline.member_digest_index import (
+    MemberDigestIndex,
+    serialize_member_digest_index,
+    deserialize_member_digest_index
+)
+from ejp_xml_pipeline.processed_object_manifest import (
+    ProcessedObjectManifest,
+    serialize_processed_object_manifest,
+    deserialize_processed_object_manifest
+)
+from ejp_xml_pipeline.zip_progress import (
+    ZipProgress,
+    serialize_zip_progress,
+    deserialize_zip_progress
 )
 from ejp_xml_pipeline.utils.xml_transform_util.timestamp import (
     convert_datetime_string_to_datetime, convert_datetime_to_string
@@ -74,3 +95,170 @@ def update_object_latest_dates(
         object_pattern: convert_datetime_to_string(file_modified_timestamp)
     }
     return new_obj_pattern_with_latest_dates
+
+
+def get_stored_member_digest_index(
+        data_config: eJPXmlDataConfig
+) -> Optional[MemberDigestIndex]:
+    if not data_config.member_digest_index_object:
+        return None
+    try:
+        return deserialize_member_digest_index(
+            download_s3_object_as_bytes(
+                data_config.state_file_bucket,
+                data_config.member_digest_index_object
+            ),
+            force_full_reprocess=data_config.force_full_reprocess
+        )
+    except ClientError as ex:
+        if ex.response['Error']['Code'] == 'NoSuchKey':
+            return MemberDigestIndex(
+                force_full_reprocess=data_config.force_full_reprocess
+            )
+        raise ex
+
+
+def update_stored_member_digest_index(
+        member_digest_index: MemberDigestIndex,
+        data_config: eJPXmlDataConfig
+):
+    upload_s3_object(
+        bucket=data_config.state_file_bucket,
+        object_key=data_config.member_digest_index_object,
+        data_object=serialize_member_digest_index(member_digest_index)
+    )
+
+
+def get_stored_processed_object_manifest(
+        data_config: eJPXmlDataConfig
+) -> Optional[ProcessedObjectManifest]:
+    if not data_config.state_manifest_file_object:
+        return None
+    try:
+        return deserialize_processed_object_manifest(
+            download_s3_object_as_string(
+                data_config.state_file_bucket,
+                data_config.state_manifest_file_object
+            )
+        )
+    except ClientError as ex:
+        if ex.response['Error']['Code'] == 'NoSuchKey':
+            return None
+        raise ex
+
+
+def update_processed_object_manifest(
+        processed_object_manifest: Optional[ProcessedObjectManifest],
+        processed_s3_object_meta: dict,
+        data_config: eJPXmlDataConfig
+) -> Optional[ProcessedObjectManifest]:
+    if not data_config.state_manifest_file_object:
+        return None
+    if processed_object_manifest is None:
+        processed_object_manifest = ProcessedObjectManifest()
+    processed_object_manifest.add(processed_s3_object_meta)
+    processed_object_manifest.compact(
+        processed_s3_object_meta[
+            named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY
+        ].replace(microsecond=0)
+    )
+    upload_s3_object(
+        bucket=data_config.state_file_bucket,
+        object_key=data_config.state_manifest_file_object,
+        data_object=serialize_processed_object_manifest(
+            processed_object_manifest
+        )
+    )
+    return processed_object_manifest
+
+
+def get_etl_metrics_object_key(
+        data_config: eJPXmlDataConfig,
+        object_key: str
+) -> Optional[str]:
+    if not data_config.etl_metrics_object_prefix:
+        return None
+    return data_config.etl_metrics_object_prefix + object_key + '.json'
+
+
+def update_stored_etl_metrics(
+        etl_metrics: EtlMetrics,
+        data_config: eJPXmlDataConfig,
+        object_key: str
+):
+    etl_metrics_object_key = get_etl_metrics_object_key(data_config, object_key)
+    if not etl_metrics_object_key:
+        return
+    upload_s3_object(
+        bucket=data_config.state_file_bucket,
+        object_key=etl_metrics_object_key,
+        data_object=serialize_etl_metrics(etl_metrics)
+    )
+
+
+def update_stored_task_profile(
+        profile_bytes: bytes,
+        data_config: eJPXmlDataConfig,
+        profile_name: str
+):
+    if not data_config.task_profile_object_prefix:
+        return
+    upload_s3_object(
+        bucket=data_config.state_file_bucket,
+        object_key=data_config.task_profile_object_prefix + profile_name + '.prof',
+        data_object=profile_bytes
+    )
+
+
+def get_zip_progress_object_key(
+        data_config: eJPXmlDataConfig,
+        object_key: str
+) -> Optional[str]:
+    if not data_config.zip_progress_object_prefix:
+        return None
+    return data_config.zip_progress_object_prefix + object_key + '.json'
+
+
+def get_stored_zip_progress(
+        data_config: eJPXmlDataConfig,
+        object_key: str
+) -> Optional[ZipProgress]:
+    zip_progress_object_key = get_zip_progress_object_key(data_config, object_key)
+    if not zip_progress_object_key:
+        return None
+    try:
+        return deserialize_zip_progress(
+            download_s3_object_as_string(
+                data_config.temp_file_s3_bucket,
+                zip_progress_object_key
+            )
+        )
+    except ClientError as ex:
+        if ex.response['Error']['Code'] == 'NoSuchKey':
+            return None
+        raise ex
+
+
+def update_stored_zip_progress(
+        zip_progress: ZipProgress,
+        data_config: eJPXmlDataConfig,
+        object_key: str
+):
+    zip_progress_object_key = get_zip_progress_object_key(data_config, object_key)
+    if not zip_progress_object_key:
+        return
+    upload_s3_object(
+        bucket=data_config.temp_file_s3_bucket,
+        object_key=zip_progress_object_key,
+        data_object=serialize_zip_progress(zip_progress)
+    )
+
+
+def delete_stored_zip_progress(
+        data_config: eJPXmlDataConfig,
+        object_key: str
+):
+    zip_progress_object_key = get_zip_progress_object_key(data_config, object_key)
+    if not zip_progress_object_key:
+        return
+    delete_s3_objects(data_config.temp_file_s3_bucket, [zip_progress_object_key])
@@ -0,0 +1,59 @@
+import gzip
+import hashlib
+import json
+from typing import Dict, Optional
+
+
+MEMBER_DIGEST_SIZE = 16
+
+
+def get_member_digest(member_bytes: bytes) -> str:
+    return hashlib.blake2b(
+        member_bytes, digest_size=MEMBER_DIGEST_SIZE
+    ).hexdigest()
+
+
+class MemberDigestIndex:
+    def __init__(
+            self,
+            digest_by_manuscript_number: Optional[Dict[str, str]] = None,
+            force_full_reprocess: bool = False
+    ):
+        self.digest_by_manuscript_number = dict(
+            digest_by_manuscript_number or {}
+        )
+        self.force_full_reprocess = force_full_reprocess
+        self.skipped_count = 0
+        self.processed_count = 0
+
+    def should_skip_member(
+            self, manuscript_number: str, member_bytes: bytes
+    ) -> bool:
+        digest = get_member_digest(member_bytes)
+        is_unchanged = (
+            self.digest_by_manuscript_number.get(manuscript_number) == digest
+        )
+        self.digest_by_manuscript_number[manuscript_number] = digest
+        if is_unchanged and not self.force_full_reprocess:
+            self.skipped_count += 1
+            return True
+        self.processed_count += 1
+        return False
+
+
+def serialize_member_digest_index(member_digest_index: MemberDigestIndex) -> bytes:
+    return gzip.compress(json.dumps(
+        member_digest_index.digest_by_manuscript_number,
+        separators=(',', ':'),
+        sort_keys=True
+    ).encode('utf-8'))
+
+
+def deserialize_member_digest_index(
+        data: bytes,
+        force_full_reprocess: bool = False
+) -> MemberDigestIndex:
+    return MemberDigestIndex(
+        json.loads(gzip.decompress(data).decode('utf-8')),
+        force_full_reprocess=force_full_reprocess
+    )
@@ -0,0 +1,143 @@
+import heapq
+import logging
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 10
+
+PROC_SELF_STATM_PATH = '/proc/self/statm'
+
+REPORTED_FIELD_NAMES = ('parse_seconds', 'peak_traced_memory_bytes', 'rss_growth_bytes')
+
+
+class MemberResourceUsage(NamedTuple):
+    filename: str
+    xml_bytes: int
+    parse_seconds: float
+    peak_traced_memory_bytes: Optional[int] = None
+    rss_growth_bytes: Optional[int] = None
+
+
+def get_current_rss_bytes() -> Optional[int]:
+    # only available on Linux, the peak rss from getrusage never goes down
+    try:
+        with open(PROC_SELF_STATM_PATH, 'r', encoding='utf-8') as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def reset_traced_memory_peak() -> int:
+    if hasattr(tracemalloc, 'reset_peak'):
+        current_traced_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        return current_traced_memory
+    # python < 3.9, clearing the traces also resets the peak
+    tracemalloc.clear_traces()
+    return 0
+
+
+def to_member_resource_usage_dict(usage: MemberResourceUsage) -> dict:
+    return {
+        key: round(value, 6) if isinstance(value, float) else value
+        for key, value in usage._asdict().items()
+        if value is not None
+    }
+
+
+class MemberResourceReport:
+    def __init__(self, top_n: int = DEFAULT_TOP_N, trace_memory: bool = False):
+        self.top_n = top_n
+        self.trace_memory = trace_memory
+        self.member_count = 0
+        # min-heaps of the top n usages only, the member index breaks ties
+        self._top_usage_heap_by_field_name: Dict[
+            str, List[Tuple[float, int, MemberResourceUsage]]
+        ] = {field_name: [] for field_name in REPORTED_FIELD_NAMES}
+        self._started_tracemalloc = False
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def measure(self, filename: str, xml_bytes: int) -> Iterator[None]:
+        start_traced_memory = None
+        start_rss = None
+        if self.trace_memory:
+            start_traced_memory = reset_traced_memory_peak()
+            start_rss = get_current_rss_bytes()
+        start_time = time.perf_counter()
+        yield
+        parse_seconds = time.perf_counter() - start_time
+        peak_traced_memory_bytes = None
+        rss_growth_bytes = None
+        if start_traced_memory is not None:
+            _, peak_traced_memory = tracemalloc.get_traced_memory()
+            peak_traced_memory_bytes = peak_traced_memory - start_traced_memory
+        if start_rss is not None:
+            end_rss = get_current_rss_bytes()
+            if end_rss is not None:
+                rss_growth_bytes = end_rss - start_rss
+        self.add_usage(MemberResourceUsage(
+            filename=filename,
+            xml_bytes=xml_bytes,
+            parse_seconds=parse_seconds,
+            peak_traced_memory_bytes=peak_traced_memory_bytes,
+            rss_growth_bytes=rss_growth_bytes
+        ))
+
+    def add_usage(self, usage: MemberResourceUsage):
+        self.member_count += 1
+        if self.top_n <= 0:
+            return
+        for field_name, top_usage_heap in self._top_usage_heap_by_field_name.items():
+            value = getattr(usage, field_name)
+            if value is None:
+                continue
+            # on equal values, the earlier member is kept
+            item = (value, -self.member_count, usage)
+            if len(top_usage_heap) < self.top_n:
+                heapq.heappush(top_usage_heap, item)
+            elif item > top_usage_heap[0]:
+                heapq.heapreplace(top_usage_heap, item)
+
+    def get_top_usages(self, field_name: str) -> List[MemberResourceUsage]:
+        return [
+            usage
+            for _, _, usage in sorted(
+                self._top_usage_heap_by_field_name[field_name], reverse=True
+            )
+        ]
+
+    def get_summary(self) -> dict:
+        summary = {
+            'member_count': self.member_count,
+            'top_by_parse_seconds': [
+                to_member_resource_usage_dict(usage)
+                for usage in self.get_top_usages('parse_seconds')
+            ]
+        }
+        if self.trace_memory:
+            summary['top_by_peak_traced_memory'] = [
+                to_member_resource_usage_dict(usage)
+                for usage in self.get_top_usages('peak_traced_memory_bytes')
+            ]
+            summary['top_by_rss_growth'] = [
+                to_member_resource_usage_dict(usage)
+                for usage in self.get_top_usages('rss_growth_bytes')
+            ]
+        return summary
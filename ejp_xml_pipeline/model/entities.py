@@ -1,21 +1,42 @@
+from typing import Any
+
+from ejp_xml_pipeline.model.record_serializer import get_record_dict
+from ejp_xml_pipeline.model.records import (
+    ManuscriptRecord,
+    ManuscriptVersionRecord,
+    PersonRecord,
+    PersonV2Record
+)
+
 
 class BaseEntity:
+    __slots__ = ('record',)
+
+    record_class: type
+
+    def __init__(self, record: Any):
+        self.record = record
 
-    def __init__(self, data: dict):
-        self.data = data
+    @property
+    def data(self) -> dict:
+        return get_record_dict(self.record)
 
 
 class Person(BaseEntity):
-    pass
+    __slots__ = ()
+    record_class = PersonRecord
 
 
 class PersonV2(BaseEntity):
-    pass
+    __slots__ = ()
+    record_class = PersonV2Record
 
 
 class Manuscript(BaseEntity):
-    pass
+    __slots__ = ()
+    record_class = ManuscriptRecord
 
 
 class ManuscriptVersion(BaseEntity):
-    pass
+    __slots__ = ()
+    record_class = ManuscriptVersionRecord
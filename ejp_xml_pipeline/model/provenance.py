@@ -0,0 +1,26 @@
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class NodeProvenance(Mapping):
+    # the document provenance with the node index, without copying the document provenance
+    __slots__ = ('document_provenance', 'node_index')
+
+    def __init__(self, document_provenance: dict, node_index: int):
+        self.document_provenance = document_provenance
+        self.node_index = node_index
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'node_index':
+            return self.node_index
+        return self.document_provenance[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.document_provenance
+        yield 'node_index'
+
+    def __len__(self) -> int:
+        return len(self.document_provenance) + 1
+
+    def __repr__(self) -> str:
+        return f'NodeProvenance({self.document_provenance!r}, node_index={self.node_index!r})'
@@ -0,0 +1,62 @@
+from typing import Any, List
+
+from ejp_xml_pipeline.model.record_serializer import (
+    RecordFieldKind,
+    get_record_fields
+)
+from ejp_xml_pipeline.model.records import Provenance, ProvenanceRecord
+from ejp_xml_pipeline.utils.xml_transform_util.timestamp import IsoTimestamp
+
+
+BQ_TYPE_BY_VALUE_TYPE = {
+    str: 'STRING',
+    IsoTimestamp: 'TIMESTAMP',
+    int: 'INTEGER',
+    float: 'FLOAT',
+    bool: 'BOOLEAN'
+}
+
+
+def get_value_bq_type(value_type: Any) -> str:
+    try:
+        return BQ_TYPE_BY_VALUE_TYPE[value_type]
+    except KeyError as exc:
+        raise TypeError(f'no BigQuery type for {value_type}') from exc
+
+
+def _get_field_json_schema(name: str, kind: str, value_type: Any) -> dict:
+    mode = (
+        'REPEATED'
+        if kind in (RecordFieldKind.RECORD_LIST, RecordFieldKind.VALUE_LIST)
+        else 'NULLABLE'
+    )
+    if value_type == Provenance:
+        value_type = ProvenanceRecord
+        kind = RecordFieldKind.RECORD
+    if kind in (RecordFieldKind.RECORD, RecordFieldKind.RECORD_LIST):
+        return {
+            'name': name,
+            'type': 'RECORD',
+            'mode': mode,
+            'fields': get_record_json_schema(value_type)
+        }
+    return {'name': name, 'type': get_value_bq_type(value_type), 'mode': mode}
+
+
+def get_record_json_schema(record_class: type) -> List[dict]:
+    return [
+        _get_field_json_schema(
+            record_field.name, record_field.kind, record_field.value_type
+        )
+        for record_field in get_record_fields(record_class)
+    ]
+
+
+def get_record_schema_field_list(record_class: type) -> list:
+    # imported here to keep the bigquery client out of the dag file imports
+    # pylint: disable=import-outside-toplevel
+    from google.cloud.bigquery.schema import SchemaField
+    return [
+        SchemaField.from_api_repr(field_json_schema)
+        for field_json_schema in get_record_json_schema(record_class)
+    ]
@@ -0,0 +1,181 @@
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union, get_args, get_origin
+)
+
+import attr
+
+
+PROVENANCE_FIELD_NAME = 'provenance'
+
+RecordSerializer = Callable[[Any], dict]
+
+# serializers are generated once per record class, looked up for every record
+_RECORD_DICT_SERIALIZER_BY_CLASS: Dict[type, RecordSerializer] = {}
+_RECORD_JSON_DICT_SERIALIZER_BY_CLASS: Dict[Tuple[type, bool], RecordSerializer] = {}
+
+
+class RecordFieldKind:
+    VALUE = 'value'
+    VALUE_LIST = 'value_list'
+    RECORD = 'record'
+    RECORD_LIST = 'record_list'
+
+
+class RecordField(NamedTuple):
+    name: str
+    kind: str
+    value_type: Any
+    is_repeated: bool
+
+
+def is_record_class(value_type: Any) -> bool:
+    return isinstance(value_type, type) and attr.has(value_type)
+
+
+def get_non_optional_type(field_type: Any) -> Any:
+    if get_origin(field_type) is Union:
+        return next(
+            arg for arg in get_args(field_type) if arg is not type(None)
+        )
+    return field_type
+
+
+@lru_cache(maxsize=None)
+def get_record_fields(record_class: type) -> List[RecordField]:
+    record_fields = []
+    for field in attr.fields(record_class):
+        field_type = get_non_optional_type(field.type)
+        is_repeated = get_origin(field_type) in (list, List)
+        value_type = get_args(field_type)[0] if is_repeated else field_type
+        if is_record_class(value_type):
+            kind = RecordFieldKind.RECORD_LIST if is_repeated else RecordFieldKind.RECORD
+        else:
+            kind = RecordFieldKind.VALUE_LIST if is_repeated else RecordFieldKind.VALUE
+        record_fields.append(RecordField(
+            name=field.name,
+            kind=kind,
+            value_type=value_type,
+            is_repeated=is_repeated
+        ))
+    return record_fields
+
+
+def _get_serializer_name(record_class: type, prefix: str) -> str:
+    return f'{prefix}_{record_class.__name__}'
+
+
+def _compile_function(
+        function_name: str,
+        source_lines: List[str],
+        namespace: Dict[str, Any]
+) -> RecordSerializer:
+    # pylint: disable=exec-used
+    exec('\n'.join(source_lines), namespace)  # nosec
+    return namespace[function_name]
+
+
+def get_record_dict_serializer(record_class: type) -> RecordSerializer:
+    serializer = _RECORD_DICT_SERIALIZER_BY_CLASS.get(record_class)
+    if serializer is None:
+        serializer = _generate_record_dict_serializer(record_class)
+        _RECORD_DICT_SERIALIZER_BY_CLASS[record_class] = serializer
+    return serializer
+
+
+def get_record_json_dict_serializer(
+        record_class: type,
+        exclude_provenance: bool = False
+) -> RecordSerializer:
+    serializer = _RECORD_JSON_DICT_SERIALIZER_BY_CLASS.get(
+        (record_class, exclude_provenance)
+    )
+    if serializer is None:
+        serializer = _generate_record_json_dict_serializer(
+            record_class, exclude_provenance
+        )
+        _RECORD_JSON_DICT_SERIALIZER_BY_CLASS[
+            (record_class, exclude_provenance)
+        ] = serializer
+    return serializer
+
+
+def _generate_record_dict_serializer(record_class: type) -> RecordSerializer:
+    # generated, e.g. "return {'name': record.name, 'items': [...], ...}"
+    function_name = _get_serializer_name(record_class, 'to_dict')
+    namespace: Dict[str, Any] = {}
+    source_lines = [f'def {function_name}(record):', '    return {']
+    for record_field in get_record_fields(record_class):
+        value_expr = f'record.{record_field.name}'
+        if record_field.kind == RecordFieldKind.RECORD:
+            serializer_name = f'to_dict_{record_field.name}'
+            namespace[serializer_name] = get_record_dict_serializer(
+                record_field.value_type
+            )
+            value_expr = (
+                f'{serializer_name}({value_expr}) if {value_expr} is not None else None'
+            )
+        elif record_field.kind == RecordFieldKind.RECORD_LIST:
+            serializer_name = f'to_dict_{record_field.name}'
+            namespace[serializer_name] = get_record_dict_serializer(
+                record_field.value_type
+            )
+            value_expr = f'[{serializer_name}(item) for item in {value_expr}]'
+        elif record_field.kind == RecordFieldKind.VALUE_LIST:
+            value_expr = f'list({value_expr})'
+        source_lines.append(f'        {record_field.name!r}: {value_expr},')
+    source_lines.append('    }')
+    return _compile_function(function_name, source_lines, namespace)
+
+
+def _generate_record_json_dict_serializer(
+        record_class: type,
+        exclude_provenance: bool
+) -> RecordSerializer:
+    # same as remove_key_with_null_value: leaves out empty values but keeps False
+    function_name = _get_serializer_name(record_class, 'to_json_dict')
+    namespace: Dict[str, Any] = {}
+    source_lines = [f'def {function_name}(record):', '    result = {}']
+    for record_field in get_record_fields(record_class):
+        if exclude_provenance and record_field.name == PROVENANCE_FIELD_NAME:
+            continue
+        source_lines.append(f'    value = record.{record_field.name}')
+        if record_field.kind == RecordFieldKind.VALUE:
+            source_lines.extend([
+                '    if value or value is True or value is False:',
+                f'        result[{record_field.name!r}] = value'
+            ])
+            continue
+        source_lines.append('    if value:')
+        if record_field.kind == RecordFieldKind.VALUE_LIST:
+            value_expr = 'list(value)'
+        else:
+            serializer_name = f'to_json_dict_{record_field.name}'
+            namespace[serializer_name] = get_record_json_dict_serializer(
+                record_field.value_type
+            )
+            value_expr = (
+                f'[{serializer_name}(item) for item in value]'
+                if record_field.kind == RecordFieldKind.RECORD_LIST
+                else f'{serializer_name}(value)'
+            )
+        source_lines.append(f'        result[{record_field.name!r}] = {value_expr}')
+    source_lines.append('    return result')
+    return _compile_function(function_name, source_lines, namespace)
+
+
+def get_record_dict(record: object) -> dict:
+    return get_record_dict_serializer(type(record))(record)
+
+
+def get_record_json_dict(
+        record: object,
+        exclude_provenance: bool = False
+) -> dict:
+    return get_record_json_dict_serializer(
+        type(record), exclude_provenance
+    )(record)
+
+
+def get_record_provenance(record: Any) -> Optional[Any]:
+    return getattr(record, PROVENANCE_FIELD_NAME, None)
@@ -0,0 +1,265 @@
+from typing import Any, List, Mapping, Optional
+
+import attr
+
+from ejp_xml_pipeline.utils.xml_transform_util.timestamp import IsoTimestamp
+
+
+Provenance = Mapping[str, Any]
+
+
+@attr.define(kw_only=True)
+class ProvenanceRecord:
+    # describes the provenance mapping, which is shared by the records of a document
+    source_filename: Optional[str] = None
+    imported_timestamp: Optional[IsoTimestamp] = None
+    node_index: Optional[int] = None
+
+
+# manuscript xml
+
+@attr.define(kw_only=True)
+class PersonExternalReferenceRecord:
+    reference_type: Optional[str] = None
+    reference_value: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class PersonRoleRecord:
+    role_name: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class PersonAddressRecord:
+    address_type: Optional[str] = None
+    country: Optional[str] = None
+    area: Optional[str] = None
+    city: Optional[str] = None
+    postal_code: Optional[str] = None
+    department: Optional[str] = None
+    address_line_1: Optional[str] = None
+    address_line_2: Optional[str] = None
+    start_timestamp: Optional[IsoTimestamp] = None
+    end_timestamp: Optional[IsoTimestamp] = None
+
+
+@attr.define(kw_only=True)
+class PersonRecord:
+    person_id: Optional[str] = None
+    provenance: Optional[Provenance] = None
+    modified_timestamp: Optional[IsoTimestamp] = None
+    title: Optional[str] = None
+    first_name: Optional[str] = None
+    middle_name: Optional[str] = None
+    last_name: Optional[str] = None
+    institution: Optional[str] = None
+    email: Optional[str] = None
+    secondary_email: Optional[str] = None
+    external_references: List[PersonExternalReferenceRecord] = attr.Factory(list)
+    roles: List[PersonRoleRecord] = attr.Factory(list)
+    addresses: List[PersonAddressRecord] = attr.Factory(list)
+
+
+@attr.define(kw_only=True)
+class ManuscriptRecord:
+    provenance: Optional[Provenance] = None
+    manuscript_id: Optional[str] = None
+    long_manuscript_identifier: Optional[str] = None
+    modified_timestamp: Optional[IsoTimestamp] = None
+    country: Optional[str] = None
+    doi: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class VersionStageRecord:
+    stage_timestamp: Optional[IsoTimestamp] = None
+    stage_name: Optional[str] = None
+    person_id: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class AuthorRecord:
+    person_id: Optional[str] = None
+    sequence: Optional[int] = None
+    is_corresponding_author: Optional[bool] = None
+
+
+@attr.define(kw_only=True)
+class ReviewerRecord:
+    person_id: Optional[str] = None
+    sequence: Optional[int] = None
+    started_timestamp: Optional[IsoTimestamp] = None
+    due_timestamp: Optional[IsoTimestamp] = None
+    next_chase_timestamp: Optional[IsoTimestamp] = None
+    received_timestamp: Optional[IsoTimestamp] = None
+
+
+@attr.define(kw_only=True)
+class ReviewingEditorRecord:
+    person_id: Optional[str] = None
+    assigned_timestamp: Optional[IsoTimestamp] = None
+    due_timestamp: Optional[IsoTimestamp] = None
+
+
+@attr.define(kw_only=True)
+class SeniorEditorRecord:
+    person_id: Optional[str] = None
+    assigned_timestamp: Optional[IsoTimestamp] = None
+
+
+@attr.define(kw_only=True)
+class PotentialPersonRecord:
+    person_id: Optional[str] = None
+    suggested_to_include: Optional[bool] = None
+    suggested_to_exclude: Optional[bool] = None
+
+
+@attr.define(kw_only=True)
+class AuthorFundingRecord:
+    author_person_id: Optional[str] = None
+    sequence: Optional[int] = None
+    funding_title: Optional[str] = None
+    grant_reference: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class SubjectAreaRecord:
+    subject_area_name: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class ResearchOrganismRecord:
+    research_organism_name: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class KeywordRecord:
+    keyword: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class EmailRecord:
+    from_email: Optional[str] = None
+    to_email: Optional[str] = None
+    cc_email: Optional[str] = None
+    bcc_email: Optional[str] = None
+    email_timestamp: Optional[IsoTimestamp] = None
+    email_status: Optional[str] = None
+    subject: Optional[str] = None
+    from_person_id: Optional[str] = None
+    to_person_id: Optional[str] = None
+    triggered_by_person_id: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class ManuscriptVersionRecord:  # pylint: disable=too-many-instance-attributes
+    provenance: Optional[Provenance] = None
+    created_timestamp: Optional[IsoTimestamp] = None
+    modified_timestamp: Optional[IsoTimestamp] = None
+    manuscript_id: Optional[str] = None
+    long_manuscript_identifier: Optional[str] = None
+    full_manuscript_type: Optional[str] = None
+    manuscript_type: Optional[str] = None
+    version_id: Optional[str] = None
+    manuscript_title: Optional[str] = None
+    abstract: Optional[str] = None
+    overall_stage: Optional[str] = None
+    decision: Optional[str] = None
+    decision_timestamp: Optional[IsoTimestamp] = None
+    stages: List[VersionStageRecord] = attr.Factory(list)
+    authors: List[AuthorRecord] = attr.Factory(list)
+    reviewers: List[ReviewerRecord] = attr.Factory(list)
+    reviewing_editors: List[ReviewingEditorRecord] = attr.Factory(list)
+    senior_editors: List[SeniorEditorRecord] = attr.Factory(list)
+    potential_reviewers: List[PotentialPersonRecord] = attr.Factory(list)
+    potential_reviewing_editors: List[PotentialPersonRecord] = attr.Factory(list)
+    potential_senior_editors: List[PotentialPersonRecord] = attr.Factory(list)
+    author_funding: List[AuthorFundingRecord] = attr.Factory(list)
+    subject_areas: List[SubjectAreaRecord] = attr.Factory(list)
+    research_organisms: List[ResearchOrganismRecord] = attr.Factory(list)
+    keywords: List[KeywordRecord] = attr.Factory(list)
+    emails: List[EmailRecord] = attr.Factory(list)
+
+
+# person xml
+
+@attr.define(kw_only=True)
+class PersonV2ExternalReferenceRecord:
+    is_enabled: Optional[bool] = None
+    reference_type: Optional[str] = None
+    reference_value: Optional[str] = None
+    start_timestamp: Optional[IsoTimestamp] = None
+    end_timestamp: Optional[IsoTimestamp] = None
+    modified_timestamp: Optional[IsoTimestamp] = None
+    modified_by_person_id: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class PersonV2RoleRecord:
+    role_name: Optional[str] = None
+    is_enabled: Optional[bool] = None
+    start_timestamp: Optional[IsoTimestamp] = None
+    end_timestamp: Optional[IsoTimestamp] = None
+    modified_timestamp: Optional[IsoTimestamp] = None
+    modified_by_person_id: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class PersonV2AddressRecord:  # pylint: disable=too-many-instance-attributes
+    is_enabled: Optional[bool] = None
+    address_type: Optional[str] = None
+    country: Optional[str] = None
+    area: Optional[str] = None
+    city: Optional[str] = None
+    postal_code: Optional[str] = None
+    organization: Optional[str] = None
+    department: Optional[str] = None
+    division: Optional[str] = None
+    laboratory: Optional[str] = None
+    job_title: Optional[str] = None
+    email: Optional[str] = None
+    telephone: Optional[str] = None
+    address_line_1: Optional[str] = None
+    address_line_2: Optional[str] = None
+    address_line_3: Optional[str] = None
+    start_timestamp: Optional[IsoTimestamp] = None
+    end_timestamp: Optional[IsoTimestamp] = None
+
+
+@attr.define(kw_only=True)
+class DatesNotAvailableRecord:
+    start_timestamp: Optional[IsoTimestamp] = None
+    end_timestamp: Optional[IsoTimestamp] = None
+
+
+@attr.define(kw_only=True)
+class OrganizationRecord:
+    organization_id: Optional[str] = None
+    organization_name: Optional[str] = None
+    organization_type: Optional[str] = None
+
+
+@attr.define(kw_only=True)
+class PersonV2Record:  # pylint: disable=too-many-instance-attributes
+    provenance: Optional[Provenance] = None
+    person_id: Optional[str] = None
+    modified_timestamp: Optional[IsoTimestamp] = None
+    status: Optional[str] = None
+    title: Optional[str] = None
+    first_name: Optional[str] = None
+    middle_name: Optional[str] = None
+    last_name: Optional[str] = None
+    native_name: Optional[str] = None
+    institution: Optional[str] = None
+    email: Optional[str] = None
+    secondary_email: Optional[str] = None
+    external_references: List[PersonV2ExternalReferenceRecord] = attr.Factory(list)
+    addresses: List[PersonV2AddressRecord] = attr.Factory(list)
+    organizations: List[OrganizationRecord] = attr.Factory(list)
+    roles: List[PersonV2RoleRecord] = attr.Factory(list)
+    dates_not_available: List[DatesNotAvailableRecord] = attr.Factory(list)
+    keywords: List[str] = attr.Factory(list)
+    person_tags: List[str] = attr.Factory(list)
+    merged_into_person_ids: List[str] = attr.Factory(list)
+    research_organisms: List[str] = attr.Factory(list)
+    subject_areas: List[str] = attr.Factory(list)
@@ -0,0 +1,98 @@
+import json
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
+
+
+class ProcessedObjectManifest:
+    def __init__(self, entries: Optional[Iterable[dict]] = None):
+        self.entry_by_key: Dict[str, dict] = {}
+        for entry in entries or []:
+            self.entry_by_key[entry['key']] = entry
+
+    def is_processed(self, s3_object_meta: dict) -> bool:
+        entry = self.entry_by_key.get(
+            s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY]
+        )
+        return (
+            entry is not None
+            and entry['etag'] == s3_object_meta.get(
+                named_literals.S3_FILE_METADATA_ETAG_KEY
+            )
+            and entry['size'] == s3_object_meta.get(
+                named_literals.S3_FILE_METADATA_SIZE_KEY
+            )
+        )
+
+    def add(self, s3_object_meta: dict):
+        key = s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY]
+        self.entry_by_key[key] = {
+            'key': key,
+            'etag': s3_object_meta.get(named_literals.S3_FILE_METADATA_ETAG_KEY),
+            'size': s3_object_meta.get(named_literals.S3_FILE_METADATA_SIZE_KEY),
+            'last_modified': s3_object_meta[
+                named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY
+            ].isoformat()
+        }
+
+    def compact(self, watermark: datetime):
+        self.entry_by_key = {
+            key: entry
+            for key, entry in self.entry_by_key.items()
+            if datetime.fromisoformat(entry['last_modified']) >= watermark
+        }
+
+    @property
+    def last_processed_key(self) -> Optional[str]:
+        if not self.entry_by_key:
+            return None
+        return max(
+            self.entry_by_key.values(),
+            key=lambda entry: (
+                datetime.fromisoformat(entry['last_modified']), entry['key']
+            )
+        )['key']
+
+
+def get_last_processed_key(
+        processed_object_manifest: Optional[ProcessedObjectManifest]
+) -> Optional[str]:
+    if processed_object_manifest is None:
+        return None
+    return processed_object_manifest.last_processed_key
+
+
+def is_unprocessed_s3_object(
+        s3_object_meta: dict,
+        latest_file_deposit_datetime: datetime,
+        processed_object_manifest: Optional[ProcessedObjectManifest] = None
+) -> bool:
+    last_modified = s3_object_meta[
+        named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY
+    ]
+    if processed_object_manifest is None:
+        return last_modified > latest_file_deposit_datetime
+    return (
+        last_modified >= latest_file_deposit_datetime
+        and not processed_object_manifest.is_processed(s3_object_meta)
+    )
+
+
+def serialize_processed_object_manifest(
+        processed_object_manifest: ProcessedObjectManifest
+) -> str:
+    return ''.join(
+        json.dumps(entry, separators=(',', ':')) + '\n'
+        for entry in processed_object_manifest.entry_by_key.values()
+    )
+
+
+def deserialize_processed_object_manifest(
+        jsonl_string: str
+) -> ProcessedObjectManifest:
+    return ProcessedObjectManifest(
+        json.loads(line)
+        for line in jsonl_string.splitlines()
+        if line.strip()
+    )
@@ -0,0 +1,310 @@
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.data_store.s3_data_service import iter_s3_object_metas
+from ejp_xml_pipeline.etl import (
+    download_load2bq_cleanup_temp_files,
+    etl_ejp_xml_zip
+)
+from ejp_xml_pipeline.utils import (
+    NamedDataPipelineLiterals as named_literals,
+    get_yaml_file_as_dict
+)
+from ejp_xml_pipeline.utils.pattern_matcher import get_glob_pattern_matcher
+from ejp_xml_pipeline.utils.s3_key_partition import get_s3_key_pattern_prefix
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEPLOYMENT_ENV_ENV_NAME = "DEPLOYMENT_ENV"
+DEFAULT_DEPLOYMENT_ENV_VALUE = "ci"
+
+# keeps the temp files of a replay apart from the ones loaded by the dag
+REPLAY_TEMP_OBJECT_PREFIX_SUFFIX = "-replay"
+
+DEFAULT_PARALLELISM = 1
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_BQ_BATCH_SIZE_LIMIT = 100000
+
+COMPLETED_OBJECT_KEYS_CHECKPOINT_KEY = "completed_object_keys"
+
+
+def get_replay_data_config_dict(
+        data_config_dict: dict,
+        target_dataset: Optional[str] = None
+) -> dict:
+    temp_file_storage = data_config_dict.get("tempS3FileStorage", {})
+    replay_data_config_dict = {
+        **data_config_dict,
+        "tempS3FileStorage": {
+            **temp_file_storage,
+            "objectPrefix": (
+                temp_file_storage.get("objectPrefix", "").rstrip("/")
+                + REPLAY_TEMP_OBJECT_PREFIX_SUFFIX
+            )
+        },
+        # reprocess every member and leave the index used by the dag alone
+        "memberDigestIndex": {}
+    }
+    if target_dataset:
+        replay_data_config_dict["dataset"] = target_dataset
+    return replay_data_config_dict
+
+
+def load_checkpoint_completed_object_keys(
+        checkpoint_file_path: Optional[str]
+) -> Set[str]:
+    if not checkpoint_file_path or not os.path.isfile(checkpoint_file_path):
+        return set()
+    with open(checkpoint_file_path, "r", encoding="UTF-8") as checkpoint_file:
+        return set(json.load(checkpoint_file)[COMPLETED_OBJECT_KEYS_CHECKPOINT_KEY])
+
+
+def save_checkpoint_completed_object_keys(
+        checkpoint_file_path: Optional[str],
+        completed_object_keys: Set[str]
+):
+    if not checkpoint_file_path:
+        return
+    temp_checkpoint_file_path = checkpoint_file_path + ".tmp"
+    with open(temp_checkpoint_file_path, "w", encoding="UTF-8") as checkpoint_file:
+        json.dump(
+            {COMPLETED_OBJECT_KEYS_CHECKPOINT_KEY: sorted(completed_object_keys)},
+            checkpoint_file,
+            indent=2
+        )
+    # an interrupted write leaves the previous checkpoint intact
+    os.replace(temp_checkpoint_file_path, checkpoint_file_path)
+
+
+def iter_replay_object_keys_in_range(
+        data_config: eJPXmlDataConfig,
+        start_after: Optional[str] = None,
+        end_at: Optional[str] = None
+) -> Iterable[str]:
+    key_matcher = get_glob_pattern_matcher(data_config.s3_object_key_pattern)
+    for s3_object_meta in iter_s3_object_metas(
+            data_config.s3_bucket,
+            get_s3_key_pattern_prefix(data_config.s3_object_key_pattern)
+    ):
+        object_key = s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY]
+        if start_after and object_key <= start_after:
+            continue
+        if end_at and object_key > end_at:
+            break
+        if key_matcher(object_key):
+            yield object_key
+
+
+def iter_batches(items: Sequence[str], batch_size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), batch_size):
+        yield list(items[start:start + batch_size])
+
+
+def etl_replay_object_key(
+        data_config_dict: dict,
+        deployment_env: str,
+        object_key: str
+) -> Dict[str, List[str]]:
+    return etl_ejp_xml_zip(
+        eJPXmlDataConfig(data_config_dict, deployment_env),
+        object_key
+    )
+
+
+def load_replay_temp_objects_to_bq(
+        data_config: eJPXmlDataConfig,
+        uploaded_object_keys_by_entity_name_list: List[Dict[str, List[str]]],
+        bq_batch_size_limit: int
+):
+    for entity_type in data_config.entity_type_mapping.values():
+        temp_object_keys = [
+            temp_object_key
+            for uploaded_object_keys_by_entity_name
+            in uploaded_object_keys_by_entity_name_list
+            for temp_object_key in uploaded_object_keys_by_entity_name.get(
+                entity_type.file_name, []
+            )
+        ]
+        if not temp_object_keys:
+            continue
+        download_load2bq_cleanup_temp_files(
+            (
+                (
+                    {named_literals.S3_FILE_METADATA_NAME_KEY: temp_object_key},
+                    entity_type.s3_object_wildcard_prefix
+                )
+                for temp_object_key in temp_object_keys
+            ),
+            data_config.temp_file_s3_bucket,
+            data_config.gcp_project,
+            data_config.dataset,
+            entity_type.table_name,
+            bq_batch_size_limit,
+            json_schema=entity_type.json_schema
+        )
+
+
+# pylint: disable=too-many-arguments
+def run_replay(
+        data_config_dict: dict,
+        deployment_env: str,
+        object_keys: Sequence[str],
+        checkpoint_file_path: Optional[str] = None,
+        parallelism: int = DEFAULT_PARALLELISM,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        bq_batch_size_limit: int = DEFAULT_BQ_BATCH_SIZE_LIMIT
+):
+    data_config = eJPXmlDataConfig(data_config_dict, deployment_env)
+    completed_object_keys = load_checkpoint_completed_object_keys(
+        checkpoint_file_path
+    )
+    pending_object_keys = [
+        object_key
+        for object_key in object_keys
+        if object_key not in completed_object_keys
+    ]
+    LOGGER.info(
+        "replaying %d zips into %s (%d already completed)",
+        len(pending_object_keys),
+        data_config.dataset,
+        len(object_keys) - len(pending_object_keys)
+    )
+    etl_object_key = partial(
+        etl_replay_object_key, data_config_dict, deployment_env
+    )
+    executor_context = (
+        ProcessPoolExecutor(max_workers=parallelism)
+        if parallelism > 1
+        else nullcontext()
+    )
+    with executor_context as executor:
+        for batch_object_keys in iter_batches(pending_object_keys, batch_size):
+            uploaded_object_keys_by_entity_name_list = list(
+                map_object_keys(executor, etl_object_key, batch_object_keys)
+            )
+            load_replay_temp_objects_to_bq(
+                data_config,
+                uploaded_object_keys_by_entity_name_list,
+                bq_batch_size_limit
+            )
+            completed_object_keys.update(batch_object_keys)
+            save_checkpoint_completed_object_keys(
+                checkpoint_file_path, completed_object_keys
+            )
+            LOGGER.info(
+                "completed %d / %d zips",
+                len(completed_object_keys.intersection(object_keys)),
+                len(object_keys)
+            )
+
+
+def map_object_keys(
+        executor: Optional[Executor],
+        etl_object_key,
+        object_keys: List[str]
+) -> Iterable[Dict[str, List[str]]]:
+    if executor is None:
+        return map(etl_object_key, object_keys)
+    return executor.map(etl_object_key, object_keys)
+
+
+def get_object_keys_from_args(
+        args: argparse.Namespace,
+        data_config: eJPXmlDataConfig
+) -> List[str]:
+    object_keys = list(args.object_keys or [])
+    if args.object_keys_file:
+        object_keys.extend(
+            line.strip()
+            for line in Path(args.object_keys_file).read_text(
+                encoding="UTF-8"
+            ).splitlines()
+            if line.strip()
+        )
+    if object_keys:
+        return object_keys
+    return list(iter_replay_object_keys_in_range(
+        data_config, start_after=args.start_after, end_at=args.end_at
+    ))
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Reprocess eJP XML zips and load them into BigQuery"
+    )
+    parser.add_argument(
+        "--config-file",
+        default=os.getenv(named_literals.EJP_XML_CONFIG_FILE_PATH_ENV_NAME),
+        required=not os.getenv(named_literals.EJP_XML_CONFIG_FILE_PATH_ENV_NAME)
+    )
+    parser.add_argument(
+        "--deployment-env",
+        default=os.getenv(DEPLOYMENT_ENV_ENV_NAME, DEFAULT_DEPLOYMENT_ENV_VALUE)
+    )
+    parser.add_argument(
+        "--target-dataset",
+        help="dataset to load into, defaults to the configured dataset"
+    )
+    parser.add_argument("--object-keys", nargs="+")
+    parser.add_argument(
+        "--object-keys-file", help="file with one object key per line"
+    )
+    parser.add_argument(
+        "--start-after",
+        help="only replay zips with keys after this key (if no keys were passed in)"
+    )
+    parser.add_argument(
+        "--end-at",
+        help="only replay zips with keys up to this key (if no keys were passed in)"
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        help="local file recording completed zips, used to resume a replay"
+    )
+    parser.add_argument(
+        "--parallelism", type=int, default=DEFAULT_PARALLELISM,
+        help="number of zips processed in parallel"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="number of zips loaded into BigQuery together"
+    )
+    parser.add_argument(
+        "--bq-batch-size-limit", type=int, default=DEFAULT_BQ_BATCH_SIZE_LIMIT,
+        help="maximum number of rows per BigQuery load job"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    args = get_args_parser().parse_args(argv)
+    data_config_dict = get_replay_data_config_dict(
+        get_yaml_file_as_dict(args.config_file),
+        target_dataset=args.target_dataset
+    )
+    object_keys = get_object_keys_from_args(
+        args, eJPXmlDataConfig(data_config_dict, args.deployment_env)
+    )
+    run_replay(
+        data_config_dict,
+        args.deployment_env,
+        object_keys,
+        checkpoint_file_path=args.checkpoint_file,
+        parallelism=args.parallelism,
+        batch_size=args.batch_size,
+        bq_batch_size_limit=args.bq_batch_size_limit
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO")
+    main()
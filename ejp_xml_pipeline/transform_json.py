@@ -1,3 +1,18 @@
+import json
+from typing import Any, Optional
+
+from ejp_xml_pipeline.model.provenance import NodeProvenance
+from ejp_xml_pipeline.model.record_serializer import (
+    get_record_json_dict,
+    get_record_provenance
+)
+
+
+PROVENANCE_KEY = 'provenance'
+
+EMPTY_JSON_OBJECT = '{}'
+
+
 def remove_key_with_null_value(record):
     if isinstance(record, dict):
         for key in list(record):
@@ -13,3 +28,62 @@ def remove_key_with_null_value(record):
                 remove_key_with_null_value(val)
 
     return record
+
+
+def join_json_object_strings(json_object_str: str, other_json_object_str: str) -> str:
+    if json_object_str == EMPTY_JSON_OBJECT:
+        return other_json_object_str
+    if other_json_object_str == EMPTY_JSON_OBJECT:
+        return json_object_str
+    return json_object_str[:-1] + ', ' + other_json_object_str[1:]
+
+
+class ProvenanceJsonEncoder:
+    # entities of a document share the same provenance, it only needs to be encoded once
+    def __init__(self) -> None:
+        self._document_provenance: Optional[dict] = None
+        self._document_provenance_json: str = EMPTY_JSON_OBJECT
+
+    def get_document_provenance_json(self, document_provenance: dict) -> str:
+        if document_provenance is not self._document_provenance:
+            self._document_provenance = document_provenance
+            self._document_provenance_json = json.dumps(
+                remove_key_with_null_value(dict(document_provenance))
+            )
+        return self._document_provenance_json
+
+    def get_provenance_json(self, provenance) -> str:
+        if isinstance(provenance, NodeProvenance):
+            return join_json_object_strings(
+                self.get_document_provenance_json(provenance.document_provenance),
+                json.dumps(remove_key_with_null_value({
+                    'node_index': provenance.node_index
+                }))
+            )
+        return self.get_document_provenance_json(provenance)
+
+    def get_record_json(self, record: Any) -> str:
+        if not isinstance(record, dict):
+            return self.get_typed_record_json(record)
+        remove_key_with_null_value(record)
+        provenance = record.get(PROVENANCE_KEY)
+        if provenance is None:
+            return json.dumps(record)
+        record_without_provenance = dict(record)
+        del record_without_provenance[PROVENANCE_KEY]
+        return join_json_object_strings(
+            '{"' + PROVENANCE_KEY + '": ' + self.get_provenance_json(provenance) + '}',
+            json.dumps(record_without_provenance)
+        )
+
+    def get_typed_record_json(self, record: Any) -> str:
+        record_json = json.dumps(
+            get_record_json_dict(record, exclude_provenance=True)
+        )
+        provenance = get_record_provenance(record)
+        if not provenance:
+            return record_json
+        return join_json_object_strings(
+            '{"' + PROVENANCE_KEY + '": ' + self.get_provenance_json(provenance) + '}',
+            record_json
+        )
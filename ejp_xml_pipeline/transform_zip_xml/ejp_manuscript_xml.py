@@ -8,10 +8,15 @@ from typing import Optional, Tuple
 # pylint: disable=no-name-in-module
 from lxml.etree import Element
 
+from ejp_xml_pipeline.utils.xml_transform_util.string_interning import (
+    intern_string
+)
 from ejp_xml_pipeline.utils.xml_transform_util.xml import (
+    get_and_decode_interned_xml_child_text,
     get_and_decode_xml_child_text
 )
 from ejp_xml_pipeline.utils.xml_transform_util.timestamp import (
+    IsoTimestamp,
     format_to_iso_timestamp
 )
 from ejp_xml_pipeline.transform_zip_xml.parsed_document import ParsedDocument
@@ -21,6 +26,25 @@ from ejp_xml_pipeline.model.entities import (
     Manuscript,
     ManuscriptVersion
 )
+from ejp_xml_pipeline.model.records import (
+    AuthorFundingRecord,
+    AuthorRecord,
+    EmailRecord,
+    KeywordRecord,
+    ManuscriptRecord,
+    ManuscriptVersionRecord,
+    PersonAddressRecord,
+    PersonExternalReferenceRecord,
+    PersonRecord,
+    PersonRoleRecord,
+    PotentialPersonRecord,
+    ResearchOrganismRecord,
+    ReviewerRecord,
+    ReviewingEditorRecord,
+    SeniorEditorRecord,
+    SubjectAreaRecord,
+    VersionStageRecord
+)
 
 from ejp_xml_pipeline.utils.xml_transform_util.extract import (
     format_optional_to_iso_timestamp, extract_list
@@ -89,140 +113,140 @@ def filename_to_manuscript_number(filename):
     return os.path.splitext(os.path.basename(filename))[0]
 
 
-def membership_node_to_dict(membership_node: Element) -> dict:
-    return {
-        'reference_type': get_and_decode_xml_child_text(
+def membership_node_to_record(membership_node: Element) -> PersonExternalReferenceRecord:
+    return PersonExternalReferenceRecord(
+        reference_type=get_and_decode_interned_xml_child_text(
             membership_node, 'member-type'
         ),
-        'reference_value': get_and_decode_xml_child_text(
+        reference_value=get_and_decode_xml_child_text(
             membership_node, 'member-id'
         ),
-    }
+    )
 
 
-def role_node_to_dict(role_node: Element) -> dict:
-    return {
-        'role_name': get_and_decode_xml_child_text(role_node, 'role-type')
-    }
+def role_node_to_record(role_node: Element) -> PersonRoleRecord:
+    return PersonRoleRecord(
+        role_name=get_and_decode_interned_xml_child_text(role_node, 'role-type')
+    )
 
 
-def address_node_to_dict(address_node: Element) -> dict:
-    return {
-        'address_type': get_and_decode_xml_child_text(
+def address_node_to_record(address_node: Element) -> PersonAddressRecord:
+    return PersonAddressRecord(
+        address_type=get_and_decode_interned_xml_child_text(
             address_node, 'address-type'
         ),
-        'country': get_and_decode_xml_child_text(
+        country=get_and_decode_interned_xml_child_text(
             address_node, 'address-country'
         ),
-        'area': get_and_decode_xml_child_text(
+        area=get_and_decode_xml_child_text(
             address_node, 'address-state-province'
         ),
-        'city': get_and_decode_xml_child_text(address_node, 'address-city'),
-        'postal_code': get_and_decode_xml_child_text(
+        city=get_and_decode_xml_child_text(address_node, 'address-city'),
+        postal_code=get_and_decode_xml_child_text(
             address_node, 'address-zip-postal-code'
         ),
-        'department': get_and_decode_xml_child_text(
+        department=get_and_decode_xml_child_text(
             address_node, 'address-department'
         ),
-        'address_line_1': get_and_decode_xml_child_text(
+        address_line_1=get_and_decode_xml_child_text(
             address_node, 'address-street-address-1'
         ),
-        'address_line_2': get_and_decode_xml_child_text(
+        address_line_2=get_and_decode_xml_child_text(
             address_node, 'address-street-address-2'
         ),
-        'start_timestamp': format_optional_to_iso_timestamp(
+        start_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(address_node, 'address-start-date')
         ),
-        'end_timestamp': format_optional_to_iso_timestamp(
+        end_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(address_node, 'address-end-date')
         )
-    }
+    )
 
 
-def person_node_to_dict(
+def person_node_to_record(
         person_node: Element,
-        modified_timestamp_str: str,
-        provenance: dict) -> dict:
+        modified_timestamp_str: IsoTimestamp,
+        provenance: dict) -> PersonRecord:
     person_id = get_and_decode_xml_child_text(person_node, 'person-id')
     try:
-        return {
-            'person_id': person_id,
-            'provenance': provenance,
-            'modified_timestamp': format_to_iso_timestamp(
+        return PersonRecord(
+            person_id=person_id,
+            provenance=provenance,
+            modified_timestamp=format_to_iso_timestamp(
                 get_and_decode_xml_child_text(
                     person_node, 'profile-modify-date'
                 ) or modified_timestamp_str
             ),
-            'title': get_and_decode_xml_child_text(person_node, 'title'),
-            'first_name': get_and_decode_xml_child_text(
+            title=get_and_decode_xml_child_text(person_node, 'title'),
+            first_name=get_and_decode_xml_child_text(
                 person_node, 'first-name'
             ),
-            'middle_name': get_and_decode_xml_child_text(
+            middle_name=get_and_decode_xml_child_text(
                 person_node, 'middle-name'
             ),
-            'last_name': get_and_decode_xml_child_text(
+            last_name=get_and_decode_xml_child_text(
                 person_node, 'last-name'
             ),
-            'institution': get_and_decode_xml_child_text(
+            institution=get_and_decode_xml_child_text(
                 person_node, 'institution'
             ),
-            'email': get_and_decode_xml_child_text(person_node, 'email'),
-            'secondary_email': get_and_decode_xml_child_text(
+            email=get_and_decode_xml_child_text(person_node, 'email'),
+            secondary_email=get_and_decode_xml_child_text(
                 person_node, 'secondary_email'
             ),
-            'external_references': extract_list(
-                person_node, 'memberships/membership', membership_node_to_dict
+            external_references=extract_list(
+                person_node, 'memberships/membership', membership_node_to_record
             ),
-            'roles': extract_list(
-                person_node, 'roles/role', role_node_to_dict
+            roles=extract_list(
+                person_node, 'roles/role', role_node_to_record
             ),
-            'addresses': extract_list(
-                person_node, 'addresses/address', address_node_to_dict
+            addresses=extract_list(
+                person_node, 'addresses/address', address_node_to_record
             )
-        }
+        )
     except ValueError as exc:
         raise ValueError(
             f'failed to process person {person_id} due to {exc}'
         ) from exc
 
 
-def manuscript_node_to_dict(
+def manuscript_node_to_record(
         manuscript_node: Element,
-        modified_timestamp_str: str,
+        modified_timestamp_str: IsoTimestamp,
         provenance: dict,
-        manuscript_id: str,
-        long_manuscript_identifier: str) -> dict:
-    return {
-        'provenance': provenance,
-        'manuscript_id': manuscript_id,
-        'long_manuscript_identifier': long_manuscript_identifier,
-        'modified_timestamp': modified_timestamp_str,
-        'country': get_and_decode_xml_child_text(manuscript_node, 'country'),
-        'doi': get_and_decode_xml_child_text(
+        manuscript_id: Optional[str],
+        long_manuscript_identifier: Optional[str]) -> ManuscriptRecord:
+    return ManuscriptRecord(
+        provenance=provenance,
+        manuscript_id=manuscript_id,
+        long_manuscript_identifier=long_manuscript_identifier,
+        modified_timestamp=modified_timestamp_str,
+        country=get_and_decode_interned_xml_child_text(manuscript_node, 'country'),
+        doi=get_and_decode_xml_child_text(
             manuscript_node, 'production-data/production-data-doi'
         )
-    }
+    )
 
 
-def version_stage_node_to_dict(stage_node: Element) -> dict:
-    return {
-        'stage_timestamp': format_to_iso_timestamp(
+def version_stage_node_to_record(stage_node: Element) -> VersionStageRecord:
+    return VersionStageRecord(
+        stage_timestamp=format_to_iso_timestamp(
             get_and_decode_xml_child_text(stage_node, 'start-date')
         ),
-        'stage_name': get_and_decode_xml_child_text(stage_node, 'stage-name'),
-        'person_id': get_and_decode_xml_child_text(
+        stage_name=get_and_decode_interned_xml_child_text(stage_node, 'stage-name'),
+        person_id=get_and_decode_xml_child_text(
             stage_node, 'stage-affective-person-id'
         )
-    }
+    )
 
 
 def overall_stage_and_manuscript_type_from_full_manuscript_type(
         full_manuscript_type: str) -> Tuple[str, str]:
     if full_manuscript_type.startswith(INITIAL_SUBMISSION_TYPE_PREFIX):
         overall_stage = OverallStageNames.INITIAL_SUBMISSION
-        manuscript_type = full_manuscript_type[
+        manuscript_type = intern_string(full_manuscript_type[
             len(INITIAL_SUBMISSION_TYPE_PREFIX):
-        ].strip()
+        ].strip())
     else:
         overall_stage = OverallStageNames.FULL_SUBMISSION
         manuscript_type = full_manuscript_type
@@ -250,87 +274,87 @@ def manuscript_id_and_number_from_version_node(
     return manuscript_id, manuscript_number
 
 
-def author_node_to_dict(author_node: Element) -> dict:
-    return {
-        'person_id': get_and_decode_xml_child_text(
+def author_node_to_record(author_node: Element) -> AuthorRecord:
+    return AuthorRecord(
+        person_id=get_and_decode_xml_child_text(
             author_node, 'author-person-id'
         ),
-        'sequence': to_int(get_and_decode_xml_child_text(
+        sequence=to_int(get_and_decode_xml_child_text(
             author_node, 'author-seq'
         )),
-        'is_corresponding_author': to_bool(get_and_decode_xml_child_text(
+        is_corresponding_author=to_bool(get_and_decode_xml_child_text(
             author_node, 'is-corr'
         ))
-    }
+    )
 
 
-def reviewer_node_to_dict(
+def reviewer_node_to_record(
         reviewer_node: Element,
-        element_prefix: str) -> dict:
-    return {
-        'person_id': get_and_decode_xml_child_text(
+        element_prefix: str) -> ReviewerRecord:
+    return ReviewerRecord(
+        person_id=get_and_decode_xml_child_text(
             reviewer_node, element_prefix + 'person-id'
         ),
-        'sequence': to_int(get_and_decode_xml_child_text(
+        sequence=to_int(get_and_decode_xml_child_text(
             reviewer_node, element_prefix + 'sequence'
         )),
-        'started_timestamp': format_optional_to_iso_timestamp(
+        started_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 reviewer_node, element_prefix + 'started-date'
             )
         ),
-        'due_timestamp': format_optional_to_iso_timestamp(
+        due_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 reviewer_node, element_prefix + 'due-date'
             )
         ),
-        'next_chase_timestamp': format_optional_to_iso_timestamp(
+        next_chase_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 reviewer_node, element_prefix + 'next-chase-date'
             )
         ),
-        'received_timestamp': format_optional_to_iso_timestamp(
+        received_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 reviewer_node, element_prefix + 'received-date'
             )
         )
-    }
+    )
 
 
-def reviewing_editor_node_to_dict(
+def reviewing_editor_node_to_record(
         reviewing_editor_node: Element,
-        element_prefix: str) -> dict:
-    return {
-        'person_id': get_and_decode_xml_child_text(
+        element_prefix: str) -> ReviewingEditorRecord:
+    return ReviewingEditorRecord(
+        person_id=get_and_decode_xml_child_text(
             reviewing_editor_node,
             element_prefix + 'person-id'
         ),
-        'assigned_timestamp': format_optional_to_iso_timestamp(
+        assigned_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 reviewing_editor_node,
                 element_prefix + 'assigned-date'
             )
         ),
-        'due_timestamp': format_optional_to_iso_timestamp(
+        due_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 reviewing_editor_node,
                 element_prefix + 'decision-due-date'
             )
         )
-    }
+    )
 
 
-def senior_editor_node_to_dict(senior_editor_node: Element) -> dict:
-    return {
-        'person_id': get_and_decode_xml_child_text(
+def senior_editor_node_to_record(senior_editor_node: Element) -> SeniorEditorRecord:
+    return SeniorEditorRecord(
+        person_id=get_and_decode_xml_child_text(
             senior_editor_node, 'senior-editor-person-id'
         ),
-        'assigned_timestamp': format_optional_to_iso_timestamp(
+        assigned_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(
                 senior_editor_node, 'senior-editor-assigned-date'
             )
         )
-    }
+    )
 
 
 def _parse_yes_no(yes_no: str) -> Optional[bool]:
@@ -343,105 +367,106 @@ def _parse_yes_no(yes_no: str) -> Optional[bool]:
     return None
 
 
-def potential_person_node_to_dict(
+def potential_person_node_to_record(
         potential_person_node: Element,
-        element_prefix: str) -> dict:
-    return {
-        'person_id': get_and_decode_xml_child_text(
+        element_prefix: str) -> PotentialPersonRecord:
+    return PotentialPersonRecord(
+        person_id=get_and_decode_xml_child_text(
             potential_person_node, element_prefix + 'person-id'
         ),
-        'suggested_to_include': _parse_yes_no(get_and_decode_xml_child_text(
+        suggested_to_include=_parse_yes_no(get_and_decode_xml_child_text(
             potential_person_node, element_prefix + 'suggested-to-include'
         )),
-        'suggested_to_exclude': _parse_yes_no(get_and_decode_xml_child_text(
+        suggested_to_exclude=_parse_yes_no(get_and_decode_xml_child_text(
             potential_person_node, element_prefix + 'suggested-to-exclude'
         ))
-    }
+    )
 
 
-def author_funding_node_to_dict(author_funding_node: Element) -> dict:
-    return {
-        'author_person_id': get_and_decode_xml_child_text(
+def author_funding_node_to_record(author_funding_node: Element) -> AuthorFundingRecord:
+    return AuthorFundingRecord(
+        author_person_id=get_and_decode_xml_child_text(
             author_funding_node, 'author-person-id'
         ),
-        'sequence': to_int(
+        sequence=to_int(
             get_and_decode_xml_child_text(author_funding_node, 'funding-seq')
         ),
-        'funding_title': get_and_decode_xml_child_text(
+        funding_title=get_and_decode_xml_child_text(
             author_funding_node, 'funding-title'
         ),
-        'grant_reference': get_and_decode_xml_child_text(
+        grant_reference=get_and_decode_xml_child_text(
             author_funding_node, 'grant-reference-number'
         )
-    }
+    )
 
 
-def subject_area_node_to_dict(subject_area_node: Element) -> dict:
-    return {
-        'subject_area_name':
-            get_and_decode_xml_child_text(subject_area_node, 'theme')
-    }
+def subject_area_node_to_record(subject_area_node: Element) -> SubjectAreaRecord:
+    return SubjectAreaRecord(
+        subject_area_name=get_and_decode_xml_child_text(
+            subject_area_node, 'theme'
+        )
+    )
 
 
-def research_organism_node_to_dict(research_organism_node: Element) -> dict:
-    return {
-        'research_organism_name': get_and_decode_xml_child_text(
+def research_organism_node_to_record(research_organism_node: Element) -> ResearchOrganismRecord:
+    return ResearchOrganismRecord(
+        research_organism_name=get_and_decode_xml_child_text(
             research_organism_node, 'subject-area'
         )
-    }
+    )
 
 
-def keyword_node_to_dict(keyword_node: Element) -> dict:
-    return {
-        'keyword': get_and_decode_xml_child_text(keyword_node, 'word')
-    }
+def keyword_node_to_record(keyword_node: Element) -> KeywordRecord:
+    return KeywordRecord(
+        keyword=get_and_decode_xml_child_text(keyword_node, 'word')
+    )
 
 
-def email_node_to_dict(email_node: Element) -> dict:
-    return {
-        'from_email': get_and_decode_xml_child_text(email_node, 'email-from'),
-        'to_email': get_and_decode_xml_child_text(email_node, 'email-to'),
-        'cc_email': get_and_decode_xml_child_text(email_node, 'email-cc'),
-        'bcc_email': get_and_decode_xml_child_text(email_node, 'email-bcc'),
-        'email_timestamp': format_optional_to_iso_timestamp(
+def email_node_to_record(email_node: Element) -> EmailRecord:
+    return EmailRecord(
+        from_email=get_and_decode_xml_child_text(email_node, 'email-from'),
+        to_email=get_and_decode_xml_child_text(email_node, 'email-to'),
+        cc_email=get_and_decode_xml_child_text(email_node, 'email-cc'),
+        bcc_email=get_and_decode_xml_child_text(email_node, 'email-bcc'),
+        email_timestamp=format_optional_to_iso_timestamp(
             get_and_decode_xml_child_text(email_node, 'email-date')
         ),
-        'email_status': get_and_decode_xml_child_text(
+        email_status=get_and_decode_xml_child_text(
             email_node, 'email-draft'
         ),
-        'subject': get_and_decode_xml_child_text(email_node, 'email-subject'),
-        'from_person_id': get_and_decode_xml_child_text(
+        subject=get_and_decode_xml_child_text(email_node, 'email-subject'),
+        from_person_id=get_and_decode_xml_child_text(
             email_node, 'email-sender-person-id'
         ),
-        'to_person_id': get_and_decode_xml_child_text(
+        to_person_id=get_and_decode_xml_child_text(
             email_node, 'email-recipient-person-id'
         ),
-        'triggered_by_person_id': get_and_decode_xml_child_text(
+        triggered_by_person_id=get_and_decode_xml_child_text(
             email_node, 'email-triggered-by-person-id'
         )
-    }
+    )
 
 
 def derive_version_id_from_manuscript_id_and_created_timestamp(
         manuscript_id: str,
-        created_timestamp: str) -> str:
+        created_timestamp: Optional[str]) -> str:
     if not created_timestamp:
         return f'NotAcceptable {manuscript_id}/{created_timestamp}'
 
     return f'{manuscript_id}/{created_timestamp}'
 
 
-def version_node_to_dict(
+def version_node_to_record(
         version_node: Element,
-        modified_timestamp_str: str,
-        provenance: dict) -> dict:
+        modified_timestamp_str: IsoTimestamp,
+        provenance: dict) -> ManuscriptVersionRecord:
     stages = [
-        version_stage_node_to_dict(stage_node)
+        version_stage_node_to_record(stage_node)
         for stage_node in version_node.findall('history/stage')
     ]
     if stages:
         first_stage = stages[0]
-        created_timestamp = first_stage['stage_timestamp']
+        created_timestamp = first_stage.stage_timestamp
     else:
         created_timestamp = None
 
@@ -452,7 +477,7 @@ def version_node_to_dict(
         )
     )
 
-    full_manuscript_type = get_and_decode_xml_child_text(
+    full_manuscript_type = get_and_decode_interned_xml_child_text(
         version_node, 'manuscript-type'
     )
     overall_stage, manuscript_type = (
@@ -461,7 +486,7 @@ def version_node_to_dict(
         )
     )
 
-    decision = get_and_decode_xml_child_text(version_node, 'decision')
+    decision = get_and_decode_interned_xml_child_text(version_node, 'decision')
     decision_timestamp_str = get_and_decode_xml_child_text(
         version_node, 'decision-date'
     )
@@ -469,81 +494,81 @@ def version_node_to_dict(
         decision_timestamp_str
     ) if decision_timestamp_str else None
 
-    return {
-        'provenance': provenance,
-        'created_timestamp': created_timestamp,
-        'modified_timestamp': modified_timestamp_str,
-        'manuscript_id': manuscript_id,
-        'long_manuscript_identifier': manuscript_number,
-        'full_manuscript_type': full_manuscript_type,
-        'manuscript_type': manuscript_type,
-        'version_id': (
+    return ManuscriptVersionRecord(
+        provenance=provenance,
+        created_timestamp=created_timestamp,
+        modified_timestamp=modified_timestamp_str,
+        manuscript_id=manuscript_id,
+        long_manuscript_identifier=manuscript_number,
+        full_manuscript_type=full_manuscript_type,
+        manuscript_type=manuscript_type,
+        version_id=(
             derive_version_id_from_manuscript_id_and_created_timestamp(
                 manuscript_id, created_timestamp
             )
         ),
-        'manuscript_title': get_and_decode_xml_child_text(
+        manuscript_title=get_and_decode_xml_child_text(
             version_node, 'title'
         ),
-        'abstract': get_and_decode_xml_child_text(version_node, 'abstract'),
-        'overall_stage': overall_stage,
-        'decision': decision,
-        'decision_timestamp': decision_timestamp,
-        'stages': stages,
-        'authors': extract_list(
-            version_node, 'authors/author', author_node_to_dict
+        abstract=get_and_decode_xml_child_text(version_node, 'abstract'),
+        overall_stage=overall_stage,
+        decision=decision,
+        decision_timestamp=decision_timestamp,
+        stages=stages,
+        authors=extract_list(
+            version_node, 'authors/author', author_node_to_record
         ),
-        'reviewers': extract_list(
+        reviewers=extract_list(
             version_node, 'referees/referee',
-            partial(reviewer_node_to_dict, element_prefix='referee-')
+            partial(reviewer_node_to_record, element_prefix='referee-')
         ) + extract_list(
             version_node, 'reviewers/reviewer',
-            partial(reviewer_node_to_dict, element_prefix='reviewer-')
+            partial(reviewer_node_to_record, element_prefix='reviewer-')
         ),
-        'reviewing_editors': extract_list(
+        reviewing_editors=extract_list(
             version_node, 'editors/editor',
-            partial(reviewing_editor_node_to_dict, element_prefix='editor-')
+            partial(reviewing_editor_node_to_record, element_prefix='editor-')
         ) + extract_list(
             version_node, 'reviewing-editors/reviewing-editor',
-            partial(reviewing_editor_node_to_dict, element_prefix='reviewing-editor-')
+            partial(reviewing_editor_node_to_record, element_prefix='reviewing-editor-')
         ),
-        'senior_editors': extract_list(
+        senior_editors=extract_list(
             version_node, 'senior-editors/senior-editor',
-            senior_editor_node_to_dict
+            senior_editor_node_to_record
         ),
-        'potential_reviewers': extract_list(
+        potential_reviewers=extract_list(
             version_node, 'potential-referees/potential-referee',
-            partial(potential_person_node_to_dict, element_prefix='potential-referee-')
+            partial(potential_person_node_to_record, element_prefix='potential-referee-')
         ) + extract_list(
             version_node, 'potential-reviewers/potential-reviewer',
-            partial(potential_person_node_to_dict, element_prefix='potential-reviewer-')
+            partial(potential_person_node_to_record, element_prefix='potential-reviewer-')
         ),
-        'potential_reviewing_editors': extract_list(
+        potential_reviewing_editors=extract_list(
             version_node, 'potential-reviewing-editors/potential-reviewing-editor',
-            partial(potential_person_node_to_dict, element_prefix='potential-reviewing-editor-')
+            partial(potential_person_node_to_record, element_prefix='potential-reviewing-editor-')
         ),
-        'potential_senior_editors': extract_list(
+        potential_senior_editors=extract_list(
             version_node, 'potential-senior-editors/potential-senior-editor',
-            partial(potential_person_node_to_dict, element_prefix='potential-senior-editor-')
+            partial(potential_person_node_to_record, element_prefix='potential-senior-editor-')
         ),
-        'author_funding': extract_list(
+        author_funding=extract_list(
             version_node, 'author-funding/author-funding',
-            author_funding_node_to_dict
+            author_funding_node_to_record
         ),
-        'subject_areas': extract_list(
-            version_node, 'themes/theme', subject_area_node_to_dict
+        subject_areas=extract_list(
+            version_node, 'themes/theme', subject_area_node_to_record
         ),
-        'research_organisms': extract_list(
+        research_organisms=extract_list(
             version_node, 'subject-areas/subject-area',
-            research_organism_node_to_dict
+            research_organism_node_to_record
         ),
-        'keywords': extract_list(
-            version_node, 'keywords/keywords', keyword_node_to_dict
+        keywords=extract_list(
+            version_node, 'keywords/keywords', keyword_node_to_record
         ),
-        'emails': extract_list(
-            version_node, 'emails/email', email_node_to_dict
+        emails=extract_list(
+            version_node, 'emails/email', email_node_to_record
         )
-    }
+    )
 
 
 def is_manuscript_xml(xml_root: Element):
@@ -558,18 +583,18 @@ def parse_xml(
     person_nodes = xml_root.xpath('people/person')
     manuscript_node = xml_root.find('manuscript')
     version_nodes = xml_root.xpath('manuscript/version')
-    version_jsons = [
-        version_node_to_dict(
+    version_records = [
+        version_node_to_record(
             version_node,
             modified_timestamp_str=modified_timestamp_str,
             provenance=provenance
         )
         for version_node in version_nodes
     ]
-    if version_jsons:
-        manuscript_id = version_jsons[0]['manuscript_id']
+    if version_records:
+        manuscript_id = version_records[0].manuscript_id
         long_manuscript_identifier = (
-            version_jsons[0]['long_manuscript_identifier']
+            version_records[0].long_manuscript_identifier
         )
     else:
         long_manuscript_identifier = filename_to_manuscript_number(
@@ -581,14 +606,14 @@ def parse_xml(
     return ParsedManuscriptDocument(
         provenance=provenance,
         persons=[
-            Person(person_node_to_dict(
+            Person(person_node_to_record(
                 person_node,
                 modified_timestamp_str=modified_timestamp_str,
                 provenance=provenance
             ))
             for person_node in person_nodes
         ],
-        manuscript=Manuscript(manuscript_node_to_dict(
+        manuscript=Manuscript(manuscript_node_to_record(
             manuscript_node,
             modified_timestamp_str=modified_timestamp_str,
             provenance=provenance,
@@ -596,7 +621,7 @@ def parse_xml(
             long_manuscript_identifier=long_manuscript_identifier
         )),
         versions=[
-            ManuscriptVersion(version_json)
-            for version_json in version_jsons
+            ManuscriptVersion(version_record)
+            for version_record in version_records
         ]
     )
@@ -1,26 +1,59 @@
 import logging
+import time
+from contextlib import closing, nullcontext
+from io import BytesIO
 from zipfile import ZipFile
 from datetime import datetime
-from typing import List, Iterable, Optional
-import re
+from typing import Callable, Dict, Generator, List, Iterable, NamedTuple, Optional
 
 # pylint: disable=no-name-in-module
-from lxml.etree import Element, XMLParser
+from lxml.etree import Element, iterparse
 
 from ejp_xml_pipeline.utils.xml_transform_util\
     .timestamp import (
         parse_timestamp,
         format_to_iso_timestamp
     )
+from ejp_xml_pipeline.utils.xml_transform_util.string_interning import (
+    StringInternTable,
+    string_intern_table_scope
+)
 from ejp_xml_pipeline.utils.xml_transform_util.xml import (
-    get_xml_text, parse_xml_and_show_error_line
+    get_xml_error_count_by_type,
+    get_xml_text,
+    parse_xml_and_show_error_line
+)
+from ejp_xml_pipeline.utils.xml_transform_util.xml_parser_pool import (
+    XmlParserPool,
+    get_xml_parser_pool
 )
 from ejp_xml_pipeline.transform_zip_xml.parsed_document import ParsedDocument
 
 from ejp_xml_pipeline.transform_zip_xml.ejp_xml import parse_xml
+from ejp_xml_pipeline.transform_zip_xml.ejp_manuscript_xml import (
+    filename_to_manuscript_number
+)
+from ejp_xml_pipeline.etl_metrics import (
+    EtlCounterNames,
+    EtlMetrics,
+    EtlStageNames,
+    get_recovered_xml_error_counter_name
+)
+from ejp_xml_pipeline.member_digest_index import MemberDigestIndex
+from ejp_xml_pipeline.member_resource_report import MemberResourceReport
+from ejp_xml_pipeline.utils.pattern_matcher import get_regex_pattern_matcher
+from ejp_xml_pipeline.utils.read_ahead import iter_read_ahead
 
 LOGGER = logging.getLogger(__name__)
 
+ZIP_MANIFEST_FILENAME = 'go.xml'
+
+MAX_REPORTED_FILENAMES = 10
+
+
+class ZipManifestError(ValueError):
+    pass
+
 
 class ZipManifest:
     def __init__(self, modified_timestamp: datetime, filenames: List[str]):
@@ -28,47 +61,290 @@ class ZipManifest:
         self.filenames = filenames
 
 
-def parse_go_xml(xml_root: Element) -> ZipManifest:
+def iter_parse_go_xml(source) -> ZipManifest:
+    # only the file names and the create date are needed, without a full tree
+    filenames = []
+    context = iterparse(
+        source, events=('end',), tag='file_nm', recover=True, huge_tree=True
+    )
+    for _, node in context:
+        filenames.append(get_xml_text(node))
+        node.clear()
     return ZipManifest(
-        modified_timestamp=parse_timestamp(xml_root.attrib['create_date']),
-        filenames=[
-            get_xml_text(node)
-            for node in xml_root.findall('file_nm')
-        ]
+        modified_timestamp=parse_timestamp(context.root.attrib['create_date']),
+        filenames=filenames
     )
 
 
-def parse_zip_xml_root(zip_file: ZipFile, name: str) -> Element:
-    return parse_xml_and_show_error_line(
-        lambda: zip_file.open(name, 'r'),
-        parser=XMLParser(recover=True)
-    ).getroot()
+def read_zip_manifest(zip_file: ZipFile) -> ZipManifest:
+    with zip_file.open(ZIP_MANIFEST_FILENAME, 'r') as source:
+        return iter_parse_go_xml(source)
+
+
+class ZipManifestCheck(NamedTuple):
+    # listed in go.xml but not in the zip, e.g. due to a truncated upload
+    missing_filenames: List[str]
+    # in the zip but not listed in go.xml, these are not processed
+    unlisted_filenames: List[str]
+
+
+def check_zip_manifest(
+        zip_manifest: ZipManifest,
+        zip_filenames: Iterable[str]
+) -> ZipManifestCheck:
+    member_filenames = {
+        filename
+        for filename in zip_filenames
+        if filename != ZIP_MANIFEST_FILENAME and not filename.endswith('/')
+    }
+    listed_filenames = set(zip_manifest.filenames)
+    return ZipManifestCheck(
+        missing_filenames=[
+            filename
+            for filename in zip_manifest.filenames
+            if filename not in member_filenames
+        ],
+        unlisted_filenames=sorted(member_filenames - listed_filenames)
+    )
+
+
+def report_zip_manifest_check(
+        zip_manifest_check: ZipManifestCheck,
+        zip_filename: str,
+        etl_metrics: EtlMetrics
+):
+    if zip_manifest_check.missing_filenames:
+        LOGGER.warning(
+            'zip members listed in %s but missing (%s): %s',
+            ZIP_MANIFEST_FILENAME, zip_filename,
+            zip_manifest_check.missing_filenames[:MAX_REPORTED_FILENAMES]
+        )
+        etl_metrics.increment(
+            EtlCounterNames.MISSING_MEMBERS,
+            len(zip_manifest_check.missing_filenames)
+        )
+    if zip_manifest_check.unlisted_filenames:
+        LOGGER.warning(
+            'zip members not listed in %s (%s): %s',
+            ZIP_MANIFEST_FILENAME, zip_filename,
+            zip_manifest_check.unlisted_filenames[:MAX_REPORTED_FILENAMES]
+        )
+        etl_metrics.increment(
+            EtlCounterNames.UNLISTED_MEMBERS,
+            len(zip_manifest_check.unlisted_filenames)
+        )
+
+
+def increment_recovered_xml_error_counters(
+        error_count_by_type: Dict[str, int],
+        etl_metrics: EtlMetrics
+):
+    etl_metrics.increment(
+        EtlCounterNames.RECOVERED_XML_ERRORS, sum(error_count_by_type.values())
+    )
+    for error_type_name, count in error_count_by_type.items():
+        etl_metrics.increment(
+            get_recovered_xml_error_counter_name(error_type_name), count
+        )
+
+
+def parse_xml_bytes_root(
+        xml_bytes: bytes,
+        etl_metrics: Optional[EtlMetrics] = None,
+        filename: Optional[str] = None,
+        xml_parser_pool: Optional[XmlParserPool] = None
+) -> Element:
+    if xml_parser_pool is None:
+        xml_parser_pool = get_xml_parser_pool()
+    parser = xml_parser_pool.get_parser()
+    try:
+        xml_root = parse_xml_and_show_error_line(
+            lambda: BytesIO(xml_bytes),
+            track_lines=True,
+            parser=parser
+        ).getroot()
+    except ValueError as exception:
+        raise ValueError(f'{exception} (filename: {filename})') from exception
+    error_count_by_type = get_xml_error_count_by_type(parser.feed_error_log)
+    if error_count_by_type:
+        LOGGER.warning(
+            'recovered from xml errors: %s (%s)', error_count_by_type, filename
+        )
+        if etl_metrics is not None:
+            increment_recovered_xml_error_counters(error_count_by_type, etl_metrics)
+    return xml_root
+
+
+class ZipMemberContent(NamedTuple):
+    filename: str
+    data: bytes
+    inflate_seconds: float
+
+
+def read_zip_member(zip_file: ZipFile, filename: str) -> ZipMemberContent:
+    start_time = time.perf_counter()
+    data = zip_file.read(filename)
+    return ZipMemberContent(
+        filename=filename,
+        data=data,
+        inflate_seconds=time.perf_counter() - start_time
+    )
+
+
+def iter_read_zip_members(
+        zip_file: ZipFile,
+        filenames: Iterable[str],
+        read_ahead_queue_size: int = 0
+) -> Generator[ZipMemberContent, None, None]:
+    zip_members = (
+        read_zip_member(zip_file, filename)
+        for filename in filenames
+    )
+    if read_ahead_queue_size > 0:
+        # the next members are inflated (zlib releases the gil) while parsing
+        return iter_read_ahead(
+            zip_members, read_ahead_queue_size, thread_name='zip-read-ahead'
+        )
+    return zip_members
 
 
 def join_zip_and_xml_filename(zip_filename, xml_filename):
     return f'{zip_filename}/{xml_filename}'
 
 
+def _ignore_member_completed(_completed_member_count: int):
+    pass
+
+
+# pylint: disable=too-many-locals,too-many-arguments
 def iter_parse_xml_in_zip(
         zip_file: ZipFile,
         zip_filename: str,
-        xml_filename_exclusion_regex_pattern: Optional[str] = None
+        xml_filename_exclusion_regex_pattern: Optional[str] = None,
+        member_digest_index: Optional[MemberDigestIndex] = None,
+        etl_metrics: Optional[EtlMetrics] = None,
+        member_resource_report: Optional[MemberResourceReport] = None,
+        xml_parser_pool: Optional[XmlParserPool] = None,
+        read_ahead_queue_size: int = 0,
+        start_member_index: int = 0,
+        on_member_completed: Optional[Callable[[int], None]] = None
 ) -> Iterable[ParsedDocument]:
+    if etl_metrics is None:
+        etl_metrics = EtlMetrics(zip_filename)
+    if on_member_completed is None:
+        on_member_completed = _ignore_member_completed
+    if xml_parser_pool is None:
+        xml_parser_pool = get_xml_parser_pool()
     imported_timestamp_str = format_to_iso_timestamp(datetime.now())
-    zip_manifest = parse_go_xml(parse_zip_xml_root(zip_file, 'go.xml'))
-    filenames = zip_manifest.filenames
-    for filename in filenames:
-        if xml_filename_exclusion_regex_pattern:
-            if re.match(xml_filename_exclusion_regex_pattern, filename):
+    zip_manifest = read_zip_manifest(zip_file)
+    zip_manifest_check = check_zip_manifest(zip_manifest, zip_file.namelist())
+    report_zip_manifest_check(zip_manifest_check, zip_filename, etl_metrics)
+    xml_filename_exclusion_matcher = get_regex_pattern_matcher(
+        xml_filename_exclusion_regex_pattern
+    )
+    filenames = [
+        filename
+        for filename in zip_manifest.filenames
+        if not (
+            xml_filename_exclusion_matcher
+            and xml_filename_exclusion_matcher(filename)
+        )
+    ]
+    missing_filenames = set(zip_manifest_check.missing_filenames).intersection(
+        filenames
+    )
+    if missing_filenames:
+        # fail before parsing any of the members, rather than part way through
+        raise ZipManifestError(
+            f'{len(missing_filenames)} zip members listed in'
+            f' {ZIP_MANIFEST_FILENAME} are missing in {zip_filename}:'
+            f' {sorted(missing_filenames)[:MAX_REPORTED_FILENAMES]}'
+        )
+    if start_member_index:
+        LOGGER.info(
+            'resuming after %d of %d xml files (%s)',
+            start_member_index, len(filenames), zip_filename
+        )
+        etl_metrics.increment(EtlCounterNames.RESUMED_MEMBERS, start_member_index)
+    # repeated values across the documents of a zip share one string object
+    string_intern_table = StringInternTable()
+    with closing(iter_read_zip_members(
+            zip_file,
+            filenames[start_member_index:],
+            read_ahead_queue_size=read_ahead_queue_size
+    )) as zip_members:
+        for member_index, zip_member in enumerate(
+                (
+                    etl_metrics.iter_timed(
+                        zip_members, EtlStageNames.ZIP_READ_AHEAD_WAIT
+                    )
+                    if read_ahead_queue_size > 0
+                    else zip_members
+                ),
+                start=start_member_index
+        ):
+            filename = zip_member.filename
+            member_bytes = zip_member.data
+            etl_metrics.add_duration(
+                EtlStageNames.ZIP_INFLATE, zip_member.inflate_seconds
+            )
+            etl_metrics.increment(EtlCounterNames.XML_BYTES, len(member_bytes))
+            if (
+                    member_digest_index is not None
+                    and member_digest_index.should_skip_member(
+                        filename_to_manuscript_number(filename), member_bytes
+                    )
+            ):
+                LOGGER.debug('skipping unchanged xml: %s', filename)
+                etl_metrics.increment(EtlCounterNames.SKIPPED_DOCUMENTS)
+                on_member_completed(member_index + 1)
                 continue
-
-        source_filename = join_zip_and_xml_filename(zip_filename, filename)
-        provenance = {
-            'source_filename': source_filename,
-            'imported_timestamp': imported_timestamp_str
-        }
-        yield parse_xml(
-            parse_zip_xml_root(zip_file, filename),
-            modified_timestamp=zip_manifest.modified_timestamp,
-            provenance=provenance
+            source_filename = join_zip_and_xml_filename(zip_filename, filename)
+            provenance = {
+                'source_filename': source_filename,
+                'imported_timestamp': imported_timestamp_str
+            }
+            with (
+                    member_resource_report.measure(filename, len(member_bytes))
+                    if member_resource_report is not None
+                    else nullcontext()
+            ):
+                with etl_metrics.timer(EtlStageNames.XML_PARSE):
+                    xml_root = parse_xml_bytes_root(
+                        member_bytes,
+                        etl_metrics=etl_metrics,
+                        filename=source_filename,
+                        xml_parser_pool=xml_parser_pool
+                    )
+                with etl_metrics.timer(EtlStageNames.FIELD_MAPPING):
+                    with string_intern_table_scope(string_intern_table):
+                        parsed_document = parse_xml(
+                            xml_root,
+                            modified_timestamp=zip_manifest.modified_timestamp,
+                            provenance=provenance
+                        )
+            etl_metrics.increment(EtlCounterNames.DOCUMENTS)
+            yield parsed_document
+            # the consumer has processed the document once it asks for the next
+            on_member_completed(member_index + 1)
+    if string_intern_table.shared_count:
+        etl_metrics.increment(
+            EtlCounterNames.INTERNED_STRINGS, string_intern_table.shared_count
+        )
+        etl_metrics.increment(
+            EtlCounterNames.INTERNED_STRING_BYTES, string_intern_table.shared_bytes
+        )
+    LOGGER.info(
+        'shared %d repeated strings (%d bytes) using %d distinct values (%s)',
+        string_intern_table.shared_count,
+        string_intern_table.shared_bytes,
+        len(string_intern_table),
+        zip_filename
+    )
+    if member_digest_index is not None:
+        LOGGER.info(
+            'skipped %d unchanged xml files, processed %d xml files (%s)',
+            member_digest_index.skipped_count,
+            member_digest_index.processed_count,
+            zip_filename
         )
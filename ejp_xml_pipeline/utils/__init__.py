@@ -7,6 +7,8 @@ class NamedDataPipelineLiterals:
     DAG_RUNNING_STATUS = 'running'
     S3_FILE_METADATA_NAME_KEY = "Key"
     S3_FILE_METADATA_LAST_MODIFIED_KEY = "LastModified"
+    S3_FILE_METADATA_ETAG_KEY = "ETag"
+    S3_FILE_METADATA_SIZE_KEY = "Size"
     DEFAULT_AWS_CONN_ID = "aws_default"
     EJP_XML_CONFIG_FILE_PATH_ENV_NAME = (
         "EJP_XML_CONFIG_FILE_PATH"
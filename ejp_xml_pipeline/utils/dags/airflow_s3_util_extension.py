@@ -1,18 +1,18 @@
 import os
-import fnmatch
-import re
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-from typing import Iterable
-
-from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+from airflow.exceptions import AirflowException
 from airflow.sensors.base import BaseSensorOperator
 from airflow.utils.decorators import apply_defaults
 
+from ejp_xml_pipeline.dag_pipeline_config.config_loader import load_data_config
 from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
-from ejp_xml_pipeline.utils import (
-    NamedDataPipelineLiterals as NamedLiterals,
-    get_yaml_file_as_dict
+from ejp_xml_pipeline.processed_object_manifest import ProcessedObjectManifest
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as NamedLiterals
+from ejp_xml_pipeline.utils.s3_object_snapshot import (
+    NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY,
+    get_new_s3_objects_snapshot
 )
 
 
@@ -25,15 +25,21 @@ class S3NewKeyFromLastDataDownloadDateSensor(BaseSensorOperator):
             default_initial_s3_last_modified_date,
             deployment_environment,
             *args,
+            processed_object_manifest_extract_from_config_callable=None,
             aws_conn_id=NamedLiterals.DEFAULT_AWS_CONN_ID,
             verify=None,
+            deferrable: bool = False,
             **kwargs
     ):
         super().__init__(*args, **kwargs)
 
+        self.deferrable = deferrable
         self.object_state_info_extract_from_config_callable = (
             state_info_extract_from_config_callable
         )
+        self.processed_object_manifest_extract_from_config_callable = (
+            processed_object_manifest_extract_from_config_callable
+        )
         self.aws_conn_id = aws_conn_id
         self.verify = verify
         self.default_initial_s3_last_modified_date = (
@@ -41,98 +47,120 @@ class S3NewKeyFromLastDataDownloadDateSensor(BaseSensorOperator):
         )
         self.deployment_environment = deployment_environment
 
-    def poke(self, context):
-        conf_file_path = os.getenv(
+    def get_data_config(self) -> eJPXmlDataConfig:
+        conf_file_path = os.environ[
             NamedLiterals.EJP_XML_CONFIG_FILE_PATH_ENV_NAME
+        ]
+        return load_data_config(
+            conf_file_path,
+            self.deployment_environment
         )
-        data_config_dict = get_yaml_file_as_dict(
-            conf_file_path
+
+    def get_processed_object_manifest(
+            self,
+            data_config: eJPXmlDataConfig
+    ) -> Optional[ProcessedObjectManifest]:
+        if not self.processed_object_manifest_extract_from_config_callable:
+            return None
+        return self.processed_object_manifest_extract_from_config_callable(
+            data_config
         )
-        data_config = eJPXmlDataConfig(
-            data_config_dict,
-            self.deployment_environment
+
+    def push_new_s3_objects_snapshot(self, context, snapshot: dict):
+        context['ti'].xcom_push(
+            key=NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY,
+            value=snapshot
         )
 
+    def poke(self, context):
+        data_config = self.get_data_config()
+
         s3_bucket = data_config.s3_bucket
         bucket_key_wildcard_pattern_with_latest_date = (
             self.object_state_info_extract_from_config_callable(
                 data_config,
                 self.default_initial_s3_last_modified_date)
         )
+        processed_object_manifest = self.get_processed_object_manifest(
+            data_config
+        )
+        # pylint: disable=import-outside-toplevel
+        from ejp_xml_pipeline.utils.dags.s3_new_file_monitor import (
+            S3HookNewFileMonitor
+        )
         hook = S3HookNewFileMonitor(
-            aws_conn_id=self.aws_conn_id, verify=self.verify
+            aws_conn_id=self.aws_conn_id, verify=self.verify,
+            date_partitioned_listing=data_config.date_partitioned_s3_listing,
+            max_list_workers=data_config.s3_listing_max_concurrency,
+            probe_max_keys=data_config.s3_listing_probe_max_keys
         )
         self.log.info("Poking for keys in s3 bucket")
-        return hook.is_new_file_present(
-            bucket_key_wildcard_pattern_with_latest_date, s3_bucket
+        new_object_key_names = hook.get_new_object_key_names(
+            bucket_key_wildcard_pattern_with_latest_date, s3_bucket,
+            processed_object_manifest=processed_object_manifest
         )
-
-
-class S3HookNewFileMonitor(S3Hook):
-    def is_new_file_present(
-            self,
-            bucket_key_wildcard_pattern_with_latest_date: dict,
-            bucket_name: str,
-    ):
-        object_key_names_iter = self.iter_filter_s3_object_meta_after(
-            bucket_key_wildcard_pattern_with_latest_date,
-            bucket_name
+        if not any(new_object_key_names.values()):
+            return False
+        self.push_new_s3_objects_snapshot(
+            context,
+            get_new_s3_objects_snapshot(
+                new_object_key_names,
+                snapshot_timestamp=datetime.now(timezone.utc)
+            )
         )
-        for _ in object_key_names_iter:
-            return True
-
-        return False
+        return True
 
-    def get_new_object_key_names(
-            self,
-            bucket_key_wildcard_pattern_with_latest_date: dict,
-            bucket_name: str
-    ):
-        new_object_key_names = defaultdict(list)
-        object_key_names_iter = self.iter_filter_s3_object_meta_after(
-            bucket_key_wildcard_pattern_with_latest_date,
-            bucket_name
+    def get_trigger(self):
+        # pylint: disable=import-outside-toplevel
+        from ejp_xml_pipeline.utils.dags.s3_new_key_trigger import (
+            S3NewKeyFromLastDataDownloadDateTrigger,
+            to_serializable_latest_dates
+        )
+        data_config = self.get_data_config()
+        processed_object_manifest = self.get_processed_object_manifest(
+            data_config
+        )
+        return S3NewKeyFromLastDataDownloadDateTrigger(
+            bucket_name=data_config.s3_bucket,
+            bucket_key_wildcard_pattern_with_latest_date=(
+                to_serializable_latest_dates(
+                    self.object_state_info_extract_from_config_callable(
+                        data_config,
+                        self.default_initial_s3_last_modified_date
+                    )
+                )
+            ),
+            processed_object_manifest_entries=(
+                list(processed_object_manifest.entry_by_key.values())
+                if processed_object_manifest is not None
+                else None
+            ),
+            date_partitioned_listing=data_config.date_partitioned_s3_listing,
+            aws_conn_id=self.aws_conn_id,
+            verify=self.verify,
+            poke_interval=self.poke_interval
         )
-        for bucket_key_pattern, key_object in object_key_names_iter:
-            new_object_key_names[bucket_key_pattern].append(key_object)
-
-        return new_object_key_names
-
-    def iter_filter_s3_object_meta_after(
-            self,
-            bucket_key_wildcard_pattern_with_latest_date: dict,
-            bucket_name: str,
-            delimiter="",
-            page_size=None,
-            max_items=None,
-    ) -> Iterable[tuple]:
 
-        config = {
-            "PageSize": page_size,
-            "MaxItems": max_items,
-        }
-        for (
-                bucket_key_pattern,
-                latest_file_deposit_datetime,
-        ) in bucket_key_wildcard_pattern_with_latest_date.items():
-            prefix = re.split(r"[*]", bucket_key_pattern, 1)[0]
+    def execute(self, context):
+        if not self.deferrable:
+            return super().execute(context)
+        # check once in the worker, only defer if there is nothing to do yet
+        if self.poke(context):
+            return None
+        self.defer(
+            trigger=self.get_trigger(),
+            method_name='execute_complete',
+            timeout=timedelta(seconds=self.timeout)
+        )
+        return None
 
-            paginator = self.get_conn().get_paginator("list_objects_v2")
-            response = paginator.paginate(
-                Bucket=bucket_name,
-                Prefix=prefix,
-                Delimiter=delimiter,
-                PaginationConfig=config,
+    def execute_complete(self, context, event: Optional[dict] = None):
+        # pylint: disable=import-outside-toplevel
+        from ejp_xml_pipeline.utils.dags.s3_new_key_trigger import (
+            TRIGGER_EVENT_STATUS_SUCCESS
+        )
+        if not event or event.get('status') != TRIGGER_EVENT_STATUS_SUCCESS:
+            raise AirflowException(
+                f"S3 new key trigger failed: {event}"
             )
-            for page in response:
-                if "Contents" in page:
-                    for key_object in page["Contents"]:
-                        if (
-                                key_object["LastModified"]
-                                > latest_file_deposit_datetime
-                                and
-                                fnmatch.fnmatch(
-                                    key_object["Key"], bucket_key_pattern
-                                )
-                        ):
-                            yield bucket_key_pattern, key_object
+        self.push_new_s3_objects_snapshot(context, event['snapshot'])
@@ -1,6 +1,13 @@
+import cProfile
+import functools
+import io
 import logging
+import marshal
 import json
+import os
+import pstats
 from datetime import timedelta
+from typing import Callable, Optional
 
 import airflow
 from airflow.operators.python import PythonOperator
@@ -9,6 +16,13 @@ from airflow.utils import timezone
 
 LOGGER = logging.getLogger(__name__)
 
+PROFILE_TASKS_ENV_VAR_NAME = "DATA_PIPELINE_PROFILE_TASKS"
+PROFILE_TASKS_DAG_RUN_CONF_KEY = "profile_tasks"
+PROFILE_ALL_TASKS_VALUES = {"true", "all", "*"}
+PROFILE_LOG_STATS_LIMIT = 30
+
+ProfileOutputHandler = Callable[[bytes, dict], None]
+
 
 def get_default_args():
 
@@ -20,11 +34,75 @@ def get_default_args():
     }
 
 
+def is_task_selected_for_profiling(profile_tasks_value, task_id: str) -> bool:
+    if not profile_tasks_value:
+        return False
+    if profile_tasks_value is True:
+        return True
+    if isinstance(profile_tasks_value, str):
+        profile_tasks_value = profile_tasks_value.split(",")
+    task_ids = {str(value).strip() for value in profile_tasks_value}
+    return task_id in task_ids or bool(
+        {task_id.lower() for task_id in task_ids} & PROFILE_ALL_TASKS_VALUES
+    )
+
+
+def is_task_profiling_enabled(context: dict) -> bool:
+    task_id = context["task"].task_id
+    dag_run = context.get("dag_run")
+    dag_run_conf = (dag_run.conf if dag_run else None) or {}
+    return is_task_selected_for_profiling(
+        os.getenv(PROFILE_TASKS_ENV_VAR_NAME), task_id
+    ) or is_task_selected_for_profiling(
+        dag_run_conf.get(PROFILE_TASKS_DAG_RUN_CONF_KEY), task_id
+    )
+
+
+def get_profile_stats_text(profile: cProfile.Profile) -> str:
+    stats_text = io.StringIO()
+    pstats.Stats(profile, stream=stats_text).sort_stats(
+        pstats.SortKey.CUMULATIVE
+    ).print_stats(PROFILE_LOG_STATS_LIMIT)
+    return stats_text.getvalue()
+
+
+def get_profile_bytes(profile: cProfile.Profile) -> bytes:
+    profile.create_stats()
+    # same format as cProfile's output file, readable with pstats or snakeviz
+    return marshal.dumps(profile.stats)  # type: ignore[attr-defined]
+
+
+def get_profiled_python_callable(
+        python_callable: Callable,
+        profile_output_handler: ProfileOutputHandler
+) -> Callable:
+    @functools.wraps(python_callable)
+    def profiled_python_callable(**context):
+        if not is_task_profiling_enabled(context):
+            return python_callable(**context)
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(python_callable, **context)
+        finally:
+            LOGGER.info("task profile:\n%s", get_profile_stats_text(profile))
+            try:
+                profile_output_handler(get_profile_bytes(profile), context)
+            except Exception:  # pylint: disable=broad-except
+                # the profile is only diagnostic, never fail the task because of it
+                LOGGER.exception("failed to handle task profile")
+    return profiled_python_callable
+
+
 # pylint: disable=too-many-arguments
 def create_python_task(
         dag, task_id, python_callable,
-        trigger_rule="all_success", retries=0, email_on_failure=False
+        trigger_rule="all_success", retries=0, email_on_failure=False,
+        profile_output_handler: Optional[ProfileOutputHandler] = None
 ):
+    if profile_output_handler is not None:
+        python_callable = get_profiled_python_callable(
+            python_callable, profile_output_handler
+        )
     return PythonOperator(
         task_id=task_id,
         dag=dag,
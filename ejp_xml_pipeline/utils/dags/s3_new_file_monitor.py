@@ -0,0 +1,220 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property
+
+from typing import Iterable, List, Optional
+
+from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+
+from ejp_xml_pipeline.data_store.local_s3_data_service import get_local_s3_root_dir
+from ejp_xml_pipeline.data_store.s3_backend import S3Backend
+from ejp_xml_pipeline.data_store.s3_data_service import create_s3_backend
+from ejp_xml_pipeline.processed_object_manifest import (
+    ProcessedObjectManifest,
+    get_last_processed_key,
+    is_unprocessed_s3_object
+)
+from ejp_xml_pipeline.utils.pattern_matcher import get_glob_pattern_matcher
+from ejp_xml_pipeline.utils.s3_key_partition import (
+    S3KeyPartition,
+    get_probe_s3_key_partition,
+    get_s3_key_partitions
+)
+
+
+DEFAULT_MAX_LIST_WORKERS = 4
+
+
+# pylint: disable=too-many-arguments
+class S3HookNewFileMonitor(S3Hook):
+    def __init__(
+            self,
+            *args,
+            date_partitioned_listing: bool = False,
+            max_list_workers: int = DEFAULT_MAX_LIST_WORKERS,
+            probe_max_keys: Optional[int] = None,
+            **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.date_partitioned_listing = date_partitioned_listing
+        self.max_list_workers = max_list_workers
+        self.probe_max_keys = probe_max_keys
+
+    @cached_property
+    def s3_backend(self) -> S3Backend:
+        # using the hook's connection, unless a local backend is configured
+        return create_s3_backend(
+            get_local_s3_root_dir(), s3_client_factory=self.get_conn
+        )
+
+    def probe_new_file_present(
+            self,
+            bucket_key_pattern: str,
+            latest_file_deposit_datetime: datetime,
+            bucket_name: str,
+            processed_object_manifest: Optional[ProcessedObjectManifest] = None
+    ) -> Optional[bool]:
+        # returns None if the probe is inconclusive and a full listing is needed
+        if not self.probe_max_keys:
+            return None
+        partition = get_probe_s3_key_partition(
+            bucket_key_pattern,
+            get_last_processed_key(processed_object_manifest)
+        )
+        if not partition:
+            return None
+        key_objects, is_truncated = self.s3_backend.list_object_metas(
+            bucket_name,
+            prefix=partition.prefix,
+            start_after=partition.start_after,
+            max_keys=self.probe_max_keys
+        )
+        bucket_key_matcher = get_glob_pattern_matcher(bucket_key_pattern)
+        for key_object in key_objects:
+            if (
+                    is_unprocessed_s3_object(
+                        key_object,
+                        latest_file_deposit_datetime,
+                        processed_object_manifest
+                    )
+                    and
+                    bucket_key_matcher(key_object["Key"])
+            ):
+                return True
+        if is_truncated:
+            return None
+        self.log.info("Probe found no new keys for %s", bucket_key_pattern)
+        return False
+
+    def get_bucket_key_patterns_to_list(
+            self,
+            bucket_key_wildcard_pattern_with_latest_date: dict,
+            bucket_name: str,
+            processed_object_manifest: Optional[ProcessedObjectManifest] = None
+    ) -> dict:
+        return {
+            bucket_key_pattern: latest_file_deposit_datetime
+            for (
+                bucket_key_pattern,
+                latest_file_deposit_datetime
+            ) in bucket_key_wildcard_pattern_with_latest_date.items()
+            if self.probe_new_file_present(
+                bucket_key_pattern,
+                latest_file_deposit_datetime,
+                bucket_name,
+                processed_object_manifest=processed_object_manifest
+            ) is not False
+        }
+
+    def get_new_object_key_names(
+            self,
+            bucket_key_wildcard_pattern_with_latest_date: dict,
+            bucket_name: str,
+            processed_object_manifest: Optional[ProcessedObjectManifest] = None
+    ):
+        new_object_key_names = defaultdict(list)
+        object_key_names_iter = self.iter_filter_s3_object_meta_after(
+            self.get_bucket_key_patterns_to_list(
+                bucket_key_wildcard_pattern_with_latest_date,
+                bucket_name,
+                processed_object_manifest=processed_object_manifest
+            ),
+            bucket_name,
+            processed_object_manifest=processed_object_manifest
+        )
+        for bucket_key_pattern, key_object in object_key_names_iter:
+            new_object_key_names[bucket_key_pattern].append(key_object)
+
+        return new_object_key_names
+
+    def get_s3_key_partitions(
+            self,
+            bucket_key_pattern: str,
+            processed_object_manifest: Optional[ProcessedObjectManifest]
+    ) -> List[S3KeyPartition]:
+        return get_s3_key_partitions(
+            bucket_key_pattern,
+            get_last_processed_key(processed_object_manifest),
+            end_date=datetime.now(timezone.utc),
+            date_partitioned_listing=self.date_partitioned_listing
+        )
+
+    def iter_s3_object_meta_in_partition(
+            self,
+            bucket_name: str,
+            partition: S3KeyPartition,
+            delimiter="",
+            page_size=None,
+            max_items=None
+    ) -> Iterable[dict]:
+        yield from self.s3_backend.iter_object_metas(
+            bucket_name,
+            prefix=partition.prefix,
+            start_after=partition.start_after,
+            delimiter=delimiter,
+            page_size=page_size,
+            max_items=max_items
+        )
+
+    def iter_s3_object_meta_in_partitions(
+            self,
+            bucket_name: str,
+            partitions: List[S3KeyPartition],
+            **kwargs
+    ) -> Iterable[dict]:
+        if len(partitions) == 1:
+            yield from self.iter_s3_object_meta_in_partition(
+                bucket_name, partitions[0], **kwargs
+            )
+            return
+        self.log.info("Listing %d s3 key partitions", len(partitions))
+        with ThreadPoolExecutor(
+                max_workers=min(len(partitions), self.max_list_workers)
+        ) as executor:
+            for s3_object_metas in executor.map(
+                    lambda partition: list(
+                        self.iter_s3_object_meta_in_partition(
+                            bucket_name, partition, **kwargs
+                        )
+                    ),
+                    partitions
+            ):
+                yield from s3_object_metas
+
+    def iter_filter_s3_object_meta_after(
+            self,
+            bucket_key_wildcard_pattern_with_latest_date: dict,
+            bucket_name: str,
+            delimiter="",
+            page_size=None,
+            max_items=None,
+            processed_object_manifest: Optional[ProcessedObjectManifest] = None
+    ) -> Iterable[tuple]:
+
+        for (
+                bucket_key_pattern,
+                latest_file_deposit_datetime,
+        ) in bucket_key_wildcard_pattern_with_latest_date.items():
+            partitions = self.get_s3_key_partitions(
+                bucket_key_pattern, processed_object_manifest
+            )
+            bucket_key_matcher = get_glob_pattern_matcher(bucket_key_pattern)
+            key_objects = self.iter_s3_object_meta_in_partitions(
+                bucket_name,
+                partitions,
+                delimiter=delimiter,
+                page_size=page_size,
+                max_items=max_items
+            )
+            for key_object in key_objects:
+                if (
+                        is_unprocessed_s3_object(
+                            key_object,
+                            latest_file_deposit_datetime,
+                            processed_object_manifest
+                        )
+                        and
+                        bucket_key_matcher(key_object["Key"])
+                ):
+                    yield bucket_key_pattern, key_object
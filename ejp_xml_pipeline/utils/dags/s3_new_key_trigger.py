@@ -0,0 +1,177 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+from ejp_xml_pipeline.processed_object_manifest import (
+    ProcessedObjectManifest,
+    get_last_processed_key,
+    is_unprocessed_s3_object
+)
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as NamedLiterals
+from ejp_xml_pipeline.utils.pattern_matcher import get_glob_pattern_matcher
+from ejp_xml_pipeline.utils.s3_key_partition import (
+    S3KeyPartition,
+    get_list_objects_partition_kwargs,
+    get_s3_key_partitions
+)
+from ejp_xml_pipeline.utils.s3_object_snapshot import get_new_s3_objects_snapshot
+
+
+TRIGGER_EVENT_STATUS_SUCCESS = 'success'
+TRIGGER_EVENT_STATUS_ERROR = 'error'
+
+
+def to_serializable_latest_dates(
+        bucket_key_wildcard_pattern_with_latest_date: dict
+) -> Dict[str, str]:
+    return {
+        bucket_key_pattern: latest_file_deposit_datetime.isoformat()
+        for bucket_key_pattern, latest_file_deposit_datetime
+        in bucket_key_wildcard_pattern_with_latest_date.items()
+    }
+
+
+def from_serializable_latest_dates(
+        serializable_latest_dates: Dict[str, str]
+) -> Dict[str, datetime]:
+    return {
+        bucket_key_pattern: datetime.fromisoformat(latest_file_deposit_datetime)
+        for bucket_key_pattern, latest_file_deposit_datetime
+        in serializable_latest_dates.items()
+    }
+
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes
+class S3NewKeyFromLastDataDownloadDateTrigger(BaseTrigger):
+    def __init__(
+            self,
+            bucket_name: str,
+            bucket_key_wildcard_pattern_with_latest_date: Dict[str, str],
+            processed_object_manifest_entries: Optional[List[dict]] = None,
+            date_partitioned_listing: bool = False,
+            aws_conn_id: str = NamedLiterals.DEFAULT_AWS_CONN_ID,
+            verify=None,
+            poke_interval: float = 60.0
+    ):
+        super().__init__()
+        self.bucket_name = bucket_name
+        self.bucket_key_wildcard_pattern_with_latest_date = (
+            bucket_key_wildcard_pattern_with_latest_date
+        )
+        self.processed_object_manifest_entries = processed_object_manifest_entries
+        self.date_partitioned_listing = date_partitioned_listing
+        self.aws_conn_id = aws_conn_id
+        self.verify = verify
+        self.poke_interval = poke_interval
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            f'{self.__class__.__module__}.{self.__class__.__name__}',
+            {
+                'bucket_name': self.bucket_name,
+                'bucket_key_wildcard_pattern_with_latest_date': (
+                    self.bucket_key_wildcard_pattern_with_latest_date
+                ),
+                'processed_object_manifest_entries': (
+                    self.processed_object_manifest_entries
+                ),
+                'date_partitioned_listing': self.date_partitioned_listing,
+                'aws_conn_id': self.aws_conn_id,
+                'verify': self.verify,
+                'poke_interval': self.poke_interval
+            }
+        )
+
+    @cached_property
+    def hook(self) -> S3Hook:
+        return S3Hook(aws_conn_id=self.aws_conn_id, verify=self.verify)
+
+    @cached_property
+    def processed_object_manifest(self) -> Optional[ProcessedObjectManifest]:
+        if self.processed_object_manifest_entries is None:
+            return None
+        return ProcessedObjectManifest(self.processed_object_manifest_entries)
+
+    def get_s3_key_partitions(self, bucket_key_pattern: str) -> List[S3KeyPartition]:
+        return get_s3_key_partitions(
+            bucket_key_pattern,
+            get_last_processed_key(self.processed_object_manifest),
+            end_date=datetime.now(timezone.utc),
+            date_partitioned_listing=self.date_partitioned_listing
+        )
+
+    async def list_s3_object_meta_in_partition(
+            self,
+            client,
+            partition: S3KeyPartition
+    ) -> List[dict]:
+        paginator = client.get_paginator("list_objects_v2")
+        response = paginator.paginate(
+            Bucket=self.bucket_name,
+            **get_list_objects_partition_kwargs(partition)
+        )
+        s3_object_metas = []
+        async for page in response:
+            s3_object_metas.extend(page.get("Contents", []))
+        return s3_object_metas
+
+    async def get_new_object_key_names(self, client) -> Dict[str, List[dict]]:
+        new_object_key_names = defaultdict(list)
+        for (
+                bucket_key_pattern,
+                latest_file_deposit_datetime
+        ) in from_serializable_latest_dates(
+            self.bucket_key_wildcard_pattern_with_latest_date
+        ).items():
+            bucket_key_matcher = get_glob_pattern_matcher(bucket_key_pattern)
+            s3_object_metas_by_partition = await asyncio.gather(*[
+                self.list_s3_object_meta_in_partition(client, partition)
+                for partition in self.get_s3_key_partitions(bucket_key_pattern)
+            ])
+            for s3_object_metas in s3_object_metas_by_partition:
+                for key_object in s3_object_metas:
+                    if (
+                            is_unprocessed_s3_object(
+                                key_object,
+                                latest_file_deposit_datetime,
+                                self.processed_object_manifest
+                            )
+                            and
+                            bucket_key_matcher(key_object["Key"])
+                    ):
+                        new_object_key_names[bucket_key_pattern].append(
+                            key_object
+                        )
+        return new_object_key_names
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        try:
+            async with self.hook.async_conn as client:
+                while True:
+                    new_object_key_names = await self.get_new_object_key_names(
+                        client
+                    )
+                    if any(new_object_key_names.values()):
+                        yield TriggerEvent({
+                            'status': TRIGGER_EVENT_STATUS_SUCCESS,
+                            'snapshot': get_new_s3_objects_snapshot(
+                                new_object_key_names,
+                                snapshot_timestamp=datetime.now(timezone.utc)
+                            )
+                        })
+                        return
+                    self.log.info(
+                        "No new keys found, sleeping for %s seconds",
+                        self.poke_interval
+                    )
+                    await asyncio.sleep(self.poke_interval)
+        except Exception as exception:  # pylint: disable=broad-except
+            yield TriggerEvent({
+                'status': TRIGGER_EVENT_STATUS_ERROR,
+                'message': str(exception)
+            })
@@ -0,0 +1,22 @@
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Callable, Match, Optional
+
+
+PatternMatcher = Callable[[str], Optional[Match[str]]]
+
+
+@lru_cache(maxsize=None)
+def get_glob_pattern_matcher(glob_pattern: str) -> PatternMatcher:
+    # s3 keys are case sensitive, equivalent to fnmatch.fnmatchcase
+    return re.compile(fnmatch.translate(glob_pattern)).match
+
+
+@lru_cache(maxsize=None)
+def get_regex_pattern_matcher(
+        regex_pattern: Optional[str]
+) -> Optional[PatternMatcher]:
+    if not regex_pattern:
+        return None
+    return re.compile(regex_pattern).match
@@ -0,0 +1,58 @@
+import queue
+import threading
+from typing import Any, Generator, Iterable, TypeVar
+
+
+T = TypeVar('T')
+
+# how often a blocked producer checks whether the consumer stopped
+PUT_TIMEOUT_SECONDS = 0.1
+
+_END_OF_VALUES = object()
+
+
+class _ProducerError:
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def iter_read_ahead(
+        values: Iterable[T],
+        max_queue_size: int,
+        thread_name: str = 'read-ahead'
+) -> Generator[T, None, None]:
+    # values are produced by a background thread, up to max_queue_size ahead
+    value_queue: 'queue.Queue[Any]' = queue.Queue(maxsize=max_queue_size)
+    stop_event = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop_event.is_set():
+            try:
+                value_queue.put(item, timeout=PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for value in values:
+                if not put(value):
+                    return
+            put(_END_OF_VALUES)
+        except BaseException as exception:  # pylint: disable=broad-except
+            put(_ProducerError(exception))
+
+    thread = threading.Thread(target=produce, name=thread_name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = value_queue.get()
+            if item is _END_OF_VALUES:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.exception
+            yield item
+    finally:
+        stop_event.set()
+        thread.join()
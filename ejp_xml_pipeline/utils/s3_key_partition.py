@@ -0,0 +1,115 @@
+import re
+from datetime import datetime
+from typing import Iterable, List, Match, NamedTuple, Optional, Tuple
+
+
+S3_KEY_DATE_REGEX = re.compile(r'(\d{4})([_\-/]?)(\d{2})\2(\d{2})')
+
+
+class S3KeyPartition(NamedTuple):
+    prefix: str
+    start_after: Optional[str] = None
+
+
+def get_list_objects_partition_kwargs(partition: S3KeyPartition) -> dict:
+    if partition.start_after:
+        return {'Prefix': partition.prefix, 'StartAfter': partition.start_after}
+    return {'Prefix': partition.prefix}
+
+
+def get_s3_key_pattern_prefix(key_pattern: str) -> str:
+    return re.split(r"[*]", key_pattern, 1)[0]
+
+
+def iter_year_month(
+        start_year_month: Tuple[int, int],
+        end_year_month: Tuple[int, int]
+) -> Iterable[Tuple[int, int]]:
+    year, month = start_year_month
+    while (year, month) <= end_year_month:
+        yield year, month
+        month += 1
+        if month > 12:
+            year += 1
+            month = 1
+
+
+def match_s3_key_date(
+        key_pattern: str,
+        last_processed_key: Optional[str]
+) -> Optional[Tuple[str, Match[str]]]:
+    key_pattern_prefix = get_s3_key_pattern_prefix(key_pattern)
+    if (
+            not last_processed_key
+            or not last_processed_key.startswith(key_pattern_prefix)
+    ):
+        return None
+    key_remainder = last_processed_key[len(key_pattern_prefix):]
+    match = S3_KEY_DATE_REGEX.search(key_remainder)
+    if not match:
+        return None
+    return key_pattern_prefix + key_remainder[:match.start()], match
+
+
+def get_date_partitioned_s3_key_partitions(
+        key_pattern: str,
+        last_processed_key: Optional[str],
+        end_date: datetime
+) -> Optional[List[S3KeyPartition]]:
+    date_prefix_and_match = match_s3_key_date(key_pattern, last_processed_key)
+    if not date_prefix_and_match:
+        return None
+    date_prefix, match = date_prefix_and_match
+    year = int(match.group(1))
+    separator = match.group(2)
+    month = int(match.group(3))
+    if not 1 <= month <= 12:
+        return None
+    year_months = list(iter_year_month(
+        (year, month), (end_date.year, end_date.month)
+    )) or [(year, month)]
+    return [
+        S3KeyPartition(
+            prefix=f'{date_prefix}{partition_year:04d}{separator}{partition_month:02d}',
+            # start after the date only, other keys of the same date may still be new
+            start_after=date_prefix + match.group(0) if index == 0 else None
+        )
+        for index, (partition_year, partition_month) in enumerate(year_months)
+    ]
+
+
+def get_probe_s3_key_partition(
+        key_pattern: str,
+        last_processed_key: Optional[str]
+) -> Optional[S3KeyPartition]:
+    key_pattern_prefix = get_s3_key_pattern_prefix(key_pattern)
+    if (
+            not last_processed_key
+            or not last_processed_key.startswith(key_pattern_prefix)
+    ):
+        return None
+    date_prefix_and_match = match_s3_key_date(key_pattern, last_processed_key)
+    if not date_prefix_and_match:
+        return S3KeyPartition(
+            prefix=key_pattern_prefix, start_after=last_processed_key
+        )
+    date_prefix, match = date_prefix_and_match
+    return S3KeyPartition(
+        prefix=key_pattern_prefix, start_after=date_prefix + match.group(0)
+    )
+
+
+def get_s3_key_partitions(
+        key_pattern: str,
+        last_processed_key: Optional[str],
+        end_date: datetime,
+        date_partitioned_listing: bool = False
+) -> List[S3KeyPartition]:
+    partitions = None
+    if date_partitioned_listing:
+        partitions = get_date_partitioned_s3_key_partitions(
+            key_pattern, last_processed_key, end_date=end_date
+        )
+    return partitions or [
+        S3KeyPartition(prefix=get_s3_key_pattern_prefix(key_pattern))
+    ]
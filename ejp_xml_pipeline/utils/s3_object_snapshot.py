@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from ejp_xml_pipeline.processed_object_manifest import (
+    ProcessedObjectManifest,
+    is_unprocessed_s3_object
+)
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
+
+
+NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY = 'new_s3_objects_snapshot'
+
+SNAPSHOT_S3_OBJECT_META_KEYS = [
+    named_literals.S3_FILE_METADATA_NAME_KEY,
+    named_literals.S3_FILE_METADATA_ETAG_KEY,
+    named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY,
+    named_literals.S3_FILE_METADATA_SIZE_KEY
+]
+
+
+def to_snapshot_s3_object_meta(s3_object_meta: dict) -> dict:
+    snapshot_s3_object_meta = {
+        key: s3_object_meta.get(key)
+        for key in SNAPSHOT_S3_OBJECT_META_KEYS
+    }
+    snapshot_s3_object_meta[named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY] = (
+        s3_object_meta[named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY].isoformat()
+    )
+    return snapshot_s3_object_meta
+
+
+def from_snapshot_s3_object_meta(snapshot_s3_object_meta: dict) -> dict:
+    return {
+        **snapshot_s3_object_meta,
+        named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY: datetime.fromisoformat(
+            snapshot_s3_object_meta[named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY]
+        )
+    }
+
+
+def get_new_s3_objects_snapshot(
+        new_object_key_names: Dict[str, List[dict]],
+        snapshot_timestamp: datetime
+) -> dict:
+    return {
+        'snapshot_timestamp': snapshot_timestamp.isoformat(),
+        'new_objects': {
+            bucket_key_pattern: [
+                to_snapshot_s3_object_meta(s3_object_meta)
+                for s3_object_meta in s3_object_metas
+            ]
+            for bucket_key_pattern, s3_object_metas
+            in new_object_key_names.items()
+        }
+    }
+
+
+def is_new_s3_objects_snapshot_fresh(
+        snapshot: dict,
+        max_age: timedelta,
+        now: datetime
+) -> bool:
+    snapshot_timestamp = datetime.fromisoformat(snapshot['snapshot_timestamp'])
+    return now - snapshot_timestamp <= max_age
+
+
+# pylint: disable=too-many-arguments
+def get_new_object_key_names_from_snapshot(
+        snapshot: Optional[dict],
+        bucket_key_wildcard_pattern_with_latest_date: dict,
+        max_age: timedelta,
+        now: datetime,
+        processed_object_manifest: Optional[ProcessedObjectManifest] = None
+) -> Optional[Dict[str, List[dict]]]:
+    if not snapshot or not is_new_s3_objects_snapshot_fresh(
+            snapshot, max_age=max_age, now=now
+    ):
+        return None
+    new_objects = snapshot['new_objects']
+    if set(new_objects.keys()) - set(bucket_key_wildcard_pattern_with_latest_date.keys()):
+        return None
+    return {
+        bucket_key_pattern: [
+            s3_object_meta
+            for s3_object_meta in map(
+                from_snapshot_s3_object_meta,
+                new_objects.get(bucket_key_pattern, [])
+            )
+            if is_unprocessed_s3_object(
+                s3_object_meta,
+                latest_file_deposit_datetime,
+                processed_object_manifest
+            )
+        ]
+        for bucket_key_pattern, latest_file_deposit_datetime
+        in bucket_key_wildcard_pattern_with_latest_date.items()
+    }
@@ -1,23 +1,29 @@
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, TypeVar
 # pylint: disable=no-name-in-module
 from lxml.etree import Element
 
 from ejp_xml_pipeline.utils.xml_transform_util.timestamp import (
+    IsoTimestamp,
     format_to_iso_timestamp
 )
 
 
+T = TypeVar('T')
+
+
 class MemberTypes:
     ORCID = 'ORCID'
 
 
-def format_optional_to_iso_timestamp(timestamp_str: str) -> Optional[str]:
+def format_optional_to_iso_timestamp(
+        timestamp_str: Optional[str]
+) -> Optional[IsoTimestamp]:
     return format_to_iso_timestamp(timestamp_str) if timestamp_str else None
 
 
 def extract_list(
         parent_node: Element, xpath: str,
-        transform_fn: Callable[[Element], dict]) -> List[dict]:
+        transform_fn: Callable[[Element], T]) -> List[T]:
     return [
         transform_fn(node)
         for node in parent_node.xpath(xpath)
@@ -0,0 +1,47 @@
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class StringInternTable:
+    def __init__(self) -> None:
+        self._string_by_value: Dict[str, str] = {}
+        self.shared_count = 0
+        self.shared_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._string_by_value)
+
+    def intern(self, value: str) -> str:
+        interned = self._string_by_value.setdefault(value, value)
+        if interned is not value:
+            self.shared_count += 1
+            self.shared_bytes += sys.getsizeof(value)
+        return interned
+
+
+_CURRENT_STRING_INTERN_TABLE: ContextVar[Optional[StringInternTable]] = ContextVar(
+    'current_string_intern_table', default=None
+)
+
+
+@contextmanager
+def string_intern_table_scope(
+        string_intern_table: Optional[StringInternTable]
+) -> Iterator[None]:
+    token = _CURRENT_STRING_INTERN_TABLE.set(string_intern_table)
+    try:
+        yield
+    finally:
+        _CURRENT_STRING_INTERN_TABLE.reset(token)
+
+
+def intern_string(value):
+    # values are only shared within the current scope (e.g. a zip file)
+    if not value:
+        return value
+    string_intern_table = _CURRENT_STRING_INTERN_TABLE.get()
+    if string_intern_table is None:
+        return value
+    return string_intern_table.intern(value)
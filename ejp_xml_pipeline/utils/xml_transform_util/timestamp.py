@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import NewType
 
 from dateutil import tz
 import dateutil.parser
@@ -7,6 +8,9 @@ import pytz
 
 DEFAULT_TIMEZONE = pytz.timezone('US/Eastern')
 
+# a string containing an ISO timestamp (a TIMESTAMP column in BigQuery)
+IsoTimestamp = NewType('IsoTimestamp', str)
+
 
 def parse_timestamp(timestr: str) -> datetime:
     timestamp = dateutil.parser.parse(timestr)
@@ -25,10 +29,10 @@ def to_timestamp(timestamp_or_timestr) -> datetime:
     )
 
 
-def format_to_iso_timestamp(timestamp_or_timestr) -> str:
-    return to_timestamp(
+def format_to_iso_timestamp(timestamp_or_timestr) -> IsoTimestamp:
+    return IsoTimestamp(to_timestamp(
         timestamp_or_timestr
-    ).isoformat().replace('+00:00', 'Z')
+    ).isoformat().replace('+00:00', 'Z'))
 
 
 def to_default_tz_display_format(timestamp: datetime) -> str:
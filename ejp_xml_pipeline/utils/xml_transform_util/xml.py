@@ -1,11 +1,122 @@
 import html
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Deque, Dict, Optional, Tuple
 
 # pylint: disable=no-name-in-module
 from lxml import etree
-from lxml.etree import Element
+from lxml.etree import Element, XMLParser
 
+from ejp_xml_pipeline.utils.xml_transform_util.string_interning import (
+    intern_string
+)
 
-def parse_xml_and_show_error_line(open_fn, **kwargs):
+
+LINE_TRACKING_READ_SIZE = 64 * 1024
+# the line lxml fails on is within the most recently read chunks
+LINE_TRACKING_MAX_RETAINED_BYTES = 64 * 1024
+
+
+class LineTrackingReader:
+    def __init__(
+            self,
+            source,
+            max_retained_bytes: int = LINE_TRACKING_MAX_RETAINED_BYTES
+    ):
+        self._source = source
+        self._max_retained_bytes = max_retained_bytes
+        # recently read chunks, with the line number each chunk starts on
+        self._lineno_and_chunks: Deque[Tuple[int, bytes]] = deque()
+        self._retained_bytes = 0
+        self._lineno = 1
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._source.read(size)
+        if chunk:
+            self._lineno_and_chunks.append((self._lineno, chunk))
+            self._retained_bytes += len(chunk)
+            self._lineno += chunk.count(b'\n')
+            while (
+                    len(self._lineno_and_chunks) > 1
+                    and (
+                        self._retained_bytes - len(self._lineno_and_chunks[0][1])
+                        >= self._max_retained_bytes
+                    )
+            ):
+                self._retained_bytes -= len(self._lineno_and_chunks.popleft()[1])
+        return chunk
+
+    def get_line(self, lineno: int) -> Optional[str]:
+        if not self._lineno_and_chunks:
+            return None
+        first_lineno = self._lineno_and_chunks[0][0]
+        lines = b''.join(
+            chunk for _, chunk in self._lineno_and_chunks
+        ).split(b'\n')
+        index = lineno - first_lineno
+        if index < 0 or index >= len(lines):
+            return None
+        return lines[index].decode('utf-8', errors='replace')
+
+
+def _parse_xml_with_line_tracking(open_fn, parser=None):
+    # the feed interface fails on the chunk containing the error, whereas
+    # etree.parse would read the rest of the source first.
+    # recovered errors are in parser.feed_error_log rather than parser.error_log
+    if parser is None:
+        parser = XMLParser()
+    with open_fn() as source:
+        reader = LineTrackingReader(source)
+        try:
+            while True:
+                chunk = reader.read(LINE_TRACKING_READ_SIZE)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+            root = parser.close()
+        # pylint: disable=c-extension-no-member
+        except etree.XMLSyntaxError as exception:
+            line = reader.get_line(exception.lineno) if exception.lineno else None
+            if line is None:
+                raise ValueError(
+                    f'failed to parse xml line={exception.lineno} due to {exception}'
+                ) from exception
+            raise ValueError(
+                f'failed to parse xml line=[{line}] due to {exception}'
+            ) from exception
+        except Exception:
+            _reset_feed_parser(parser)
+            raise
+    # a recovering parser returns no root for input without any element
+    if root is None:
+        raise ValueError(
+            'failed to parse xml due to '
+            f'{get_xml_error_log_summary(parser.feed_error_log) or "no root element"}'
+        )
+    return root.getroottree()
+
+
+def get_xml_error_log_summary(error_log, max_error_count: int = 3) -> str:
+    error_entries = list(error_log.filter_from_errors())
+    return '; '.join(
+        f'{entry.message} (line {entry.line}, column {entry.column})'
+        for entry in error_entries[:max_error_count]
+    )
+
+
+def _reset_feed_parser(parser: XMLParser):
+    # a (reused) parser would otherwise continue the unfinished document
+    try:
+        parser.close()
+    # pylint: disable=c-extension-no-member
+    except etree.XMLSyntaxError:
+        pass
+
+
+def parse_xml_and_show_error_line(open_fn, track_lines: bool = False, **kwargs):
+    if track_lines:
+        # avoids opening (e.g. inflating) the source a second time on errors
+        return _parse_xml_with_line_tracking(open_fn, **kwargs)
     try:
         with open_fn() as source:
             # pylint: disable=c-extension-no-member
@@ -22,12 +133,32 @@ def parse_xml_and_show_error_line(open_fn, **kwargs):
         raise exception
 
 
+def get_xml_error_count_by_type(error_log) -> Dict[str, int]:
+    # errors that a recovering parser skipped over, e.g. mismatched tags
+    return dict(Counter(
+        entry.type_name for entry in error_log.filter_from_errors()
+    ))
+
+
+# short values such as countries, role names or member types repeat a lot
+DECODE_CACHE_MAX_TEXT_LENGTH = 64
+DECODE_CACHE_MAX_SIZE = 4096
+
+_cached_html_unescape = lru_cache(maxsize=DECODE_CACHE_MAX_SIZE)(html.unescape)
+
+
 def decode_html_entities(text):
-    return html.unescape(text) if text else text
+    # most values don't contain any entities and are returned as they are
+    if not text or '&' not in text:
+        return text
+    if len(text) <= DECODE_CACHE_MAX_TEXT_LENGTH:
+        return _cached_html_unescape(text)
+    return html.unescape(text)
 
 
 def get_xml_text(node: Element, default_value=''):
-    result = ''.join(node.itertext())
+    # leaf elements (the usual case) only have their own text
+    result = node.text if len(node) == 0 else ''.join(node.itertext())
     return result if result else default_value
 
 
@@ -58,3 +189,20 @@ def get_and_decode_xml_child_text(
             parent_node, child_name, default_value=default_value
         )
     )
+
+
+def get_and_decode_interned_xml_text(node: Element, default_value=''):
+    return intern_string(
+        get_and_decode_xml_text(node, default_value=default_value)
+    )
+
+
+def get_and_decode_interned_xml_child_text(
+        parent_node: Element,
+        child_name: str,
+        default_value=None
+):
+    # for low cardinality values, e.g. countries or role names
+    return intern_string(get_and_decode_xml_child_text(
+        parent_node, child_name, default_value=default_value
+    ))
@@ -0,0 +1,52 @@
+import threading
+from typing import Any, Dict, NamedTuple
+
+
+class XmlParserOptions(NamedTuple):
+    recover: bool = True
+    # blank text between elements may separate words of mixed content
+    remove_blank_text: bool = False
+    remove_comments: bool = True
+    # without it, large text blocks exceeding libxml2's limits are truncated
+    huge_tree: bool = True
+    # xml:id attributes are not used, no need to build the id hash table
+    collect_ids: bool = False
+
+
+DEFAULT_XML_PARSER_OPTIONS = XmlParserOptions()
+
+
+def create_xml_parser(options: XmlParserOptions) -> Any:
+    # imported here to keep lxml out of the dag file imports (via the config)
+    # pylint: disable=import-outside-toplevel,no-name-in-module
+    from lxml.etree import XMLParser
+    return XMLParser(**options._asdict())
+
+
+class XmlParserPool:
+    # lxml parsers can be reused between documents but not shared by threads
+    def __init__(self, options: XmlParserOptions = DEFAULT_XML_PARSER_OPTIONS):
+        self.options = options
+        self._thread_local = threading.local()
+
+    def get_parser(self) -> Any:
+        parser = getattr(self._thread_local, 'parser', None)
+        if parser is None:
+            parser = create_xml_parser(self.options)
+            self._thread_local.parser = parser
+        return parser
+
+
+_XML_PARSER_POOL_BY_OPTIONS: Dict[XmlParserOptions, XmlParserPool] = {}
+_XML_PARSER_POOL_LOCK = threading.Lock()
+
+
+def get_xml_parser_pool(
+        options: XmlParserOptions = DEFAULT_XML_PARSER_OPTIONS
+) -> XmlParserPool:
+    with _XML_PARSER_POOL_LOCK:
+        xml_parser_pool = _XML_PARSER_POOL_BY_OPTIONS.get(options)
+        if xml_parser_pool is None:
+            xml_parser_pool = XmlParserPool(options)
+            _XML_PARSER_POOL_BY_OPTIONS[options] = xml_parser_pool
+        return xml_parser_pool
@@ -0,0 +1,61 @@
+import json
+from typing import Dict, List, Optional
+
+
+class ZipProgress:
+    def __init__(
+            self,
+            zip_digest: str,
+            completed_member_count: int = 0,
+            part_count: int = 0,
+            uploaded_object_keys_by_entity_name: Optional[Dict[str, List[str]]] = None
+    ):
+        # the members of a zip with a different digest are not resumed
+        self.zip_digest = zip_digest
+        self.completed_member_count = completed_member_count
+        self.part_count = part_count
+        self.uploaded_object_keys_by_entity_name = {
+            entity_name: list(object_keys)
+            for entity_name, object_keys in (
+                uploaded_object_keys_by_entity_name or {}
+            ).items()
+        }
+
+    @property
+    def next_part_number(self) -> int:
+        return self.part_count + 1
+
+    @property
+    def uploaded_object_keys(self) -> List[str]:
+        return [
+            object_key
+            for object_keys in self.uploaded_object_keys_by_entity_name.values()
+            for object_key in object_keys
+        ]
+
+    def add_part(
+            self,
+            completed_member_count: int,
+            uploaded_object_key_by_entity_name: Dict[str, str]
+    ):
+        self.completed_member_count = completed_member_count
+        self.part_count += 1
+        for entity_name, object_key in uploaded_object_key_by_entity_name.items():
+            self.uploaded_object_keys_by_entity_name.setdefault(
+                entity_name, []
+            ).append(object_key)
+
+
+def serialize_zip_progress(zip_progress: ZipProgress) -> str:
+    return json.dumps({
+        'zip_digest': zip_progress.zip_digest,
+        'completed_member_count': zip_progress.completed_member_count,
+        'part_count': zip_progress.part_count,
+        'uploaded_object_keys_by_entity_name': (
+            zip_progress.uploaded_object_keys_by_entity_name
+        )
+    }, indent=2, sort_keys=True)
+
+
+def deserialize_zip_progress(data: str) -> ZipProgress:
+    return ZipProgress(**json.loads(data))
@@ -0,0 +1,8 @@
+import logging
+
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def setup_logging():
+    logging.basicConfig(level='INFO')
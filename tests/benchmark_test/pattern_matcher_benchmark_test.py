@@ -0,0 +1,120 @@
+import fnmatch
+import logging
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+from unittest.mock import patch
+
+from ejp_xml_pipeline.utils.pattern_matcher import (
+    get_glob_pattern_matcher,
+    get_regex_pattern_matcher
+)
+from ejp_xml_pipeline.utils.dags.s3_new_file_monitor import (
+    S3HookNewFileMonitor
+)
+
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_COUNT = int(os.getenv('EJP_XML_BENCHMARK_KEY_COUNT', '1000000'))
+PAGE_SIZE = 1000
+
+KEY_PATTERN = 'airflow_test/ejp-xml-test-data/ejp_elife_*'
+XML_FILENAME_EXCLUSION_REGEX_PATTERN = r'415-0\.'
+
+START_TIMESTAMP = datetime(2018, 1, 1, tzinfo=timezone.utc)
+
+
+def _get_synthetic_keys(key_count: int) -> List[str]:
+    return [
+        (
+            f'airflow_test/ejp-xml-test-data/ejp_elife_{index:07d}.zip'
+            if index % 3
+            else f'airflow_test/ejp-xml-test-data/other_{index:07d}.zip'
+        )
+        for index in range(key_count)
+    ]
+
+
+def _log_timings(name: str, baseline_seconds: float, compiled_seconds: float):
+    LOGGER.info(
+        '%s (%d keys): baseline=%.3fs, compiled=%.3fs, speed-up=%.2fx',
+        name, KEY_COUNT, baseline_seconds, compiled_seconds,
+        baseline_seconds / compiled_seconds
+    )
+
+
+def test_glob_pattern_matcher_on_synthetic_listing():
+    keys = _get_synthetic_keys(KEY_COUNT)
+
+    start = time.perf_counter()
+    baseline_count = sum(
+        1 for key in keys if fnmatch.fnmatch(key, KEY_PATTERN)
+    )
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = get_glob_pattern_matcher(KEY_PATTERN)
+    compiled_count = sum(1 for key in keys if matcher(key))
+    compiled_seconds = time.perf_counter() - start
+
+    _log_timings('glob pattern', baseline_seconds, compiled_seconds)
+    assert compiled_count == baseline_count
+
+
+def test_regex_pattern_matcher_on_synthetic_filenames():
+    filenames = [
+        f'{index % 1000}-{index % 7}.xml'
+        for index in range(KEY_COUNT)
+    ]
+
+    start = time.perf_counter()
+    baseline_count = sum(
+        1 for filename in filenames
+        if re.match(XML_FILENAME_EXCLUSION_REGEX_PATTERN, filename)
+    )
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = get_regex_pattern_matcher(XML_FILENAME_EXCLUSION_REGEX_PATTERN)
+    assert matcher is not None
+    compiled_count = sum(1 for filename in filenames if matcher(filename))
+    compiled_seconds = time.perf_counter() - start
+
+    _log_timings('regex pattern', baseline_seconds, compiled_seconds)
+    assert compiled_count == baseline_count
+
+
+def test_hook_filter_on_synthetic_listing():
+    keys = _get_synthetic_keys(KEY_COUNT)
+    pages = [
+        {'Contents': [
+            {
+                'Key': key,
+                'LastModified': START_TIMESTAMP + timedelta(
+                    seconds=page_start + index
+                )
+            }
+            for index, key in enumerate(keys[page_start:page_start + PAGE_SIZE])
+        ]}
+        for page_start in range(0, len(keys), PAGE_SIZE)
+    ]
+    with patch.object(S3HookNewFileMonitor, 'get_conn') as get_conn_mock:
+        get_conn_mock.return_value.get_paginator.return_value.paginate.return_value = (
+            pages
+        )
+        hook = S3HookNewFileMonitor()
+        start = time.perf_counter()
+        matching_count = sum(1 for _ in hook.iter_filter_s3_object_meta_after(
+            {KEY_PATTERN: START_TIMESTAMP}, 'bucket'
+        ))
+        seconds = time.perf_counter() - start
+    LOGGER.info(
+        'hook filter (%d keys): %.3fs, %.0f keys/s',
+        KEY_COUNT, seconds, KEY_COUNT / seconds
+    )
+    assert matching_count == sum(
+        1 for index in range(1, KEY_COUNT) if index % 3
+    )
@@ -0,0 +1,186 @@
+import logging
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+# pylint: disable=no-name-in-module
+from lxml.builder import E
+from lxml import etree
+
+from ejp_xml_pipeline.dag_pipeline_config.config_loader import (
+    clear_data_config_cache,
+    load_data_config
+)
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.data_store.local_bq_data_service import (
+    LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME,
+    get_local_table_data_path,
+    get_local_table_path
+)
+from ejp_xml_pipeline.data_store.local_s3_data_service import (
+    LOCAL_S3_ROOT_DIR_ENV_VAR_NAME
+)
+from ejp_xml_pipeline.data_store.s3_data_service import (
+    iter_s3_object_metas,
+    upload_s3_object
+)
+from ejp_xml_pipeline.etl import (
+    download_load2bq_cleanup_temp_files,
+    etl_ejp_xml_zip
+)
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
+from ejp_xml_pipeline.utils.pattern_matcher import get_glob_pattern_matcher
+
+
+LOGGER = logging.getLogger(__name__)
+
+ZIP_COUNT = int(os.getenv('EJP_XML_BENCHMARK_ZIP_COUNT', '10'))
+DOCUMENTS_PER_ZIP = int(os.getenv('EJP_XML_BENCHMARK_DOCUMENTS_PER_ZIP', '1000'))
+PERSONS_PER_DOCUMENT = 5
+
+CONFIG_FILE_PATH = str(
+    Path(__file__).parents[2] / 'sample_data_config' / 'ejp-xml-data-pipeline.config.yaml'
+)
+DEPLOYMENT_ENV = 'ci'
+
+CREATE_DATE = '2018-01-01 03:04:05'
+TIMESTAMP = '2018-01-01T03:04:05Z'
+
+
+def _get_manuscript_xml_bytes(document_index: int) -> bytes:
+    manuscript_number = f'01-02-2018-RA-eLife-{document_index:05d}'
+    person_ids = [
+        f'person{document_index}-{person_index}'
+        for person_index in range(PERSONS_PER_DOCUMENT)
+    ]
+    root = E.xml(
+        E.manuscript(
+            E.country('Country 1'),
+            E('production-data', E('production-data-doi', f'10.7554/{document_index}')),
+            E.version(
+                E('manuscript-number', manuscript_number),
+                E('manuscript-type', 'Research Article'),
+                E.history(*[
+                    E.stage(
+                        E('start-date', TIMESTAMP),
+                        E('stage-name', f'Stage {stage_index}'),
+                        E('stage-affective-person-id', person_ids[0])
+                    )
+                    for stage_index in range(5)
+                ])
+            )
+        ),
+        E.people(*[
+            E.person(
+                E('person-id', person_id),
+                E('profile-modify-date', TIMESTAMP),
+                E('first-name', 'First &amp; Name'),
+                E('last-name', 'Last'),
+                E('institution', 'Institution'),
+                E('email', f'{person_id}@example.org')
+            )
+            for person_id in person_ids
+        ])
+    )
+    # pylint: disable=c-extension-no-member
+    return etree.tostring(root)
+
+
+def _get_synthetic_zip_bytes(zip_index: int) -> bytes:
+    filenames = [
+        f'document-{zip_index}-{document_index}.xml'
+        for document_index in range(DOCUMENTS_PER_ZIP)
+    ]
+    out = BytesIO()
+    with ZipFile(out, 'w', compression=ZIP_DEFLATED) as zip_file:
+        # pylint: disable=c-extension-no-member
+        zip_file.writestr('go.xml', etree.tostring(E.file_list(
+            *[E.file_nm(filename) for filename in filenames],
+            create_date=CREATE_DATE
+        )))
+        for document_index, filename in enumerate(filenames):
+            zip_file.writestr(filename, _get_manuscript_xml_bytes(
+                zip_index * DOCUMENTS_PER_ZIP + document_index
+            ))
+    return out.getvalue()
+
+
+def _get_zip_object_key(data_config: eJPXmlDataConfig, zip_index: int) -> str:
+    return data_config.s3_object_key_pattern.replace('*', f'{zip_index:05d}.zip')
+
+
+@pytest.fixture(name='local_root_dir')
+def _local_root_dir(tmp_path: Path):
+    with patch.dict(os.environ, {
+        LOCAL_S3_ROOT_DIR_ENV_VAR_NAME: str(tmp_path / 's3'),
+        LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME: str(tmp_path / 'bq')
+    }):
+        yield tmp_path
+    clear_data_config_cache()
+
+
+def test_etl_and_bq_load_with_local_backends(local_root_dir: Path):
+    data_config = load_data_config(CONFIG_FILE_PATH, DEPLOYMENT_ENV)
+    for zip_index in range(ZIP_COUNT):
+        upload_s3_object(
+            data_config.s3_bucket,
+            _get_zip_object_key(data_config, zip_index),
+            _get_synthetic_zip_bytes(zip_index)
+        )
+
+    key_matcher = get_glob_pattern_matcher(data_config.s3_object_key_pattern)
+    zip_object_keys = [
+        s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY]
+        for s3_object_meta in iter_s3_object_metas(data_config.s3_bucket)
+        if key_matcher(s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY])
+    ]
+    start = time.perf_counter()
+    for object_key in zip_object_keys:
+        etl_ejp_xml_zip(data_config, object_key)
+    etl_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for entity_type in data_config.entity_type_mapping.values():
+        download_load2bq_cleanup_temp_files(
+            (
+                (s3_object_meta, entity_type.s3_object_wildcard_prefix)
+                for s3_object_meta in list(iter_s3_object_metas(
+                    data_config.temp_file_s3_bucket,
+                    entity_type.s3_object_prefix
+                ))
+            ),
+            data_config.temp_file_s3_bucket,
+            data_config.gcp_project,
+            data_config.dataset,
+            entity_type.table_name,
+            json_schema=entity_type.json_schema
+        )
+    bq_load_seconds = time.perf_counter() - start
+
+    document_count = ZIP_COUNT * DOCUMENTS_PER_ZIP
+    LOGGER.info(
+        'pipeline (%d zips, %d documents): etl=%.3fs (%.0f documents/s),'
+        ' bq load=%.3fs',
+        ZIP_COUNT, document_count,
+        etl_seconds, document_count / etl_seconds,
+        bq_load_seconds
+    )
+    manuscript_table_data_path = get_local_table_data_path(get_local_table_path(
+        str(local_root_dir / 'bq'),
+        data_config.gcp_project,
+        data_config.dataset,
+        data_config.manuscript_table
+    ))
+    with open(manuscript_table_data_path, encoding='UTF-8') as data_file:
+        assert sum(1 for _ in data_file) == document_count
+    assert not any(
+        s3_object_meta
+        for entity_type in data_config.entity_type_mapping.values()
+        for s3_object_meta in iter_s3_object_metas(
+            data_config.temp_file_s3_bucket, entity_type.s3_object_prefix
+        )
+    )
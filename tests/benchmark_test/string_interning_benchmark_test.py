@@ -0,0 +1,53 @@
+import logging
+import os
+import tracemalloc
+from datetime import datetime
+
+from ejp_xml_pipeline.transform_zip_xml.ejp_person_xml import parse_xml
+from ejp_xml_pipeline.utils.xml_transform_util.string_interning import (
+    StringInternTable,
+    string_intern_table_scope
+)
+
+from .synthetic_person_xml import get_person_xml_root
+
+
+LOGGER = logging.getLogger(__name__)
+
+PERSON_COUNT = int(os.getenv('EJP_XML_BENCHMARK_PERSON_COUNT', '10000'))
+
+PROVENANCE = {'source_filename': 'persons.xml'}
+
+
+def _get_retained_bytes_of_parsed_persons(xml_root, string_intern_table=None) -> int:
+    tracemalloc.start()
+    try:
+        with string_intern_table_scope(string_intern_table):
+            parsed_document = parse_xml(xml_root, datetime(2018, 1, 1), PROVENANCE)
+        retained_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(parsed_document.get_entities()) == PERSON_COUNT
+    return retained_bytes
+
+
+def test_string_interning_on_person_xml():
+    xml_root = get_person_xml_root(PERSON_COUNT)
+    baseline_bytes = _get_retained_bytes_of_parsed_persons(xml_root)
+    string_intern_table = StringInternTable()
+    interned_bytes = _get_retained_bytes_of_parsed_persons(
+        xml_root, string_intern_table
+    )
+    LOGGER.info(
+        'parsed persons (%d persons): retained without interning=%.1f MB, '
+        'with interning=%.1f MB, saved=%.1f MB (%.0f%%), '
+        'shared %d strings using %d distinct values',
+        PERSON_COUNT,
+        baseline_bytes / 1e6,
+        interned_bytes / 1e6,
+        (baseline_bytes - interned_bytes) / 1e6,
+        100 * (baseline_bytes - interned_bytes) / baseline_bytes,
+        string_intern_table.shared_count,
+        len(string_intern_table)
+    )
+    assert interned_bytes < baseline_bytes
@@ -0,0 +1,59 @@
+# pylint: disable=no-name-in-module
+from lxml import etree
+from lxml.builder import E
+
+
+TIMESTAMP = '2018-01-01T03:04:05Z'
+
+COUNTRIES = ['United Kingdom', 'United States', 'Germany', 'China', 'Côte d&#x27;Ivoire']
+ROLE_NAMES = ['Author', 'Reviewing Editor', 'Senior Editor', 'Reviewer']
+INSTITUTIONS = [
+    'University of Cambridge',
+    'Max Planck Institute for Biology &amp; Evolution',
+    'Howard Hughes Medical Institute'
+]
+
+
+def get_person_node(person_index: int):
+    country = COUNTRIES[person_index % len(COUNTRIES)]
+    return E.person(
+        E('person-id', f'{person_index}'),
+        E('profile-modify-date', TIMESTAMP),
+        E('status', 'Active'),
+        E('title', 'Dr'),
+        E('first-name', 'Zoë' if person_index % 10 == 0 else f'First{person_index}'),
+        E('last-name', 'O&apos;Brien' if person_index % 20 == 0 else f'Last{person_index}'),
+        E('institution', INSTITUTIONS[person_index % len(INSTITUTIONS)]),
+        E('email', f'person{person_index}@example.org'),
+        E.memberships(E.membership(
+            E('member_id', f'0000-0000-0000-{person_index:04d}'),
+            E('start_dt', TIMESTAMP),
+            active_ind='1',
+            member_id_type_cde='ORCID'
+        )),
+        E.addresses(E.address(
+            E.country(country),
+            E.city('Cambridge'),
+            E.organization(INSTITUTIONS[person_index % len(INSTITUTIONS)]),
+            E.department('Department of Genetics'),
+            E.addr1(f'{person_index} Main Street'),
+            active_ind='1',
+            addr_type='work'
+        )),
+        E.roles(E.role(
+            E('update_dt', TIMESTAMP),
+            role_nm=ROLE_NAMES[person_index % len(ROLE_NAMES)],
+            active_ind='1',
+            start_dt=TIMESTAMP,
+            end_dt=''
+        )),
+        E.keywords(*[E.keyword(f'Keyword {index}') for index in range(3)])
+    )
+
+
+def get_person_xml_root(person_count: int):
+    # the text values keep html entities after parsing, like the eJP exports
+    # pylint: disable=c-extension-no-member
+    return etree.fromstring(etree.tostring(E.persons(*[
+        get_person_node(person_index) for person_index in range(person_count)
+    ])))
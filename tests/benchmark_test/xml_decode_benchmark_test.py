@@ -0,0 +1,71 @@
+import html
+import logging
+import os
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+from ejp_xml_pipeline.transform_zip_xml.ejp_person_xml import parse_xml
+from ejp_xml_pipeline.utils.xml_transform_util import xml as xml_module
+from ejp_xml_pipeline.utils.xml_transform_util.xml import decode_html_entities
+
+from .synthetic_person_xml import get_person_xml_root
+
+
+LOGGER = logging.getLogger(__name__)
+
+PERSON_COUNT = int(os.getenv('EJP_XML_BENCHMARK_PERSON_COUNT', '10000'))
+
+PROVENANCE = {'source_filename': 'persons.xml'}
+
+
+def _baseline_decode_html_entities(text):
+    return html.unescape(text) if text else text
+
+
+def test_decode_html_entities_on_person_text_values():
+    texts = [
+        node.text
+        for node in get_person_xml_root(PERSON_COUNT).iter()
+        if len(node) == 0
+    ]
+
+    start = time.perf_counter()
+    baseline_values = [_baseline_decode_html_entities(text) for text in texts]
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values = [decode_html_entities(text) for text in texts]
+    seconds = time.perf_counter() - start
+
+    LOGGER.info(
+        'decode html entities (%d values, %d with entities): '
+        'baseline=%.3fs, fast path=%.3fs, speed-up=%.2fx',
+        len(texts), sum(1 for text in texts if text and '&' in text),
+        baseline_seconds, seconds, baseline_seconds / seconds
+    )
+    assert values == baseline_values
+
+
+def test_parse_person_xml_with_fast_path_decoding():
+    xml_root = get_person_xml_root(PERSON_COUNT)
+
+    with patch.object(
+            xml_module, 'decode_html_entities', _baseline_decode_html_entities
+    ):
+        start = time.perf_counter()
+        baseline_document = parse_xml(xml_root, datetime(2018, 1, 1), PROVENANCE)
+        baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    document = parse_xml(xml_root, datetime(2018, 1, 1), PROVENANCE)
+    seconds = time.perf_counter() - start
+
+    LOGGER.info(
+        'parse person xml (%d persons): baseline decoding=%.3fs, '
+        'fast path decoding=%.3fs, speed-up=%.2fx',
+        PERSON_COUNT, baseline_seconds, seconds, baseline_seconds / seconds
+    )
+    assert [person.data for person in document.get_entities()] == [
+        person.data for person in baseline_document.get_entities()
+    ]
@@ -0,0 +1,70 @@
+import logging
+import os
+import time
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZipFile
+
+# pylint: disable=no-name-in-module
+from lxml import etree
+from lxml.builder import E
+
+from ejp_xml_pipeline.etl_metrics import EtlMetrics, EtlStageNames
+from ejp_xml_pipeline.transform_zip_xml.ejp_zip import iter_parse_xml_in_zip
+
+from .synthetic_person_xml import get_person_xml_root
+
+
+LOGGER = logging.getLogger(__name__)
+
+MEMBER_COUNT = int(os.getenv('EJP_XML_BENCHMARK_MEMBER_COUNT', '100'))
+PERSONS_PER_MEMBER = 100
+READ_AHEAD_QUEUE_SIZE = 2
+
+
+def _get_synthetic_zip_bytes() -> bytes:
+    filenames = [f'persons-{member_index}.xml' for member_index in range(MEMBER_COUNT)]
+    # pylint: disable=c-extension-no-member
+    member_bytes = etree.tostring(get_person_xml_root(PERSONS_PER_MEMBER))
+    out = BytesIO()
+    with ZipFile(out, 'w', compression=ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('go.xml', etree.tostring(E.file_list(
+            *[E.file_nm(filename) for filename in filenames],
+            create_date='2018-01-01 03:04:05'
+        )))
+        for filename in filenames:
+            zip_file.writestr(filename, member_bytes)
+    return out.getvalue()
+
+
+def _parse_zip(zip_bytes: bytes, read_ahead_queue_size: int) -> EtlMetrics:
+    etl_metrics = EtlMetrics()
+    with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+        document_count = sum(1 for _ in iter_parse_xml_in_zip(
+            zip_file,
+            zip_filename='benchmark.zip',
+            etl_metrics=etl_metrics,
+            read_ahead_queue_size=read_ahead_queue_size
+        ))
+    assert document_count == MEMBER_COUNT
+    return etl_metrics
+
+
+def test_parse_zip_with_read_ahead():
+    zip_bytes = _get_synthetic_zip_bytes()
+
+    start = time.perf_counter()
+    _parse_zip(zip_bytes, read_ahead_queue_size=0)
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    etl_metrics = _parse_zip(zip_bytes, read_ahead_queue_size=READ_AHEAD_QUEUE_SIZE)
+    seconds = time.perf_counter() - start
+
+    LOGGER.info(
+        'parse zip (%d members): inline inflate=%.3fs, read-ahead=%.3fs'
+        ' (inflate=%.3fs, waited=%.3fs), speed-up=%.2fx',
+        MEMBER_COUNT, baseline_seconds, seconds,
+        etl_metrics.duration_by_stage[EtlStageNames.ZIP_INFLATE],
+        etl_metrics.duration_by_stage[EtlStageNames.ZIP_READ_AHEAD_WAIT],
+        baseline_seconds / seconds
+    )
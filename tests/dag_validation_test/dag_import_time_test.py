@@ -0,0 +1,94 @@
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, NamedTuple
+
+import pytest
+
+from tests.dag_validation_test.conftest import DAG_PATH
+
+
+DAG_MODULE_NAME = 's3_xml_import_pipeline'
+
+PROJECT_MODULE_PREFIX = 'ejp_xml_pipeline'
+
+# only needed when tasks run, importing them would slow down dag file parsing
+HEAVY_MODULE_NAMES = [
+    'google.cloud.bigquery',
+    'bigquery_schema_generator',
+    'boto3',
+    'lxml.etree',
+    'airflow.providers.amazon.aws.hooks.s3',
+    'ejp_xml_pipeline.etl'
+]
+
+DAG_IMPORT_TIME_BUDGET_MS = int(
+    os.getenv('EJP_XML_DAG_IMPORT_TIME_BUDGET_MS', '250')
+)
+
+IMPORT_TIME_LINE_REGEX = re.compile(
+    r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$'
+)
+
+
+class ModuleImportTime(NamedTuple):
+    self_us: int
+    cumulative_us: int
+
+
+def get_module_import_times(module_name: str) -> Dict[str, ModuleImportTime]:
+    repo_path = os.path.abspath(os.path.join(DAG_PATH, '..'))
+    env = {
+        **os.environ,
+        'PYTHONPATH': os.pathsep.join([
+            os.path.abspath(DAG_PATH), repo_path, os.getenv('PYTHONPATH', '')
+        ])
+    }
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    module_import_times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE_REGEX.match(line)
+        if match:
+            module_import_times[match.group(4)] = ModuleImportTime(
+                self_us=int(match.group(1)),
+                cumulative_us=int(match.group(2))
+            )
+    return module_import_times
+
+
+@pytest.fixture(name='dag_module_import_times', scope='module')
+def _dag_module_import_times() -> Dict[str, ModuleImportTime]:
+    return get_module_import_times(DAG_MODULE_NAME)
+
+
+def test_should_not_import_heavy_modules_when_parsing_dag(
+        dag_module_import_times: Dict[str, ModuleImportTime]
+):
+    assert DAG_MODULE_NAME in dag_module_import_times
+    assert [
+        module_name
+        for module_name in HEAVY_MODULE_NAMES
+        if module_name in dag_module_import_times
+    ] == []
+
+
+def test_should_import_dag_and_project_modules_within_budget(
+        dag_module_import_times: Dict[str, ModuleImportTime]
+):
+    # only the self time of our own modules, airflow itself is out of our control
+    project_import_time_ms = sum(
+        module_import_time.self_us
+        for module_name, module_import_time in dag_module_import_times.items()
+        if (
+            module_name == DAG_MODULE_NAME
+            or module_name.startswith(PROJECT_MODULE_PREFIX)
+        )
+    ) / 1000
+    assert project_import_time_ms <= DAG_IMPORT_TIME_BUDGET_MS
@@ -75,6 +75,16 @@ def trigger_run_test_pipeline(
         ejp_xml_config.state_file_bucket,
         ejp_xml_config.state_file_object
     )
+    if ejp_xml_config.state_manifest_file_object:
+        delete_statefile_if_exist(
+            ejp_xml_config.state_file_bucket,
+            ejp_xml_config.state_manifest_file_object
+        )
+    if ejp_xml_config.member_digest_index_object:
+        delete_statefile_if_exist(
+            ejp_xml_config.state_file_bucket,
+            ejp_xml_config.member_digest_index_object
+        )
     airflow_api.unpause_dag(dag_id)
     execution_date = airflow_api.trigger_dag(dag_id=dag_id)
     dag_status: str
@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from ejp_xml_pipeline.dag_pipeline_config.config_loader import (
+    clear_data_config_cache,
+    load_data_config
+)
+from ejp_xml_pipeline.utils.xml_transform_util.xml_parser_pool import (
+    DEFAULT_XML_PARSER_OPTIONS
+)
+
+
+CONFIG_YAML_1 = '\n'.join([
+    'eJPXmlBucket: bucket-{ENV}',
+    'tempS3FileStorage:',
+    '  objectPrefix: prefix'
+])
+CONFIG_YAML_2 = CONFIG_YAML_1.replace('bucket-', 'other-bucket-')
+
+
+@pytest.fixture(name='config_path')
+def _config_path(tmp_path: Path) -> Iterable[Path]:
+    clear_data_config_cache()
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(CONFIG_YAML_1, encoding='utf-8')
+    yield config_path
+    clear_data_config_cache()
+
+
+def _touch(path: Path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadDataConfig:
+    def test_should_replace_deployment_env_placeholder(self, config_path: Path):
+        assert load_data_config(str(config_path), 'ci').s3_bucket == 'bucket-ci'
+
+    def test_should_return_cached_config_for_unchanged_file(
+            self, config_path: Path
+    ):
+        assert load_data_config(str(config_path), 'ci') is load_data_config(
+            str(config_path), 'ci'
+        )
+
+    def test_should_cache_per_deployment_env(self, config_path: Path):
+        assert load_data_config(str(config_path), 'ci').s3_bucket == 'bucket-ci'
+        assert load_data_config(
+            str(config_path), 'prod'
+        ).s3_bucket == 'bucket-prod'
+
+    def test_should_keep_cached_config_if_only_mtime_changed(
+            self, config_path: Path
+    ):
+        data_config = load_data_config(str(config_path), 'ci')
+        _touch(config_path)
+        assert load_data_config(str(config_path), 'ci') is data_config
+
+    def test_should_reload_config_if_content_changed(self, config_path: Path):
+        load_data_config(str(config_path), 'ci')
+        config_path.write_text(CONFIG_YAML_2, encoding='utf-8')
+        _touch(config_path)
+        assert load_data_config(
+            str(config_path), 'ci'
+        ).s3_bucket == 'other-bucket-ci'
+
+    def test_should_return_immutable_config(self, config_path: Path):
+        data_config = load_data_config(str(config_path), 'ci')
+        with pytest.raises(AttributeError):
+            data_config.s3_bucket = 'other'
+
+    def test_should_use_default_xml_parser_options(self, config_path: Path):
+        assert load_data_config(
+            str(config_path), 'ci'
+        ).xml_parser_options == DEFAULT_XML_PARSER_OPTIONS
+
+    def test_should_read_xml_parser_options(self, config_path: Path):
+        config_path.write_text('\n'.join([
+            CONFIG_YAML_1,
+            'xmlParser:',
+            '  removeBlankText: true',
+            '  hugeTree: false'
+        ]), encoding='utf-8')
+        xml_parser_options = load_data_config(
+            str(config_path), 'ci'
+        ).xml_parser_options
+        assert xml_parser_options.remove_blank_text
+        assert not xml_parser_options.huge_tree
+        assert xml_parser_options.collect_ids == DEFAULT_XML_PARSER_OPTIONS.collect_ids
+
+    def test_should_not_checkpoint_zips_by_default(self, config_path: Path):
+        assert not load_data_config(str(config_path), 'ci').zip_checkpoint_member_count
+
+    def test_should_not_stream_multipart_uploads_by_default(self, config_path: Path):
+        assert not load_data_config(
+            str(config_path), 'ci'
+        ).multipart_upload_max_concurrency
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import patch
 
 import pytest
@@ -5,9 +6,15 @@ import pytest
 import ejp_xml_pipeline.data_store.bq_data_service \
     as bq_data_service_module
 from ejp_xml_pipeline.data_store.bq_data_service import (
+    GoogleBigQueryBackend,
+    get_bq_backend,
     load_file_into_bq,
     get_new_merged_schema
 )
+from ejp_xml_pipeline.data_store.local_bq_data_service import (
+    LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME,
+    LocalBigQueryBackend
+)
 
 
 @pytest.fixture(name="mock_bigquery")
@@ -138,3 +145,17 @@ def test_should_not_update_existing_fields():
         {'name': 'univ', 'type': 'STRING'}
     ]
     assert computed_schema == expected_schema
+
+
+class TestGetBqBackend:
+    def test_should_reuse_google_bigquery_backend_by_default(self):
+        with patch.dict(os.environ, {LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME: ''}):
+            bq_backend = get_bq_backend()
+            assert isinstance(bq_backend, GoogleBigQueryBackend)
+            assert get_bq_backend() is bq_backend
+
+    def test_should_select_local_bigquery_backend_if_configured(self, tmp_path):
+        with patch.dict(os.environ, {LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME: str(tmp_path)}):
+            bq_backend = get_bq_backend()
+            assert isinstance(bq_backend, LocalBigQueryBackend)
+            assert bq_backend.root_dir == str(tmp_path)
@@ -0,0 +1,141 @@
+import json
+import os
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from ejp_xml_pipeline.data_store.local_bq_data_service import (
+    LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME,
+    get_local_table_data_path,
+    get_local_table_path,
+    get_local_table_schema,
+    get_record_schema_errors
+)
+from ejp_xml_pipeline.data_store.bq_data_service import (
+    create_or_extend_table_schema,
+    load_file_into_bq
+)
+
+
+PROJECT_1 = 'project1'
+DATASET_1 = 'dataset1'
+TABLE_1 = 'table1'
+
+SCHEMA_1: List[dict] = [
+    {'name': 'id', 'type': 'STRING', 'mode': 'REQUIRED'},
+    {'name': 'count', 'type': 'INTEGER', 'mode': 'NULLABLE'},
+    {
+        'name': 'items', 'type': 'RECORD', 'mode': 'REPEATED',
+        'fields': [{'name': 'flag', 'type': 'BOOLEAN', 'mode': 'NULLABLE'}]
+    }
+]
+
+
+@pytest.fixture(name='local_bq_root_dir')
+def _local_bq_root_dir(tmp_path: Path):
+    local_bq_root_dir = tmp_path / 'bq'
+    with patch.dict(
+            os.environ, {LOCAL_BQ_ROOT_DIR_ENV_VAR_NAME: str(local_bq_root_dir)}
+    ):
+        yield local_bq_root_dir
+
+
+def _write_ndjson_file(file_path: Path, records: list) -> str:
+    file_path.write_text(
+        ''.join(json.dumps(record) + '\n' for record in records),
+        encoding='UTF-8'
+    )
+    return str(file_path)
+
+
+def _read_local_table_rows(local_bq_root_dir: Path) -> list:
+    data_path = get_local_table_data_path(get_local_table_path(
+        str(local_bq_root_dir), PROJECT_1, DATASET_1, TABLE_1
+    ))
+    return [
+        json.loads(line)
+        for line in data_path.read_text(encoding='UTF-8').splitlines()
+    ]
+
+
+class TestGetRecordSchemaErrors:
+    def test_should_accept_matching_record(self):
+        assert not get_record_schema_errors(
+            {'id': 'id1', 'count': 1, 'items': [{'flag': True}]},
+            SCHEMA_1
+        )
+
+    def test_should_report_unknown_missing_and_mismatching_fields(self):
+        assert get_record_schema_errors(
+            {'count': '1', 'items': [{'flag': 'yes'}], 'other': 1},
+            SCHEMA_1
+        ) == [
+            'missing required field: id',
+            'expected INTEGER: count',
+            'expected BOOLEAN: items.flag',
+            'no such field: other'
+        ]
+
+    def test_should_report_non_array_for_repeated_field(self):
+        assert get_record_schema_errors(
+            {'id': 'id1', 'items': {'flag': True}},
+            SCHEMA_1
+        ) == ['expected array: items']
+
+
+class TestLocalBqDataService:
+    def test_should_create_and_extend_schema_and_append_rows(
+            self, local_bq_root_dir: Path, tmp_path: Path
+    ):
+        file_1 = _write_ndjson_file(tmp_path / 'file1.json', [{'id': 'id1'}])
+        create_or_extend_table_schema(PROJECT_1, DATASET_1, TABLE_1, file_1)
+        load_file_into_bq(file_1, PROJECT_1, DATASET_1, TABLE_1)
+
+        file_2 = _write_ndjson_file(
+            tmp_path / 'file2.json', [{'id': 'id2', 'count': 2}]
+        )
+        create_or_extend_table_schema(PROJECT_1, DATASET_1, TABLE_1, file_2)
+        load_file_into_bq(file_2, PROJECT_1, DATASET_1, TABLE_1)
+
+        assert {
+            field['name']
+            for field in get_local_table_schema(
+                str(local_bq_root_dir), PROJECT_1, DATASET_1, TABLE_1
+            ) or []
+        } == {'id', 'count'}
+        assert _read_local_table_rows(local_bq_root_dir) == [
+            {'id': 'id1'}, {'id': 'id2', 'count': 2}
+        ]
+
+    def test_should_create_table_from_static_schema_without_file(
+            self, local_bq_root_dir: Path
+    ):
+        create_or_extend_table_schema(
+            PROJECT_1, DATASET_1, TABLE_1, json_schema=SCHEMA_1
+        )
+        assert get_local_table_schema(
+            str(local_bq_root_dir), PROJECT_1, DATASET_1, TABLE_1
+        ) == SCHEMA_1
+
+    def test_should_not_append_any_rows_if_a_row_does_not_match_schema(
+            self, local_bq_root_dir: Path, tmp_path: Path
+    ):
+        file_1 = _write_ndjson_file(tmp_path / 'file1.json', [{'count': 1}])
+        create_or_extend_table_schema(PROJECT_1, DATASET_1, TABLE_1, file_1)
+        load_file_into_bq(file_1, PROJECT_1, DATASET_1, TABLE_1)
+        file_2 = _write_ndjson_file(
+            tmp_path / 'file2.json', [{'count': 2}, {'count': 'not a number'}]
+        )
+        with pytest.raises(ValueError):
+            load_file_into_bq(file_2, PROJECT_1, DATASET_1, TABLE_1)
+        assert _read_local_table_rows(local_bq_root_dir) == [{'count': 1}]
+
+    def test_should_fail_loading_into_missing_table(
+            self, local_bq_root_dir: Path, tmp_path: Path
+    ):
+        assert local_bq_root_dir
+        file_1 = _write_ndjson_file(tmp_path / 'file1.json', [{'id': 'id1'}])
+        with pytest.raises(ValueError):
+            load_file_into_bq(file_1, PROJECT_1, DATASET_1, TABLE_1)
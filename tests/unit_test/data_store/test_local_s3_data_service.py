@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ejp_xml_pipeline.data_store.local_s3_data_service import (
+    LOCAL_S3_ROOT_DIR_ENV_VAR_NAME,
+    LocalS3Backend
+)
+from ejp_xml_pipeline.data_store.s3_data_service import (
+    delete_s3_objects,
+    download_s3_json_object,
+    download_s3_object_as_string,
+    iter_s3_object_metas,
+    upload_file_into_s3,
+    upload_s3_object
+)
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as named_literals
+
+
+BUCKET_1 = 'bucket1'
+OBJECT_KEY_1 = 'prefix1/object1.json'
+OBJECT_KEY_2 = 'prefix1/object2.json'
+OTHER_OBJECT_KEY_1 = 'other/object1.json'
+
+
+@pytest.fixture(name='local_s3_root_dir', autouse=True)
+def _local_s3_root_dir(tmp_path: Path):
+    with patch.dict(os.environ, {LOCAL_S3_ROOT_DIR_ENV_VAR_NAME: str(tmp_path)}):
+        yield tmp_path
+
+
+class TestLocalS3DataService:
+    def test_should_upload_and_download_object(self, local_s3_root_dir: Path):
+        upload_s3_object(BUCKET_1, OBJECT_KEY_1, '{"key": "value"}')
+        assert (local_s3_root_dir / BUCKET_1 / OBJECT_KEY_1).is_file()
+        assert download_s3_json_object(BUCKET_1, OBJECT_KEY_1) == {'key': 'value'}
+
+    def test_should_upload_file(self, tmp_path: Path):
+        source_file = tmp_path / 'source.json'
+        source_file.write_text('data1', encoding='utf-8')
+        assert upload_file_into_s3(BUCKET_1, OBJECT_KEY_1, str(source_file))
+        assert download_s3_object_as_string(BUCKET_1, OBJECT_KEY_1) == 'data1'
+
+    def test_should_raise_no_such_key_error_for_missing_object(self):
+        with pytest.raises(ClientError) as exc_info:
+            download_s3_json_object(BUCKET_1, OBJECT_KEY_1)
+        assert exc_info.value.response['Error']['Code'] == 'NoSuchKey'
+
+    def test_should_delete_objects_and_ignore_missing_objects(self):
+        upload_s3_object(BUCKET_1, OBJECT_KEY_1, 'data1')
+        delete_s3_objects(BUCKET_1, [OBJECT_KEY_1, OBJECT_KEY_2])
+        assert not list(iter_s3_object_metas(BUCKET_1))
+
+    def test_should_list_objects_with_prefix_sorted_by_key(self):
+        upload_s3_object(BUCKET_1, OBJECT_KEY_2, 'data2')
+        upload_s3_object(BUCKET_1, OTHER_OBJECT_KEY_1, 'other')
+        upload_s3_object(BUCKET_1, OBJECT_KEY_1, 'data1')
+        s3_object_metas = list(iter_s3_object_metas(BUCKET_1, 'prefix1/'))
+        assert [
+            s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY]
+            for s3_object_meta in s3_object_metas
+        ] == [OBJECT_KEY_1, OBJECT_KEY_2]
+        assert s3_object_metas[0][named_literals.S3_FILE_METADATA_SIZE_KEY] == 5
+        assert s3_object_metas[0][
+            named_literals.S3_FILE_METADATA_LAST_MODIFIED_KEY
+        ].tzinfo is not None
+
+    def test_should_list_single_page_after_start_key(self, local_s3_root_dir: Path):
+        upload_s3_object(BUCKET_1, OBJECT_KEY_1, 'data1')
+        upload_s3_object(BUCKET_1, OBJECT_KEY_2, 'data2')
+        upload_s3_object(BUCKET_1, 'prefix1/object3.json', 'data3')
+        s3_object_metas, is_truncated = LocalS3Backend(
+            str(local_s3_root_dir)
+        ).list_object_metas(
+            BUCKET_1, prefix='prefix1/', start_after=OBJECT_KEY_1, max_keys=1
+        )
+        assert [
+            s3_object_meta[named_literals.S3_FILE_METADATA_NAME_KEY]
+            for s3_object_meta in s3_object_metas
+        ] == [OBJECT_KEY_2]
+        assert is_truncated
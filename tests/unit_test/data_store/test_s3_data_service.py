@@ -0,0 +1,59 @@
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from ejp_xml_pipeline.data_store.local_s3_data_service import (
+    LOCAL_S3_ROOT_DIR_ENV_VAR_NAME,
+    LocalS3Backend
+)
+from ejp_xml_pipeline.data_store.s3_data_service import (
+    Boto3S3Backend,
+    get_s3_backend
+)
+
+
+class TestBoto3S3Backend:
+    def test_should_create_client_once_for_all_threads(self):
+        s3_client_factory = MagicMock(name='s3_client_factory')
+        s3_backend = Boto3S3Backend(s3_client_factory)
+        s3_clients = []
+        threads = [
+            threading.Thread(target=lambda: s3_clients.append(s3_backend.s3_client))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        s3_client_factory.assert_called_once_with()
+        assert s3_clients == [s3_client_factory.return_value] * 4
+
+    def test_should_return_single_page_and_whether_it_is_truncated(self):
+        s3_client_mock = MagicMock(name='s3_client')
+        s3_client_mock.list_objects_v2.return_value = {
+            'Contents': [{'Key': 'prefix/key1'}], 'IsTruncated': True
+        }
+        s3_backend = Boto3S3Backend(lambda: s3_client_mock)
+        assert s3_backend.list_object_metas(
+            'bucket1', prefix='prefix/', start_after='prefix/key0', max_keys=1
+        ) == ([{'Key': 'prefix/key1'}], True)
+        s3_client_mock.list_objects_v2.assert_called_once_with(
+            Bucket='bucket1', MaxKeys=1, Prefix='prefix/', StartAfter='prefix/key0'
+        )
+
+
+class TestGetS3Backend:
+    def test_should_reuse_selected_backend(self):
+        with patch.dict(os.environ, {LOCAL_S3_ROOT_DIR_ENV_VAR_NAME: ''}):
+            s3_backend = get_s3_backend()
+            assert isinstance(s3_backend, Boto3S3Backend)
+            assert get_s3_backend() is s3_backend
+
+    def test_should_select_local_backend_if_root_dir_is_configured(
+            self, tmp_path: Path
+    ):
+        with patch.dict(os.environ, {LOCAL_S3_ROOT_DIR_ENV_VAR_NAME: str(tmp_path)}):
+            s3_backend = get_s3_backend()
+            assert isinstance(s3_backend, LocalS3Backend)
+            assert s3_backend.root_dir == str(tmp_path)
@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ejp_xml_pipeline.data_store import s3_multipart_upload as s3_multipart_upload_module
+from ejp_xml_pipeline.data_store.local_s3_data_service import (
+    LOCAL_S3_ROOT_DIR_ENV_VAR_NAME
+)
+from ejp_xml_pipeline.data_store.s3_data_service import (
+    download_s3_object_as_string,
+    iter_s3_object_metas
+)
+from ejp_xml_pipeline.data_store.s3_multipart_upload import (
+    S3MultipartUploader,
+    S3MultipartUploadSink
+)
+
+
+BUCKET_1 = 'bucket1'
+OBJECT_KEY_1 = 'prefix1/object1.json'
+
+PART_SIZE = 10
+
+LINES = [f'{{"line": {line_index}}}\n' for line_index in range(10)]
+
+
+@pytest.fixture(name='local_s3_root_dir', autouse=True)
+def _local_s3_root_dir(tmp_path: Path):
+    with patch.dict(os.environ, {LOCAL_S3_ROOT_DIR_ENV_VAR_NAME: str(tmp_path)}):
+        yield tmp_path
+
+
+@pytest.fixture(name='s3_multipart_uploader')
+def _s3_multipart_uploader():
+    with S3MultipartUploader(max_concurrency=2) as s3_multipart_uploader:
+        yield s3_multipart_uploader
+
+
+@pytest.fixture(name='sink')
+def _sink(s3_multipart_uploader: S3MultipartUploader) -> S3MultipartUploadSink:
+    return S3MultipartUploadSink(
+        s3_multipart_uploader,
+        bucket=BUCKET_1,
+        object_key=OBJECT_KEY_1,
+        part_size=PART_SIZE
+    )
+
+
+def _get_incomplete_upload_count(local_s3_root_dir: Path) -> int:
+    return len(list(local_s3_root_dir.glob('.multipart-uploads/*')))
+
+
+class TestS3MultipartUploadSink:
+    def test_should_upload_written_text_in_parts(
+            self, sink: S3MultipartUploadSink, local_s3_root_dir: Path
+    ):
+        for line in LINES:
+            sink.write(line)
+        assert sink.close()
+        assert download_s3_object_as_string(BUCKET_1, OBJECT_KEY_1) == ''.join(LINES)
+        assert len(sink.uploaded_parts) == len(LINES)
+        assert sink.uploaded_bytes == len(''.join(LINES))
+        assert _get_incomplete_upload_count(local_s3_root_dir) == 0
+
+    def test_should_upload_single_object_if_smaller_than_part_size(
+            self, sink: S3MultipartUploadSink
+    ):
+        sink.write('data1')
+        assert sink.close()
+        assert sink.upload_id is None
+        assert download_s3_object_as_string(BUCKET_1, OBJECT_KEY_1) == 'data1'
+
+    def test_should_not_upload_anything_if_nothing_was_written(
+            self, sink: S3MultipartUploadSink
+    ):
+        assert not sink.close()
+        assert not list(iter_s3_object_metas(BUCKET_1))
+
+    def test_should_not_create_object_if_aborted(
+            self, sink: S3MultipartUploadSink, local_s3_root_dir: Path
+    ):
+        for line in LINES:
+            sink.write(line)
+        sink.abort()
+        assert not list(iter_s3_object_metas(BUCKET_1))
+        assert _get_incomplete_upload_count(local_s3_root_dir) == 0
+
+    def test_should_abort_and_raise_error_if_part_upload_failed(
+            self, sink: S3MultipartUploadSink, local_s3_root_dir: Path
+    ):
+        with patch.object(
+                s3_multipart_upload_module, 'upload_s3_multipart_part',
+                side_effect=RuntimeError('test error')
+        ):
+            sink.write(''.join(LINES))
+            with pytest.raises(RuntimeError):
+                sink.close()
+        assert not list(iter_s3_object_metas(BUCKET_1))
+        assert _get_incomplete_upload_count(local_s3_root_dir) == 0
@@ -0,0 +1,89 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ejp_xml_pipeline import etl_metrics as etl_metrics_module
+from ejp_xml_pipeline.etl_metrics import (
+    EtlCounterNames,
+    EtlMetrics,
+    EtlStageNames,
+    get_entity_counter_name,
+    serialize_etl_metrics
+)
+from ejp_xml_pipeline.member_resource_report import MemberResourceReport
+from ejp_xml_pipeline.model.entities import Manuscript
+
+
+@pytest.fixture(name='perf_counter_mock')
+def _perf_counter_mock():
+    with patch.object(etl_metrics_module.time, 'perf_counter') as mock:
+        yield mock
+
+
+class TestEtlMetrics:
+    def test_should_accumulate_stage_durations(
+            self, perf_counter_mock: MagicMock
+    ):
+        perf_counter_mock.side_effect = [10.0, 11.5, 20.0, 20.5]
+        etl_metrics = EtlMetrics()
+        with etl_metrics.timer(EtlStageNames.XML_PARSE):
+            pass
+        with etl_metrics.timer(EtlStageNames.XML_PARSE):
+            pass
+        assert etl_metrics.duration_by_stage == {EtlStageNames.XML_PARSE: 2.0}
+
+    def test_should_record_duration_if_stage_raises_error(
+            self, perf_counter_mock: MagicMock
+    ):
+        perf_counter_mock.side_effect = [10.0, 11.0]
+        etl_metrics = EtlMetrics()
+        with pytest.raises(RuntimeError):
+            with etl_metrics.timer(EtlStageNames.S3_UPLOAD):
+                raise RuntimeError('failed')
+        assert etl_metrics.duration_by_stage == {EtlStageNames.S3_UPLOAD: 1.0}
+
+    def test_should_time_retrieving_each_value(
+            self, perf_counter_mock: MagicMock
+    ):
+        perf_counter_mock.side_effect = [10.0, 10.5, 20.0, 20.5, 30.0, 31.0]
+        etl_metrics = EtlMetrics()
+        assert list(etl_metrics.iter_timed(
+            ['value1', 'value2'], EtlStageNames.ZIP_READ_AHEAD_WAIT
+        )) == ['value1', 'value2']
+        assert etl_metrics.duration_by_stage == {
+            EtlStageNames.ZIP_READ_AHEAD_WAIT: 2.0
+        }
+
+    def test_should_count_entities_per_type(self):
+        etl_metrics = EtlMetrics()
+        etl_metrics.increment(get_entity_counter_name(Manuscript))
+        etl_metrics.increment(get_entity_counter_name(Manuscript))
+        assert etl_metrics.count_by_counter == {'entities.Manuscript': 2}
+
+    def test_should_calculate_throughput_for_timed_stages_only(
+            self, perf_counter_mock: MagicMock
+    ):
+        perf_counter_mock.side_effect = [10.0, 12.0]
+        etl_metrics = EtlMetrics()
+        with etl_metrics.timer(EtlStageNames.S3_DOWNLOAD):
+            pass
+        etl_metrics.increment(EtlCounterNames.ZIP_BYTES, 1000)
+        etl_metrics.increment(EtlCounterNames.DOCUMENTS, 10)
+        assert etl_metrics.get_throughput() == {'zip_bytes_per_second': 500.0}
+
+    def test_should_serialize_summary_as_json(self):
+        etl_metrics = EtlMetrics('file1.zip')
+        etl_metrics.increment(EtlCounterNames.DOCUMENTS)
+        summary = json.loads(serialize_etl_metrics(etl_metrics))
+        assert summary['name'] == 'file1.zip'
+        assert summary['count_by_counter'] == {EtlCounterNames.DOCUMENTS: 1}
+
+    def test_should_include_member_resource_report_in_summary(self):
+        etl_metrics = EtlMetrics(
+            member_resource_report=MemberResourceReport()
+        )
+        assert etl_metrics.get_summary()['member_resource_report'] == {
+            'member_count': 0,
+            'top_by_parse_seconds': []
+        }
@@ -1,11 +1,20 @@
 from unittest.mock import patch
-from datetime import datetime
+from datetime import datetime, timezone
 import pytest
 from botocore.exceptions import ClientError
 from ejp_xml_pipeline import etl_state as etl_state_module
 from ejp_xml_pipeline.etl_state import (
     update_object_latest_dates,
-    get_stored_ejp_xml_processing_state
+    get_stored_ejp_xml_processing_state,
+    get_stored_member_digest_index,
+    get_stored_processed_object_manifest,
+    update_processed_object_manifest,
+    update_stored_etl_metrics
+)
+from ejp_xml_pipeline.etl_metrics import EtlMetrics
+from ejp_xml_pipeline.member_digest_index import (
+    MemberDigestIndex,
+    serialize_member_digest_index
 )
 from ejp_xml_pipeline.utils.xml_transform_util.timestamp import (
     convert_datetime_string_to_datetime
@@ -30,9 +39,17 @@ EJP_XML_CONFIG = {
     'tempS3FileStorage': {
         'bucket': 'temp_s3_file_storage_bucket',
         'objectPrefix': 'tmp_s3_storage_obj_prefix'
+    },
+    'memberDigestIndex': {
+        'object': 'member_digest_index_object'
     }
 }
 
+NO_SUCH_KEY_CLIENT_ERROR = ClientError(
+    operation_name='GetObject',
+    error_response={'Error': {'Code': 'NoSuchKey'}}
+)
+
 
 @pytest.fixture(name="mock_download_s3_json_object_exception")
 def _download_s3_json_object_with_exception():
@@ -57,6 +74,30 @@ def _download_s3_json_object_():
         yield mock
 
 
+@pytest.fixture(name="mock_download_s3_object_as_bytes")
+def _download_s3_object_as_bytes():
+    with patch.object(
+            etl_state_module, 'download_s3_object_as_bytes'
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(name="mock_download_s3_object_as_string")
+def _download_s3_object_as_string():
+    with patch.object(
+            etl_state_module, 'download_s3_object_as_string'
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(name="mock_upload_s3_object")
+def _upload_s3_object():
+    with patch.object(
+            etl_state_module, 'upload_s3_object'
+    ) as mock:
+        yield mock
+
+
 class TestUpdateObjectLatestDates:
     def test_should_add_key_if_not_existing_in_existing_state(self):
         existing_state = {
@@ -154,3 +195,115 @@ class TestGetStoredeJPXmlProcessingState:
             ejp_config.s3_object_key_pattern: expected_date
         }
         assert stored_state == expected_stored_state
+
+
+class TestGetStoredMemberDigestIndex:
+    def test_should_return_none_if_not_configured(self):
+        ejp_config = eJPXmlDataConfig({
+            key: value
+            for key, value in EJP_XML_CONFIG.items()
+            if key != 'memberDigestIndex'
+        }, '')
+        assert get_stored_member_digest_index(ejp_config) is None
+
+    def test_should_return_empty_index_if_no_index_file_in_bucket(
+            self, mock_download_s3_object_as_bytes
+    ):
+        mock_download_s3_object_as_bytes.side_effect = NO_SUCH_KEY_CLIENT_ERROR
+        ejp_config = eJPXmlDataConfig(EJP_XML_CONFIG, '')
+        member_digest_index = get_stored_member_digest_index(ejp_config)
+        assert member_digest_index is not None
+        assert not member_digest_index.digest_by_manuscript_number
+
+    def test_should_load_index_from_file_in_bucket(
+            self, mock_download_s3_object_as_bytes
+    ):
+        mock_download_s3_object_as_bytes.return_value = (
+            serialize_member_digest_index(MemberDigestIndex({'key1': 'digest1'}))
+        )
+        ejp_config = eJPXmlDataConfig(EJP_XML_CONFIG, '')
+        member_digest_index = get_stored_member_digest_index(ejp_config)
+        assert member_digest_index is not None
+        assert member_digest_index.digest_by_manuscript_number == {
+            'key1': 'digest1'
+        }
+        mock_download_s3_object_as_bytes.assert_called_with(
+            'state_file_bucket', 'member_digest_index_object'
+        )
+
+
+class TestGetStoredProcessedObjectManifest:
+    def test_should_derive_manifest_object_from_state_file_object(self):
+        ejp_config = eJPXmlDataConfig(EJP_XML_CONFIG, '')
+        assert ejp_config.state_manifest_file_object == (
+            'state_file_object-manifest.jsonl'
+        )
+
+    def test_should_return_none_if_no_manifest_file_in_bucket(
+            self, mock_download_s3_object_as_string
+    ):
+        mock_download_s3_object_as_string.side_effect = NO_SUCH_KEY_CLIENT_ERROR
+        ejp_config = eJPXmlDataConfig(EJP_XML_CONFIG, '')
+        assert get_stored_processed_object_manifest(ejp_config) is None
+
+    def test_should_load_manifest_from_file_in_bucket(
+            self, mock_download_s3_object_as_string
+    ):
+        mock_download_s3_object_as_string.return_value = (
+            '{"key":"key1","etag":"etag1","size":1,'
+            '"last_modified":"2020-01-01T00:00:00+00:00"}\n'
+        )
+        ejp_config = eJPXmlDataConfig(EJP_XML_CONFIG, '')
+        processed_object_manifest = get_stored_processed_object_manifest(
+            ejp_config
+        )
+        assert processed_object_manifest is not None
+        assert processed_object_manifest.is_processed({
+            'Key': 'key1', 'ETag': 'etag1', 'Size': 1
+        })
+        mock_download_s3_object_as_string.assert_called_with(
+            'state_file_bucket', 'state_file_object-manifest.jsonl'
+        )
+
+
+class TestUpdateProcessedObjectManifest:
+    def test_should_add_object_compact_and_upload_manifest(
+            self, mock_upload_s3_object
+    ):
+        ejp_config = eJPXmlDataConfig(EJP_XML_CONFIG, '')
+        previous_s3_object_meta = {
+            'Key': 'key0', 'ETag': 'etag0', 'Size': 1,
+            'LastModified': datetime(2020, 1, 1, tzinfo=timezone.utc)
+        }
+        s3_object_meta = {
+            'Key': 'key1', 'ETag': 'etag1', 'Size': 1,
+            'LastModified': datetime(2020, 1, 2, tzinfo=timezone.utc)
+        }
+        processed_object_manifest = update_processed_object_manifest(
+            update_processed_object_manifest(
+                None, previous_s3_object_meta, ejp_config
+            ),
+            s3_object_meta,
+            ejp_config
+        )
+        assert processed_object_manifest is not None
+        assert list(processed_object_manifest.entry_by_key.keys()) == ['key1']
+        _, upload_kwargs = mock_upload_s3_object.call_args
+        assert upload_kwargs['object_key'] == 'state_file_object-manifest.jsonl'
+        assert len(upload_kwargs['data_object'].splitlines()) == 1
+
+
+class TestUpdateStoredEtlMetrics:
+    def test_should_upload_metrics_next_to_state_file(
+            self, mock_upload_s3_object
+    ):
+        update_stored_etl_metrics(
+            EtlMetrics('prefix/file1.zip'),
+            eJPXmlDataConfig(EJP_XML_CONFIG, ''),
+            'prefix/file1.zip'
+        )
+        _, upload_kwargs = mock_upload_s3_object.call_args
+        assert upload_kwargs['bucket'] == 'state_file_bucket'
+        assert upload_kwargs['object_key'] == (
+            'state_file_object-metrics/prefix/file1.zip.json'
+        )
@@ -0,0 +1,190 @@
+import json
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+from zipfile import ZipFile
+
+import pytest
+# pylint: disable=no-name-in-module
+from lxml import etree
+from lxml.builder import E
+
+from ejp_xml_pipeline import etl as etl_module
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.data_store.local_s3_data_service import (
+    LOCAL_S3_ROOT_DIR_ENV_VAR_NAME
+)
+from ejp_xml_pipeline.data_store.s3_data_service import (
+    download_s3_object_as_string,
+    upload_s3_object
+)
+from ejp_xml_pipeline.etl import etl_ejp_xml_zip
+from ejp_xml_pipeline.etl_state import get_stored_zip_progress
+
+
+DEPLOYMENT_ENV = 'test'
+
+OBJECT_KEY_1 = 'prefix/ejp_elife_2021_01_01.zip'
+
+MEMBER_COUNT = 5
+
+MULTIPART_UPLOAD_CONFIG_DICT = {
+    'maxConcurrency': 2
+}
+
+DATA_CONFIG_DICT = {
+    'eJPXmlBucket': 'bucket1',
+    'tempS3FileStorage': {
+        'bucket': 'temp-bucket1',
+        'objectPrefix': 'temp-prefix'
+    },
+    'zipCheckpoint': {
+        'memberCount': 2
+    },
+    'zipReadAhead': {
+        'queueSize': 0
+    },
+    'multipartUpload': MULTIPART_UPLOAD_CONFIG_DICT
+}
+
+
+def _get_zip_bytes() -> bytes:
+    filenames = [f'file{member_index}.xml' for member_index in range(MEMBER_COUNT)]
+    out = BytesIO()
+    with ZipFile(out, 'w') as zip_file:
+        # pylint: disable=c-extension-no-member
+        zip_file.writestr('go.xml', etree.tostring(E.file_list(
+            *[E.file_nm(filename) for filename in filenames],
+            create_date='2018-01-01 03:04:05'
+        )))
+        for member_index, filename in enumerate(filenames):
+            zip_file.writestr(filename, etree.tostring(
+                E.xml(E.manuscript(E.country(f'Country {member_index}')))
+            ))
+    return out.getvalue()
+
+
+def _get_uploaded_countries(
+        data_config: eJPXmlDataConfig,
+        uploaded_object_keys_by_entity_name: Dict[str, List[str]]
+) -> List[str]:
+    return [
+        json.loads(line)['country']
+        for object_key in uploaded_object_keys_by_entity_name['Manuscript']
+        for line in download_s3_object_as_string(
+            data_config.temp_file_s3_bucket, object_key
+        ).splitlines()
+    ]
+
+
+def _get_data_config(multipart_upload_config: dict) -> eJPXmlDataConfig:
+    return eJPXmlDataConfig(
+        {
+            **DATA_CONFIG_DICT,
+            'multipartUpload': {
+                **MULTIPART_UPLOAD_CONFIG_DICT,
+                **multipart_upload_config
+            }
+        },
+        DEPLOYMENT_ENV
+    )
+
+
+@pytest.fixture(name='local_s3_root_dir')
+def _local_s3_root_dir(tmp_path: Path):
+    with patch.dict(os.environ, {LOCAL_S3_ROOT_DIR_ENV_VAR_NAME: str(tmp_path)}):
+        yield tmp_path
+
+
+@pytest.fixture(name='data_config')
+def _data_config(local_s3_root_dir: Path):  # pylint: disable=unused-argument
+    data_config = eJPXmlDataConfig(DATA_CONFIG_DICT, DEPLOYMENT_ENV)
+    upload_s3_object(data_config.s3_bucket, OBJECT_KEY_1, _get_zip_bytes())
+    return data_config
+
+
+class TestEtlEjpXmlZip:
+    def test_should_upload_completed_members_as_parts(
+            self, data_config: eJPXmlDataConfig
+    ):
+        uploaded_object_keys_by_entity_name = etl_ejp_xml_zip(
+            data_config, OBJECT_KEY_1
+        )
+        assert uploaded_object_keys_by_entity_name['Manuscript'] == [
+            f'temp-prefix/Manuscript/{OBJECT_KEY_1}.part-{part_number:05d}.json'
+            for part_number in [1, 2, 3]
+        ]
+        assert _get_uploaded_countries(
+            data_config, uploaded_object_keys_by_entity_name
+        ) == [f'Country {member_index}' for member_index in range(MEMBER_COUNT)]
+        assert get_stored_zip_progress(data_config, OBJECT_KEY_1) is None
+
+    def test_should_upload_parts_larger_than_multipart_part_size(
+            self, data_config: eJPXmlDataConfig
+    ):
+        data_config = _get_data_config({'partSizeBytes': 10})
+        uploaded_object_keys_by_entity_name = etl_ejp_xml_zip(
+            data_config, OBJECT_KEY_1
+        )
+        assert _get_uploaded_countries(
+            data_config, uploaded_object_keys_by_entity_name
+        ) == [f'Country {member_index}' for member_index in range(MEMBER_COUNT)]
+
+    def test_should_upload_temp_files_if_multipart_upload_is_disabled(
+            self, data_config: eJPXmlDataConfig
+    ):
+        data_config = _get_data_config({'maxConcurrency': 0})
+        uploaded_object_keys_by_entity_name = etl_ejp_xml_zip(
+            data_config, OBJECT_KEY_1
+        )
+        assert len(uploaded_object_keys_by_entity_name['Manuscript']) == 3
+        assert _get_uploaded_countries(
+            data_config, uploaded_object_keys_by_entity_name
+        ) == [f'Country {member_index}' for member_index in range(MEMBER_COUNT)]
+
+    def test_should_abort_multipart_uploads_of_failed_part(
+            self, data_config: eJPXmlDataConfig, local_s3_root_dir: Path
+    ):
+        data_config = _get_data_config({'partSizeBytes': 10})
+        with patch.object(
+                etl_module.ZipCheckpointer, 'on_member_completed',
+                side_effect=RuntimeError('test error')
+        ):
+            with pytest.raises(RuntimeError):
+                etl_ejp_xml_zip(data_config, OBJECT_KEY_1)
+        assert not list(local_s3_root_dir.glob('.multipart-uploads/*'))
+        assert not list(local_s3_root_dir.glob(
+            f'{data_config.temp_file_s3_bucket}/**/*.json'
+        ))
+
+    def test_should_resume_with_next_member_after_failure(
+            self, data_config: eJPXmlDataConfig
+    ):
+        original_write_entities = etl_module.write_entities_in_parsed_doc_to_file
+        written_document_count = 0
+
+        def write_entities_and_fail_on_fourth_document(*args, **kwargs):
+            nonlocal written_document_count
+            written_document_count += 1
+            if written_document_count == 4:
+                raise RuntimeError('test error')
+            original_write_entities(*args, **kwargs)
+
+        with patch.object(
+                etl_module, 'write_entities_in_parsed_doc_to_file',
+                write_entities_and_fail_on_fourth_document
+        ):
+            with pytest.raises(RuntimeError):
+                etl_ejp_xml_zip(data_config, OBJECT_KEY_1)
+        zip_progress = get_stored_zip_progress(data_config, OBJECT_KEY_1)
+        assert zip_progress is not None
+        assert zip_progress.completed_member_count == 2
+
+        uploaded_object_keys_by_entity_name = etl_ejp_xml_zip(
+            data_config, OBJECT_KEY_1
+        )
+        assert _get_uploaded_countries(
+            data_config, uploaded_object_keys_by_entity_name
+        ) == [f'Country {member_index}' for member_index in range(MEMBER_COUNT)]
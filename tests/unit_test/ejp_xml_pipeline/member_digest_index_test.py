@@ -0,0 +1,81 @@
+from ejp_xml_pipeline.member_digest_index import (
+    MemberDigestIndex,
+    get_member_digest,
+    serialize_member_digest_index,
+    deserialize_member_digest_index
+)
+
+
+MANUSCRIPT_NUMBER_1 = 'eLife-12345'
+MANUSCRIPT_NUMBER_2 = 'eLife-12346'
+
+XML_BYTES_1 = b'<xml>1</xml>'
+XML_BYTES_2 = b'<xml>2</xml>'
+
+
+class TestGetMemberDigest:
+    def test_should_return_same_digest_for_same_bytes(self):
+        assert get_member_digest(XML_BYTES_1) == get_member_digest(XML_BYTES_1)
+
+    def test_should_return_different_digest_for_different_bytes(self):
+        assert get_member_digest(XML_BYTES_1) != get_member_digest(XML_BYTES_2)
+
+
+class TestMemberDigestIndex:
+    def test_should_not_skip_new_member(self):
+        member_digest_index = MemberDigestIndex()
+        assert not member_digest_index.should_skip_member(
+            MANUSCRIPT_NUMBER_1, XML_BYTES_1
+        )
+        assert member_digest_index.processed_count == 1
+        assert member_digest_index.skipped_count == 0
+
+    def test_should_skip_unchanged_member(self):
+        member_digest_index = MemberDigestIndex({
+            MANUSCRIPT_NUMBER_1: get_member_digest(XML_BYTES_1)
+        })
+        assert member_digest_index.should_skip_member(
+            MANUSCRIPT_NUMBER_1, XML_BYTES_1
+        )
+        assert member_digest_index.processed_count == 0
+        assert member_digest_index.skipped_count == 1
+
+    def test_should_not_skip_and_update_changed_member(self):
+        member_digest_index = MemberDigestIndex({
+            MANUSCRIPT_NUMBER_1: get_member_digest(XML_BYTES_1)
+        })
+        assert not member_digest_index.should_skip_member(
+            MANUSCRIPT_NUMBER_1, XML_BYTES_2
+        )
+        assert member_digest_index.digest_by_manuscript_number == {
+            MANUSCRIPT_NUMBER_1: get_member_digest(XML_BYTES_2)
+        }
+
+    def test_should_not_skip_unchanged_member_if_forcing_full_reprocess(self):
+        member_digest_index = MemberDigestIndex(
+            {MANUSCRIPT_NUMBER_1: get_member_digest(XML_BYTES_1)},
+            force_full_reprocess=True
+        )
+        assert not member_digest_index.should_skip_member(
+            MANUSCRIPT_NUMBER_1, XML_BYTES_1
+        )
+        assert member_digest_index.processed_count == 1
+
+
+class TestSerializeMemberDigestIndex:
+    def test_should_deserialize_serialized_index(self):
+        digest_by_manuscript_number = {
+            MANUSCRIPT_NUMBER_1: get_member_digest(XML_BYTES_1),
+            MANUSCRIPT_NUMBER_2: get_member_digest(XML_BYTES_2)
+        }
+        member_digest_index = deserialize_member_digest_index(
+            serialize_member_digest_index(
+                MemberDigestIndex(digest_by_manuscript_number)
+            ),
+            force_full_reprocess=True
+        )
+        assert (
+            member_digest_index.digest_by_manuscript_number
+            == digest_by_manuscript_number
+        )
+        assert member_digest_index.force_full_reprocess
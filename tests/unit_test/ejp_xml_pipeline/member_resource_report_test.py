@@ -0,0 +1,123 @@
+import tracemalloc
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ejp_xml_pipeline import member_resource_report as member_resource_report_module
+from ejp_xml_pipeline.member_resource_report import (
+    MemberResourceReport,
+    MemberResourceUsage,
+    reset_traced_memory_peak
+)
+
+
+XML_FILE_1 = 'file1.xml'
+XML_FILE_2 = 'file2.xml'
+XML_FILE_3 = 'file3.xml'
+
+
+@pytest.fixture(name='perf_counter_mock')
+def _perf_counter_mock():
+    with patch.object(member_resource_report_module.time, 'perf_counter') as mock:
+        yield mock
+
+
+@pytest.fixture(name='get_current_rss_bytes_mock')
+def _get_current_rss_bytes_mock():
+    with patch.object(member_resource_report_module, 'get_current_rss_bytes') as mock:
+        yield mock
+
+
+class TestResetTracedMemoryPeak:
+    def test_should_return_current_traced_memory(self):
+        tracemalloc.start()
+        try:
+            current_traced_memory = reset_traced_memory_peak()
+            assert current_traced_memory >= 0
+            _, peak_traced_memory = tracemalloc.get_traced_memory()
+            assert peak_traced_memory >= current_traced_memory
+        finally:
+            tracemalloc.stop()
+
+
+class TestMemberResourceReport:
+    def test_should_record_parse_seconds_without_tracing_memory(
+            self, perf_counter_mock: MagicMock
+    ):
+        perf_counter_mock.side_effect = [10.0, 10.5]
+        member_resource_report = MemberResourceReport()
+        member_resource_report.start()
+        with member_resource_report.measure(XML_FILE_1, 100):
+            pass
+        member_resource_report.stop()
+        assert not tracemalloc.is_tracing()
+        assert member_resource_report.get_top_usages('parse_seconds') == [MemberResourceUsage(
+            filename=XML_FILE_1, xml_bytes=100, parse_seconds=0.5
+        )]
+
+    def test_should_not_record_usage_if_measured_block_raises_error(self):
+        member_resource_report = MemberResourceReport()
+        with pytest.raises(RuntimeError):
+            with member_resource_report.measure(XML_FILE_1, 100):
+                raise RuntimeError('failed')
+        assert member_resource_report.member_count == 0
+        assert not member_resource_report.get_top_usages('parse_seconds')
+
+    def test_should_trace_memory_and_rss_growth(
+            self, get_current_rss_bytes_mock: MagicMock
+    ):
+        get_current_rss_bytes_mock.side_effect = [1000, 1500]
+        member_resource_report = MemberResourceReport(trace_memory=True)
+        member_resource_report.start()
+        try:
+            assert tracemalloc.is_tracing()
+            with member_resource_report.measure(XML_FILE_1, 100):
+                allocated = [bytearray(100000)]
+            del allocated
+        finally:
+            member_resource_report.stop()
+        assert not tracemalloc.is_tracing()
+        usage = member_resource_report.get_top_usages('peak_traced_memory_bytes')[0]
+        assert (usage.peak_traced_memory_bytes or 0) >= 100000
+        assert usage.rss_growth_bytes == 500
+
+    def test_should_not_stop_tracemalloc_started_by_caller(self):
+        tracemalloc.start()
+        try:
+            member_resource_report = MemberResourceReport(trace_memory=True)
+            member_resource_report.start()
+            member_resource_report.stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_should_summarize_top_n_members_by_parse_seconds(
+            self, perf_counter_mock: MagicMock
+    ):
+        perf_counter_mock.side_effect = [0.0, 1.0, 0.0, 3.0, 0.0, 2.0]
+        member_resource_report = MemberResourceReport(top_n=2)
+        for filename in [XML_FILE_1, XML_FILE_2, XML_FILE_3]:
+            with member_resource_report.measure(filename, 100):
+                pass
+        assert member_resource_report.get_summary() == {
+            'member_count': 3,
+            'top_by_parse_seconds': [
+                {'filename': XML_FILE_2, 'xml_bytes': 100, 'parse_seconds': 3.0},
+                {'filename': XML_FILE_3, 'xml_bytes': 100, 'parse_seconds': 2.0}
+            ]
+        }
+
+    def test_should_only_keep_top_n_usages_and_count_all_members(self):
+        member_resource_report = MemberResourceReport(top_n=2)
+        for parse_seconds in [1.0, 3.0, 2.0, 3.0, 0.5]:
+            member_resource_report.add_usage(MemberResourceUsage(
+                filename=f'file{parse_seconds}.xml',
+                xml_bytes=100,
+                parse_seconds=parse_seconds
+            ))
+        assert member_resource_report.member_count == 5
+        assert [
+            usage.parse_seconds
+            for usage in member_resource_report.get_top_usages('parse_seconds')
+        ] == [3.0, 3.0]
+        assert not member_resource_report.get_top_usages('rss_growth_bytes')
@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+
+from ejp_xml_pipeline.processed_object_manifest import (
+    ProcessedObjectManifest,
+    is_unprocessed_s3_object,
+    serialize_processed_object_manifest,
+    deserialize_processed_object_manifest
+)
+
+
+TIMESTAMP_1 = datetime(2020, 1, 1, 1, 1, 1, tzinfo=timezone.utc)
+TIMESTAMP_2 = datetime(2020, 1, 1, 1, 1, 2, tzinfo=timezone.utc)
+
+S3_OBJECT_META_1 = {
+    'Key': 'prefix/ejp_elife_2020_01_01a.zip',
+    'ETag': '"etag1"',
+    'Size': 123,
+    'LastModified': TIMESTAMP_1
+}
+
+S3_OBJECT_META_2 = {
+    'Key': 'prefix/ejp_elife_2020_01_01b.zip',
+    'ETag': '"etag2"',
+    'Size': 456,
+    'LastModified': TIMESTAMP_1
+}
+
+S3_OBJECT_META_3 = {
+    'Key': 'prefix/ejp_elife_2020_01_02.zip',
+    'ETag': '"etag3"',
+    'Size': 789,
+    'LastModified': TIMESTAMP_2
+}
+
+
+class TestProcessedObjectManifest:
+    def test_should_not_consider_unknown_object_processed(self):
+        assert not ProcessedObjectManifest().is_processed(S3_OBJECT_META_1)
+
+    def test_should_consider_added_object_processed(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        assert processed_object_manifest.is_processed(S3_OBJECT_META_1)
+        assert not processed_object_manifest.is_processed(S3_OBJECT_META_2)
+
+    def test_should_not_consider_replaced_object_processed(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        assert not processed_object_manifest.is_processed({
+            **S3_OBJECT_META_1,
+            'ETag': '"other"'
+        })
+
+    def test_should_drop_entries_before_watermark_when_compacting(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        processed_object_manifest.add(S3_OBJECT_META_3)
+        processed_object_manifest.compact(TIMESTAMP_2)
+        assert list(processed_object_manifest.entry_by_key.keys()) == [
+            S3_OBJECT_META_3['Key']
+        ]
+
+    def test_should_return_last_processed_key(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_3)
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        assert processed_object_manifest.last_processed_key == (
+            S3_OBJECT_META_3['Key']
+        )
+
+    def test_should_return_none_last_processed_key_if_empty(self):
+        assert ProcessedObjectManifest().last_processed_key is None
+
+
+class TestIsUnprocessedS3Object:
+    def test_should_use_exclusive_watermark_without_manifest(self):
+        assert not is_unprocessed_s3_object(S3_OBJECT_META_1, TIMESTAMP_1)
+        assert is_unprocessed_s3_object(S3_OBJECT_META_3, TIMESTAMP_1)
+
+    def test_should_include_unprocessed_object_at_watermark_with_manifest(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        assert not is_unprocessed_s3_object(
+            S3_OBJECT_META_1, TIMESTAMP_1, processed_object_manifest
+        )
+        assert is_unprocessed_s3_object(
+            S3_OBJECT_META_2, TIMESTAMP_1, processed_object_manifest
+        )
+
+    def test_should_exclude_object_before_watermark_with_manifest(self):
+        assert not is_unprocessed_s3_object(
+            S3_OBJECT_META_1, TIMESTAMP_2, ProcessedObjectManifest()
+        )
+
+
+class TestSerializeProcessedObjectManifest:
+    def test_should_deserialize_serialized_manifest(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        processed_object_manifest.add(S3_OBJECT_META_3)
+        jsonl_string = serialize_processed_object_manifest(
+            processed_object_manifest
+        )
+        assert len(jsonl_string.splitlines()) == 2
+        assert deserialize_processed_object_manifest(
+            jsonl_string
+        ).entry_by_key == processed_object_manifest.entry_by_key
+
+    def test_should_let_last_appended_entry_win(self):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        jsonl_string = serialize_processed_object_manifest(
+            processed_object_manifest
+        )
+        processed_object_manifest.add({**S3_OBJECT_META_1, 'ETag': '"etag2"'})
+        jsonl_string += serialize_processed_object_manifest(
+            processed_object_manifest
+        )
+        assert deserialize_processed_object_manifest(
+            jsonl_string
+        ).entry_by_key[S3_OBJECT_META_1['Key']]['etag'] == '"etag2"'
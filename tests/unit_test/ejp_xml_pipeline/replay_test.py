@@ -0,0 +1,189 @@
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ejp_xml_pipeline import replay as replay_module
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.replay import (
+    get_replay_data_config_dict,
+    iter_replay_object_keys_in_range,
+    load_checkpoint_completed_object_keys,
+    run_replay
+)
+
+
+DEPLOYMENT_ENV = 'test'
+
+OBJECT_KEY_1 = 'prefix/ejp_elife_2021_01_01.zip'
+OBJECT_KEY_2 = 'prefix/ejp_elife_2021_01_02.zip'
+OBJECT_KEY_3 = 'prefix/ejp_elife_2021_01_03.zip'
+
+DATA_CONFIG_DICT = {
+    'gcpProjectName': 'project1',
+    'dataset': 'dataset1',
+    'manuscriptTable': 'manuscript',
+    'manuscriptVersionTable': 'manuscript_version',
+    'personTable': 'person',
+    'personVersion2Table': 'person_v2',
+    'eJPXmlBucket': 'bucket1',
+    'eJPXmlObjectKeyPattern': 'prefix/ejp_elife_*',
+    'tempS3FileStorage': {
+        'bucket': 'temp-bucket1',
+        'objectPrefix': 'temp-prefix'
+    },
+    'memberDigestIndex': {
+        'object': 'member-digest-index.json.gz'
+    }
+}
+
+
+def _get_uploaded_object_keys_by_entity_name(object_key: str) -> dict:
+    return {'Manuscript': [f'temp-prefix-replay/Manuscript/{object_key}.json']}
+
+
+@pytest.fixture(name='etl_ejp_xml_zip_mock')
+def _etl_ejp_xml_zip_mock():
+    with patch.object(replay_module, 'etl_ejp_xml_zip') as mock:
+        mock.side_effect = (
+            lambda _data_config, object_key: (
+                _get_uploaded_object_keys_by_entity_name(object_key)
+            )
+        )
+        yield mock
+
+
+@pytest.fixture(name='download_load2bq_cleanup_temp_files_mock')
+def _download_load2bq_cleanup_temp_files_mock():
+    with patch.object(replay_module, 'download_load2bq_cleanup_temp_files') as mock:
+        yield mock
+
+
+@pytest.fixture(name='iter_s3_object_metas_mock')
+def _iter_s3_object_metas_mock():
+    with patch.object(replay_module, 'iter_s3_object_metas') as mock:
+        yield mock
+
+
+def _get_etl_object_keys(etl_ejp_xml_zip_mock: MagicMock) -> list:
+    return [
+        call_args[0][1]
+        for call_args in etl_ejp_xml_zip_mock.call_args_list
+    ]
+
+
+def _get_loaded_temp_object_keys(
+        download_load2bq_cleanup_temp_files_mock: MagicMock
+) -> list:
+    return [
+        [file_metadata['Key'] for file_metadata, _ in call_args[0][0]]
+        for call_args in download_load2bq_cleanup_temp_files_mock.call_args_list
+    ]
+
+
+class TestGetReplayDataConfigDict:
+    def test_should_use_separate_temp_prefix_and_no_member_digest_index(self):
+        data_config = eJPXmlDataConfig(
+            get_replay_data_config_dict(DATA_CONFIG_DICT), DEPLOYMENT_ENV
+        )
+        assert data_config.temp_file_s3_obj_prefix == 'temp-prefix-replay'
+        assert data_config.member_digest_index_object is None
+        assert data_config.dataset == 'dataset1'
+
+    def test_should_override_dataset_with_target_dataset(self):
+        data_config = eJPXmlDataConfig(
+            get_replay_data_config_dict(
+                DATA_CONFIG_DICT, target_dataset='target_dataset1'
+            ),
+            DEPLOYMENT_ENV
+        )
+        assert data_config.dataset == 'target_dataset1'
+
+
+class TestIterReplayObjectKeysInRange:
+    def test_should_select_matching_keys_within_range(
+            self, iter_s3_object_metas_mock: MagicMock
+    ):
+        iter_s3_object_metas_mock.return_value = [
+            {'Key': key}
+            for key in [
+                OBJECT_KEY_1, OBJECT_KEY_2, 'prefix/other.zip', OBJECT_KEY_3
+            ]
+        ]
+        assert list(iter_replay_object_keys_in_range(
+            eJPXmlDataConfig(DATA_CONFIG_DICT, DEPLOYMENT_ENV),
+            start_after=OBJECT_KEY_1,
+            end_at=OBJECT_KEY_2
+        )) == [OBJECT_KEY_2]
+        iter_s3_object_metas_mock.assert_called_with('bucket1', 'prefix/ejp_elife_')
+
+
+class TestRunReplay:
+    def test_should_etl_and_load_uploaded_temp_objects_in_batches(
+            self,
+            etl_ejp_xml_zip_mock: MagicMock,
+            download_load2bq_cleanup_temp_files_mock: MagicMock,
+            tmp_path: Path
+    ):
+        checkpoint_file_path = str(tmp_path / 'checkpoint.json')
+        run_replay(
+            DATA_CONFIG_DICT,
+            DEPLOYMENT_ENV,
+            [OBJECT_KEY_1, OBJECT_KEY_2, OBJECT_KEY_3],
+            checkpoint_file_path=checkpoint_file_path,
+            batch_size=2
+        )
+        assert _get_etl_object_keys(etl_ejp_xml_zip_mock) == [
+            OBJECT_KEY_1, OBJECT_KEY_2, OBJECT_KEY_3
+        ]
+        assert _get_loaded_temp_object_keys(
+            download_load2bq_cleanup_temp_files_mock
+        ) == [
+            [
+                *_get_uploaded_object_keys_by_entity_name(OBJECT_KEY_1)['Manuscript'],
+                *_get_uploaded_object_keys_by_entity_name(OBJECT_KEY_2)['Manuscript']
+            ],
+            _get_uploaded_object_keys_by_entity_name(OBJECT_KEY_3)['Manuscript']
+        ]
+        assert download_load2bq_cleanup_temp_files_mock.call_args[0][4] == (
+            'manuscript'
+        )
+        assert load_checkpoint_completed_object_keys(checkpoint_file_path) == {
+            OBJECT_KEY_1, OBJECT_KEY_2, OBJECT_KEY_3
+        }
+
+    def test_should_resume_after_last_completed_batch(
+            self,
+            etl_ejp_xml_zip_mock: MagicMock,
+            download_load2bq_cleanup_temp_files_mock: MagicMock,
+            tmp_path: Path
+    ):
+        checkpoint_file_path = str(tmp_path / 'checkpoint.json')
+        download_load2bq_cleanup_temp_files_mock.side_effect = [
+            None, RuntimeError('failed')
+        ]
+        with pytest.raises(RuntimeError):
+            run_replay(
+                DATA_CONFIG_DICT,
+                DEPLOYMENT_ENV,
+                [OBJECT_KEY_1, OBJECT_KEY_2, OBJECT_KEY_3],
+                checkpoint_file_path=checkpoint_file_path,
+                batch_size=2
+            )
+        assert load_checkpoint_completed_object_keys(checkpoint_file_path) == {
+            OBJECT_KEY_1, OBJECT_KEY_2
+        }
+
+        etl_ejp_xml_zip_mock.reset_mock()
+        download_load2bq_cleanup_temp_files_mock.side_effect = None
+        run_replay(
+            DATA_CONFIG_DICT,
+            DEPLOYMENT_ENV,
+            [OBJECT_KEY_1, OBJECT_KEY_2, OBJECT_KEY_3],
+            checkpoint_file_path=checkpoint_file_path,
+            batch_size=2
+        )
+        assert _get_etl_object_keys(etl_ejp_xml_zip_mock) == [OBJECT_KEY_3]
+        assert load_checkpoint_completed_object_keys(checkpoint_file_path) == {
+            OBJECT_KEY_1, OBJECT_KEY_2, OBJECT_KEY_3
+        }
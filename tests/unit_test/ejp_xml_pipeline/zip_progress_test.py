@@ -0,0 +1,30 @@
+from ejp_xml_pipeline.zip_progress import (
+    ZipProgress,
+    deserialize_zip_progress,
+    serialize_zip_progress
+)
+
+
+ZIP_DIGEST_1 = 'digest1'
+
+
+class TestZipProgress:
+    def test_should_add_parts(self):
+        zip_progress = ZipProgress(ZIP_DIGEST_1)
+        zip_progress.add_part(2, {'Manuscript': 'part1.json'})
+        zip_progress.add_part(4, {'Manuscript': 'part2.json', 'Person': 'part2.json'})
+        assert zip_progress.completed_member_count == 4
+        assert zip_progress.next_part_number == 3
+        assert zip_progress.uploaded_object_keys_by_entity_name == {
+            'Manuscript': ['part1.json', 'part2.json'],
+            'Person': ['part2.json']
+        }
+
+    def test_should_serialize_and_deserialize(self):
+        zip_progress = ZipProgress(ZIP_DIGEST_1)
+        zip_progress.add_part(2, {'Manuscript': 'part1.json'})
+        result = deserialize_zip_progress(serialize_zip_progress(zip_progress))
+        assert result.zip_digest == ZIP_DIGEST_1
+        assert result.completed_member_count == 2
+        assert result.part_count == 1
+        assert result.uploaded_object_keys == ['part1.json']
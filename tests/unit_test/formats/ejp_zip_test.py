@@ -17,10 +17,25 @@ from ejp_xml_pipeline.utils.xml_transform_util.timestamp import (
 
 import ejp_xml_pipeline.transform_zip_xml.ejp_zip
 from ejp_xml_pipeline.transform_zip_xml.ejp_zip import (
-    parse_go_xml,
+    ZipManifest,
+    ZipManifestError,
+    check_zip_manifest,
+    iter_parse_go_xml,
     iter_parse_xml_in_zip,
-    join_zip_and_xml_filename
+    join_zip_and_xml_filename,
+    parse_xml_bytes_root
 )
+from ejp_xml_pipeline.etl_metrics import (
+    EtlCounterNames,
+    EtlMetrics,
+    EtlStageNames,
+    get_recovered_xml_error_counter_name
+)
+from ejp_xml_pipeline.member_digest_index import (
+    MemberDigestIndex,
+    get_member_digest
+)
+from ejp_xml_pipeline.member_resource_report import MemberResourceReport
 
 
 TIMESTAMP_1 = '2018-01-01 03:04:05'
@@ -62,22 +77,53 @@ def _create_zip_bytes(file_map: Dict[str, bytes]) -> bytes:
     return out.getvalue()
 
 
-class TestParseGoXml:
+def _get_go_xml_source(create_date, filenames) -> BytesIO:
+    return BytesIO(etree.tostring(_create_go_xml(
+        create_date=create_date,
+        filenames=filenames
+    )))
+
+
+class TestIterParseGoXml:
     def test_should_parse_timestamp(self):
-        zip_manifest = parse_go_xml(_create_go_xml(
+        zip_manifest = iter_parse_go_xml(_get_go_xml_source(
             create_date=TIMESTAMP_1,
             filenames=[]
         ))
         assert zip_manifest.modified_timestamp == parse_timestamp(TIMESTAMP_1)
+        assert zip_manifest.filenames == []
 
     def test_should_parse_file_list(self):
-        zip_manifest = parse_go_xml(_create_go_xml(
+        zip_manifest = iter_parse_go_xml(_get_go_xml_source(
             create_date=TIMESTAMP_1,
             filenames=[XML_FILE_1, XML_FILE_2]
         ))
         assert zip_manifest.filenames == [XML_FILE_1, XML_FILE_2]
 
 
+class TestParseXmlBytesRoot:
+    def test_should_raise_value_error_naming_file_for_non_xml_member(self):
+        with pytest.raises(ValueError) as exc_info:
+            parse_xml_bytes_root(b'not xml at all', filename=XML_FILE_1)
+        assert 'Start tag expected' in str(exc_info.value)
+        assert XML_FILE_1 in str(exc_info.value)
+
+    def test_should_parse_next_member_after_non_xml_member(self):
+        with pytest.raises(ValueError):
+            parse_xml_bytes_root(b'not xml at all', filename=XML_FILE_1)
+        assert parse_xml_bytes_root(b'<xml>text</xml>', filename=XML_FILE_2).tag == 'xml'
+
+
+class TestCheckZipManifest:
+    def test_should_report_missing_and_unlisted_members(self):
+        zip_manifest_check = check_zip_manifest(
+            ZipManifest(parse_timestamp(TIMESTAMP_1), [XML_FILE_1]),
+            ['go.xml', 'folder/', XML_FILE_2]
+        )
+        assert zip_manifest_check.missing_filenames == [XML_FILE_1]
+        assert zip_manifest_check.unlisted_filenames == [XML_FILE_2]
+
+
 class TestIterParseXmlInZip:
     def test_should_parse_single_xml(
             self,
@@ -161,3 +207,247 @@ class TestIterParseXmlInZip:
             ))
             assert parsed_documents
             parse_xml_mock.assert_called_once()
+
+    def test_should_skip_unchanged_xml_and_parse_changed_xml(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_FILE_2]
+        )
+        unchanged_xml_bytes = etree.tostring(E.xml('unchanged'))
+        changed_xml_bytes = etree.tostring(E.xml('changed'))
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: unchanged_xml_bytes,
+            XML_FILE_2: changed_xml_bytes
+        })
+        member_digest_index = MemberDigestIndex({
+            'file1': get_member_digest(unchanged_xml_bytes),
+            'file2': get_member_digest(unchanged_xml_bytes)
+        })
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            parsed_documents = list(iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=ZIP_FILE_1,
+                member_digest_index=member_digest_index
+            ))
+            assert parsed_documents == [parse_xml_mock.return_value]
+            (call_xml_root,), _ = parse_xml_mock.call_args
+            assert etree.tostring(call_xml_root) == changed_xml_bytes
+        assert member_digest_index.skipped_count == 1
+        assert member_digest_index.processed_count == 1
+        assert member_digest_index.digest_by_manuscript_number['file2'] == (
+            get_member_digest(changed_xml_bytes)
+        )
+
+    def test_should_not_skip_unchanged_xml_if_forcing_full_reprocess(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1]
+        )
+        xml_bytes = etree.tostring(E.xml('dummy'))
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: xml_bytes
+        })
+        member_digest_index = MemberDigestIndex(
+            {'file1': get_member_digest(xml_bytes)},
+            force_full_reprocess=True
+        )
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            parsed_documents = list(iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=ZIP_FILE_1,
+                member_digest_index=member_digest_index
+            ))
+            assert parsed_documents == [parse_xml_mock.return_value]
+
+    def test_should_record_metrics_for_parsed_and_skipped_xml(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_FILE_2]
+        )
+        unchanged_xml_bytes = etree.tostring(E.xml('unchanged'))
+        changed_xml_bytes = etree.tostring(E.xml('changed'))
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: unchanged_xml_bytes,
+            XML_FILE_2: changed_xml_bytes
+        })
+        etl_metrics = EtlMetrics(ZIP_FILE_1)
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            list(iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=ZIP_FILE_1,
+                member_digest_index=MemberDigestIndex({
+                    'file1': get_member_digest(unchanged_xml_bytes)
+                }),
+                etl_metrics=etl_metrics
+            ))
+        parse_xml_mock.assert_called_once()
+        assert etl_metrics.count_by_counter == {
+            EtlCounterNames.XML_BYTES: (
+                len(unchanged_xml_bytes) + len(changed_xml_bytes)
+            ),
+            EtlCounterNames.SKIPPED_DOCUMENTS: 1,
+            EtlCounterNames.DOCUMENTS: 1
+        }
+        assert set(etl_metrics.duration_by_stage.keys()) == {
+            EtlStageNames.ZIP_INFLATE,
+            EtlStageNames.XML_PARSE,
+            EtlStageNames.FIELD_MAPPING
+        }
+
+    def test_should_report_resource_usage_of_parsed_xml_only(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_FILE_2]
+        )
+        unchanged_xml_bytes = etree.tostring(E.xml('unchanged'))
+        changed_xml_bytes = etree.tostring(E.xml('changed'))
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: unchanged_xml_bytes,
+            XML_FILE_2: changed_xml_bytes
+        })
+        member_resource_report = MemberResourceReport()
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            list(iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=ZIP_FILE_1,
+                member_digest_index=MemberDigestIndex({
+                    'file1': get_member_digest(unchanged_xml_bytes)
+                }),
+                member_resource_report=member_resource_report
+            ))
+        parse_xml_mock.assert_called_once()
+        assert [
+            (usage.filename, usage.xml_bytes)
+            for usage in member_resource_report.get_top_usages('parse_seconds')
+        ] == [(XML_FILE_2, len(changed_xml_bytes))]
+
+    def test_should_share_repeated_values_across_xml_in_zip(self):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_FILE_2]
+        )
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: etree.tostring(E.xml(E.manuscript(E.country('Country 1')))),
+            XML_FILE_2: etree.tostring(E.xml(E.manuscript(E.country('Country 1'))))
+        })
+        etl_metrics = EtlMetrics()
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            parsed_documents = list(iter_parse_xml_in_zip(
+                zip_file, zip_filename=ZIP_FILE_1, etl_metrics=etl_metrics
+            ))
+        countries = [
+            parsed_document.manuscript.record.country
+            for parsed_document in parsed_documents
+        ]
+        assert countries == ['Country 1', 'Country 1']
+        assert countries[0] is countries[1]
+        assert etl_metrics.count_by_counter[EtlCounterNames.INTERNED_STRINGS] == 1
+
+    def test_should_record_metrics_for_recovered_xml_errors(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1]
+        )
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: b'<xml>\n<title>mismatched</name>\n</xml>'
+        })
+        etl_metrics = EtlMetrics()
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            list(iter_parse_xml_in_zip(
+                zip_file, zip_filename=ZIP_FILE_1, etl_metrics=etl_metrics
+            ))
+        parse_xml_mock.assert_called_once()
+        assert etl_metrics.count_by_counter[EtlCounterNames.RECOVERED_XML_ERRORS] == 1
+        assert etl_metrics.count_by_counter[
+            get_recovered_xml_error_counter_name('ERR_TAG_NAME_MISMATCH')
+        ] == 1
+
+    def test_should_parse_xml_read_ahead_in_background(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_FILE_2]
+        )
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: etree.tostring(E.xml('1')),
+            XML_FILE_2: etree.tostring(E.xml('2'))
+        })
+        etl_metrics = EtlMetrics()
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            parsed_documents = list(iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=ZIP_FILE_1,
+                etl_metrics=etl_metrics,
+                read_ahead_queue_size=1
+            ))
+        assert parsed_documents == [parse_xml_mock.return_value] * 2
+        assert [
+            call_args[0][0].text for call_args in parse_xml_mock.call_args_list
+        ] == ['1', '2']
+        assert EtlStageNames.ZIP_READ_AHEAD_WAIT in etl_metrics.duration_by_stage
+
+    def test_should_fail_before_parsing_if_listed_xml_is_missing(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_FILE_2]
+        )
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: etree.tostring(E.xml('1'))
+        })
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            with pytest.raises(ZipManifestError, match=XML_FILE_2):
+                list(iter_parse_xml_in_zip(zip_file, zip_filename=ZIP_FILE_1))
+        parse_xml_mock.assert_not_called()
+
+    def test_should_count_missing_excluded_and_unlisted_xml(
+            self,
+            parse_xml_mock: MagicMock
+    ):
+        go_xml = _create_go_xml(
+            create_date=TIMESTAMP_1,
+            filenames=[XML_FILE_1, XML_EXCLUSION_FILE_1]
+        )
+        zip_bytes = _create_zip_bytes({
+            'go.xml': etree.tostring(go_xml),
+            XML_FILE_1: etree.tostring(E.xml('1')),
+            XML_FILE_2: etree.tostring(E.xml('2'))
+        })
+        etl_metrics = EtlMetrics()
+        with ZipFile(BytesIO(zip_bytes), 'r') as zip_file:
+            list(iter_parse_xml_in_zip(
+                zip_file,
+                zip_filename=ZIP_FILE_1,
+                xml_filename_exclusion_regex_pattern=XML_FILE_EXCLUSION_PATTERN,
+                etl_metrics=etl_metrics
+            ))
+        parse_xml_mock.assert_called_once()
+        assert etl_metrics.count_by_counter[EtlCounterNames.MISSING_MEMBERS] == 1
+        assert etl_metrics.count_by_counter[EtlCounterNames.UNLISTED_MEMBERS] == 1
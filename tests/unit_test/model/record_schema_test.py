@@ -0,0 +1,258 @@
+import json
+from datetime import datetime
+
+from lxml import etree
+
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.data_store.local_bq_data_service import (
+    get_record_schema_errors
+)
+from ejp_xml_pipeline.model.record_schema import (
+    get_record_json_schema,
+    get_record_schema_field_list
+)
+from ejp_xml_pipeline.model.records import ManuscriptVersionRecord, PersonV2Record
+from ejp_xml_pipeline.transform_json import ProvenanceJsonEncoder
+from ejp_xml_pipeline.transform_zip_xml import ejp_manuscript_xml, ejp_person_xml
+from ejp_xml_pipeline.transform_zip_xml.parsed_document import ParsedDocument
+
+
+TIMESTAMP_1 = '2018-01-01T03:04:05Z'
+
+PROVENANCE_1 = {
+    'source_filename': 'file1.zip/file1.xml',
+    'imported_timestamp': TIMESTAMP_1
+}
+
+DATA_CONFIG_DICT = {
+    'manuscriptTable': 'manuscript',
+    'manuscriptVersionTable': 'manuscript_version',
+    'personTable': 'person',
+    'personVersion2Table': 'person_v2',
+    'tempS3FileStorage': {'bucket': 'temp-bucket1', 'objectPrefix': 'temp-prefix'}
+}
+
+# every element the manuscript xml mapper reads
+MANUSCRIPT_XML = f'''<xml>
+  <manuscript>
+    <country>Country 1</country>
+    <production-data><production-data-doi>10.7554/1</production-data-doi></production-data>
+    <version>
+      <manuscript-number>01-02-2018-RA-eLife-12345</manuscript-number>
+      <manuscript-type>Research Article</manuscript-type>
+      <title>Title 1</title>
+      <abstract>Abstract 1</abstract>
+      <decision>Accept Full Submission</decision>
+      <decision-date>{TIMESTAMP_1}</decision-date>
+      <history><stage>
+        <start-date>{TIMESTAMP_1}</start-date>
+        <stage-name>Stage 1</stage-name>
+        <stage-affective-person-id>person1</stage-affective-person-id>
+      </stage></history>
+      <authors><author>
+        <author-person-id>person1</author-person-id>
+        <author-seq>1</author-seq>
+        <is-corr>true</is-corr>
+      </author></authors>
+      <referees><referee>
+        <referee-person-id>person1</referee-person-id>
+        <referee-sequence>1</referee-sequence>
+        <referee-started-date>{TIMESTAMP_1}</referee-started-date>
+        <referee-due-date>{TIMESTAMP_1}</referee-due-date>
+        <referee-next-chase-date>{TIMESTAMP_1}</referee-next-chase-date>
+        <referee-received-date>{TIMESTAMP_1}</referee-received-date>
+      </referee></referees>
+      <reviewing-editors><reviewing-editor>
+        <reviewing-editor-person-id>person1</reviewing-editor-person-id>
+        <reviewing-editor-assigned-date>{TIMESTAMP_1}</reviewing-editor-assigned-date>
+        <reviewing-editor-decision-due-date>{TIMESTAMP_1}</reviewing-editor-decision-due-date>
+      </reviewing-editor></reviewing-editors>
+      <senior-editors><senior-editor>
+        <senior-editor-person-id>person1</senior-editor-person-id>
+        <senior-editor-assigned-date>{TIMESTAMP_1}</senior-editor-assigned-date>
+      </senior-editor></senior-editors>
+      <potential-reviewers><potential-reviewer>
+        <potential-reviewer-person-id>person1</potential-reviewer-person-id>
+        <potential-reviewer-suggested-to-include>yes</potential-reviewer-suggested-to-include>
+        <potential-reviewer-suggested-to-exclude>no</potential-reviewer-suggested-to-exclude>
+      </potential-reviewer></potential-reviewers>
+      <potential-reviewing-editors><potential-reviewing-editor>
+        <potential-reviewing-editor-person-id>person1</potential-reviewing-editor-person-id>
+      </potential-reviewing-editor></potential-reviewing-editors>
+      <potential-senior-editors><potential-senior-editor>
+        <potential-senior-editor-person-id>person1</potential-senior-editor-person-id>
+      </potential-senior-editor></potential-senior-editors>
+      <author-funding><author-funding>
+        <author-person-id>person1</author-person-id>
+        <funding-seq>1</funding-seq>
+        <funding-title>Funding 1</funding-title>
+        <grant-reference-number>Grant 1</grant-reference-number>
+      </author-funding></author-funding>
+      <themes><theme><theme>Theme 1</theme></theme></themes>
+      <subject-areas><subject-area>
+        <subject-area>Organism 1</subject-area>
+      </subject-area></subject-areas>
+      <keywords><keywords><word>Keyword 1</word></keywords></keywords>
+      <emails><email>
+        <email-from>from@example.org</email-from>
+        <email-to>to@example.org</email-to>
+        <email-cc>cc@example.org</email-cc>
+        <email-bcc>bcc@example.org</email-bcc>
+        <email-date>{TIMESTAMP_1}</email-date>
+        <email-draft>sent</email-draft>
+        <email-subject>Subject 1</email-subject>
+        <email-sender-person-id>person1</email-sender-person-id>
+        <email-recipient-person-id>person2</email-recipient-person-id>
+        <email-triggered-by-person-id>person3</email-triggered-by-person-id>
+      </email></emails>
+    </version>
+  </manuscript>
+  <people><person>
+    <person-id>person1</person-id>
+    <profile-modify-date>{TIMESTAMP_1}</profile-modify-date>
+    <title>Dr</title>
+    <first-name>First</first-name>
+    <middle-name>Middle</middle-name>
+    <last-name>Last</last-name>
+    <institution>Institution 1</institution>
+    <email>person1@example.org</email>
+    <secondary_email>other@example.org</secondary_email>
+    <memberships><membership>
+      <member-type>ORCID</member-type><member-id>orcid1</member-id>
+    </membership></memberships>
+    <roles><role><role-type>Role 1</role-type></role></roles>
+    <addresses><address>
+      <address-type>work</address-type>
+      <address-country>Country 1</address-country>
+      <address-state-province>Area 1</address-state-province>
+      <address-city>City 1</address-city>
+      <address-zip-postal-code>12345</address-zip-postal-code>
+      <address-department>Department 1</address-department>
+      <address-street-address-1>Line 1</address-street-address-1>
+      <address-street-address-2>Line 2</address-street-address-2>
+      <address-start-date>{TIMESTAMP_1}</address-start-date>
+      <address-end-date>{TIMESTAMP_1}</address-end-date>
+    </address></addresses>
+  </person></people>
+</xml>'''
+
+# every element and attribute the person xml mapper reads
+PERSON_XML = f'''<persons><person>
+  <person-id>person1</person-id>
+  <profile-modify-date>{TIMESTAMP_1}</profile-modify-date>
+  <status>Active</status>
+  <title>Dr</title>
+  <first-name>First</first-name>
+  <middle_nm>Middle</middle_nm>
+  <last-name>Last</last-name>
+  <native_nm>Native</native_nm>
+  <institution>Institution 1</institution>
+  <email>person1@example.org</email>
+  <secondary-email>other@example.org</secondary-email>
+  <memberships><membership active_ind="1" member_id_type_cde="ORCID">
+    <member_id>orcid1</member_id>
+    <start_dt>{TIMESTAMP_1}</start_dt>
+    <end_dt>{TIMESTAMP_1}</end_dt>
+    <last_update_dt>{TIMESTAMP_1}</last_update_dt>
+    <last_update_p_id>person2</last_update_p_id>
+  </membership></memberships>
+  <addresses><address active_ind="1" addr_type="work">
+    <country>Country 1</country><state>Area 1</state><city>City 1</city>
+    <zip>12345</zip><organization>Organization 1</organization>
+    <department>Department 1</department><division>Division 1</division>
+    <laboratory>Laboratory 1</laboratory><job_title>Job 1</job_title>
+    <e_mail>person1@example.org</e_mail><telephone>123</telephone>
+    <addr1>Line 1</addr1><addr2>Line 2</addr2><addr3>Line 3</addr3>
+    <start_dt>{TIMESTAMP_1}</start_dt><end_dt>{TIMESTAMP_1}</end_dt>
+  </address></addresses>
+  <organizations><organization>
+    <org-id>org1</org-id><org-name>Organization 1</org-name><org-type>Type 1</org-type>
+  </organization></organizations>
+  <roles><role role_nm="Role 1" active_ind="1" start_dt="{TIMESTAMP_1}" end_dt="{TIMESTAMP_1}">
+    <update_dt>{TIMESTAMP_1}</update_dt><update_p_id>person2</update_p_id>
+  </role></roles>
+  <dates-not-available><dna>
+    <dna-start-date>{TIMESTAMP_1}</dna-start-date><dna-end-date>{TIMESTAMP_1}</dna-end-date>
+  </dna></dates-not-available>
+  <keywords><keyword>Keyword 1</keyword></keywords>
+  <person-tags><person-tag>Tag 1</person-tag></person-tags>
+  <merge-info><merged-into-person-id>person3</merged-into-person-id></merge-info>
+  <subject-area-list name="Research Organism(s)">
+    <subject-area>Organism 1</subject-area>
+  </subject-area-list>
+  <subject-area-list name="Major Subject Area(s)">
+    <subject-area>Area 1</subject-area>
+  </subject-area-list>
+</person></persons>'''
+
+
+def _get_schema_errors_by_entity_name(parsed_document: ParsedDocument) -> dict:
+    entity_type_mapping = eJPXmlDataConfig(
+        DATA_CONFIG_DICT, 'test'
+    ).entity_type_mapping
+    provenance_json_encoder = ProvenanceJsonEncoder()
+    return {
+        type(entity).__name__: get_record_schema_errors(
+            json.loads(provenance_json_encoder.get_record_json(entity.record)),
+            entity_type_mapping[type(entity)].json_schema or []
+        )
+        for entity in parsed_document.get_entities()
+    }
+
+
+class TestGetRecordJsonSchema:
+    def test_should_map_timestamp_and_repeated_fields(self):
+        field_by_name = {
+            field['name']: field
+            for field in get_record_json_schema(ManuscriptVersionRecord)
+        }
+        assert field_by_name['created_timestamp'] == {
+            'name': 'created_timestamp', 'type': 'TIMESTAMP', 'mode': 'NULLABLE'
+        }
+        assert field_by_name['stages']['mode'] == 'REPEATED'
+        assert [
+            field['name'] for field in field_by_name['stages']['fields']
+        ] == ['stage_timestamp', 'stage_name', 'person_id']
+        assert [
+            field['name'] for field in field_by_name['provenance']['fields']
+        ] == ['source_filename', 'imported_timestamp', 'node_index']
+
+    def test_should_map_list_of_strings_to_repeated_string(self):
+        field_by_name = {
+            field['name']: field
+            for field in get_record_json_schema(PersonV2Record)
+        }
+        assert field_by_name['keywords'] == {
+            'name': 'keywords', 'type': 'STRING', 'mode': 'REPEATED'
+        }
+
+    def test_should_emit_bigquery_schema_fields(self):
+        schema_fields = get_record_schema_field_list(PersonV2Record)
+        assert schema_fields[0].name == 'provenance'
+        assert schema_fields[0].field_type == 'RECORD'
+
+
+class TestStaticSchemaConsistency:
+    def test_should_declare_all_fields_emitted_by_manuscript_xml_mapper(self):
+        # pylint: disable=c-extension-no-member
+        parsed_document = ejp_manuscript_xml.parse_xml(
+            etree.fromstring(MANUSCRIPT_XML), datetime(2018, 1, 1), PROVENANCE_1
+        )
+        assert _get_schema_errors_by_entity_name(parsed_document) == {
+            'Person': [], 'Manuscript': [], 'ManuscriptVersion': []
+        }
+
+    def test_should_declare_all_fields_emitted_by_person_xml_mapper(self):
+        # pylint: disable=c-extension-no-member
+        parsed_document = ejp_person_xml.parse_xml(
+            etree.fromstring(PERSON_XML), datetime(2018, 1, 1), PROVENANCE_1
+        )
+        assert _get_schema_errors_by_entity_name(parsed_document) == {
+            'PersonV2': []
+        }
+
+    def test_should_report_fields_not_declared_in_static_schema(self):
+        assert get_record_schema_errors(
+            {'person_id': 'person1', 'other_field': 'value1'},
+            get_record_json_schema(PersonV2Record)
+        ) == ['no such field: other_field']
@@ -0,0 +1,63 @@
+from ejp_xml_pipeline.model.records import (
+    PersonV2Record,
+    PersonV2RoleRecord
+)
+from ejp_xml_pipeline.model.record_serializer import (
+    get_record_dict,
+    get_record_dict_serializer,
+    get_record_json_dict
+)
+
+
+PROVENANCE_1 = {'source_filename': 'file1.zip/file1.xml'}
+
+
+class TestGetRecordDict:
+    def test_should_include_all_fields_with_nested_records_as_dicts(self):
+        record_dict = get_record_dict(PersonV2Record(
+            person_id='person1',
+            roles=[PersonV2RoleRecord(role_name='role1', is_enabled=False)],
+            keywords=['keyword1']
+        ))
+        assert record_dict['person_id'] == 'person1'
+        assert record_dict['first_name'] is None
+        assert record_dict['roles'] == [{
+            'role_name': 'role1',
+            'is_enabled': False,
+            'start_timestamp': None,
+            'end_timestamp': None,
+            'modified_timestamp': None,
+            'modified_by_person_id': None
+        }]
+        assert record_dict['keywords'] == ['keyword1']
+
+    def test_should_not_share_lists_with_record(self):
+        record = PersonV2Record(keywords=['keyword1'])
+        get_record_dict(record)['keywords'].append('keyword2')
+        assert record.keywords == ['keyword1']
+
+    def test_should_generate_serializer_once_per_record_class(self):
+        assert (
+            get_record_dict_serializer(PersonV2Record)
+            is get_record_dict_serializer(PersonV2Record)
+        )
+
+
+class TestGetRecordJsonDict:
+    def test_should_leave_out_empty_values_but_keep_false(self):
+        assert get_record_json_dict(PersonV2Record(
+            person_id='person1',
+            first_name='',
+            roles=[PersonV2RoleRecord(is_enabled=False)],
+            keywords=[]
+        )) == {
+            'person_id': 'person1',
+            'roles': [{'is_enabled': False}]
+        }
+
+    def test_should_exclude_provenance_if_requested(self):
+        record = PersonV2Record(person_id='person1', provenance=PROVENANCE_1)
+        assert get_record_json_dict(record)['provenance'] == PROVENANCE_1
+        assert get_record_json_dict(record, exclude_provenance=True) == {
+            'person_id': 'person1'
+        }
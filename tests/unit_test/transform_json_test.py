@@ -1,4 +1,19 @@
-from ejp_xml_pipeline.transform_json import remove_key_with_null_value
+import json
+from unittest.mock import patch
+
+from ejp_xml_pipeline import transform_json as transform_json_module
+from ejp_xml_pipeline.model.provenance import NodeProvenance
+from ejp_xml_pipeline.model.records import PersonRecord, PersonRoleRecord
+from ejp_xml_pipeline.transform_json import (
+    ProvenanceJsonEncoder,
+    remove_key_with_null_value
+)
+
+
+PROVENANCE_1 = {
+    'source_filename': 'file1.zip/file1.xml',
+    'imported_timestamp': '2021-01-01T00:00:00+00:00'
+}
 
 
 class TestRemoveKeyWithNullValue:
@@ -19,3 +34,54 @@ class TestRemoveKeyWithNullValue:
             'key1': False,
             'other': 'value'
         }) == {'key1': False, 'other': 'value'}
+
+
+class TestProvenanceJsonEncoder:
+    def test_should_encode_record_like_json_dumps(self):
+        record = {'person_id': 'person1', 'provenance': PROVENANCE_1, 'email': None}
+        assert json.loads(ProvenanceJsonEncoder().get_record_json(record)) == {
+            'person_id': 'person1', 'provenance': PROVENANCE_1
+        }
+
+    def test_should_encode_record_without_provenance(self):
+        assert ProvenanceJsonEncoder().get_record_json({'key1': 'value1'}) == (
+            '{"key1": "value1"}'
+        )
+
+    def test_should_encode_typed_record_like_dict_record(self):
+        record = PersonRecord(
+            person_id='person1',
+            provenance=PROVENANCE_1,
+            roles=[PersonRoleRecord(role_name='role1')]
+        )
+        assert ProvenanceJsonEncoder().get_record_json(record) == (
+            ProvenanceJsonEncoder().get_record_json({
+                'person_id': 'person1',
+                'provenance': PROVENANCE_1,
+                'roles': [{'role_name': 'role1'}]
+            })
+        )
+
+    def test_should_encode_node_provenance_with_node_index(self):
+        assert json.loads(ProvenanceJsonEncoder().get_record_json({
+            'provenance': NodeProvenance(PROVENANCE_1, 1)
+        })) == {'provenance': {**PROVENANCE_1, 'node_index': 1}}
+
+    def test_should_remove_zero_node_index_like_other_falsy_values(self):
+        assert json.loads(ProvenanceJsonEncoder().get_record_json({
+            'provenance': NodeProvenance(PROVENANCE_1, 0)
+        })) == {'provenance': PROVENANCE_1}
+
+    def test_should_encode_shared_document_provenance_only_once(self):
+        provenance_json_encoder = ProvenanceJsonEncoder()
+        with patch.object(
+                transform_json_module.json, 'dumps', wraps=json.dumps
+        ) as dumps_mock:
+            for node_index in range(3):
+                provenance_json_encoder.get_record_json({
+                    'person_id': f'person{node_index}',
+                    'provenance': NodeProvenance(PROVENANCE_1, node_index + 1)
+                })
+        assert [
+            call_args[0][0] for call_args in dumps_mock.call_args_list
+        ].count(PROVENANCE_1) == 1
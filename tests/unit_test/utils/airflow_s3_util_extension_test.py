@@ -0,0 +1,132 @@
+import os
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from airflow.exceptions import AirflowException, TaskDeferred
+
+from ejp_xml_pipeline.dag_pipeline_config.xml_config import eJPXmlDataConfig
+from ejp_xml_pipeline.utils import NamedDataPipelineLiterals as NamedLiterals
+from ejp_xml_pipeline.utils.dags import airflow_s3_util_extension
+from ejp_xml_pipeline.utils.dags.airflow_s3_util_extension import (
+    S3NewKeyFromLastDataDownloadDateSensor
+)
+from ejp_xml_pipeline.utils.dags.s3_new_file_monitor import (
+    S3HookNewFileMonitor
+)
+from ejp_xml_pipeline.utils.dags.s3_new_key_trigger import (
+    S3NewKeyFromLastDataDownloadDateTrigger
+)
+from ejp_xml_pipeline.utils.s3_object_snapshot import (
+    NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY
+)
+
+from ..ejp_xml_pipeline.etl_state_test import EJP_XML_CONFIG
+from .s3_new_file_monitor_test import KEY_PATTERN_1, set_listed_objects
+from ..ejp_xml_pipeline.processed_object_manifest_test import (
+    TIMESTAMP_1,
+    TIMESTAMP_2,
+    S3_OBJECT_META_1,
+    S3_OBJECT_META_2
+)
+
+
+@pytest.fixture(name='s3_client_mock')
+def _s3_client_mock():
+    with patch.object(S3HookNewFileMonitor, 'get_conn') as mock:
+        yield mock.return_value
+
+
+@pytest.fixture(name='load_data_config_mock', autouse=True)
+def _load_data_config_mock():
+    with patch.dict(os.environ, {
+        NamedLiterals.EJP_XML_CONFIG_FILE_PATH_ENV_NAME: 'config.yaml'
+    }):
+        with patch.object(
+                airflow_s3_util_extension, 'load_data_config'
+        ) as mock:
+            mock.return_value = eJPXmlDataConfig(EJP_XML_CONFIG, 'ci')
+            yield mock
+
+
+def _create_sensor(**kwargs) -> S3NewKeyFromLastDataDownloadDateSensor:
+    return S3NewKeyFromLastDataDownloadDateSensor(
+        task_id='sensor',
+        state_info_extract_from_config_callable=lambda *_: {
+            KEY_PATTERN_1: TIMESTAMP_1
+        },
+        default_initial_s3_last_modified_date='2020-01-01 00:00:00',
+        deployment_environment='ci',
+        **kwargs
+    )
+
+
+class TestS3NewKeyFromLastDataDownloadDateSensor:
+    def test_should_return_false_without_new_objects(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [S3_OBJECT_META_1])
+        task_instance_mock = MagicMock(name='ti')
+        assert not _create_sensor().poke({'ti': task_instance_mock})
+        task_instance_mock.xcom_push.assert_not_called()
+
+    def test_should_publish_new_objects_snapshot(
+            self, s3_client_mock: MagicMock
+    ):
+        new_s3_object_meta = {**S3_OBJECT_META_2, 'LastModified': TIMESTAMP_2}
+        set_listed_objects(s3_client_mock, [new_s3_object_meta])
+        task_instance_mock = MagicMock(name='ti')
+        assert _create_sensor().poke({'ti': task_instance_mock})
+        _, xcom_push_kwargs = task_instance_mock.xcom_push.call_args
+        assert xcom_push_kwargs['key'] == NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY
+        assert [
+            s3_object_meta['Key']
+            for s3_object_meta
+            in xcom_push_kwargs['value']['new_objects'][KEY_PATTERN_1]
+        ] == [new_s3_object_meta['Key']]
+
+
+class TestDeferrableS3NewKeyFromLastDataDownloadDateSensor:
+    def test_should_not_defer_if_new_objects_are_already_present(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [
+            {**S3_OBJECT_META_2, 'LastModified': TIMESTAMP_2}
+        ])
+        task_instance_mock = MagicMock(name='ti')
+        _create_sensor(deferrable=True).execute({'ti': task_instance_mock})
+        task_instance_mock.xcom_push.assert_called()
+
+    def test_should_defer_to_trigger_without_new_objects(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [S3_OBJECT_META_1])
+        with pytest.raises(TaskDeferred) as exc_info:
+            _create_sensor(deferrable=True, poke_interval=10).execute({
+                'ti': MagicMock(name='ti')
+            })
+        trigger = exc_info.value.trigger
+        assert isinstance(trigger, S3NewKeyFromLastDataDownloadDateTrigger)
+        assert exc_info.value.method_name == 'execute_complete'
+        assert trigger.bucket_key_wildcard_pattern_with_latest_date == {
+            KEY_PATTERN_1: TIMESTAMP_1.isoformat()
+        }
+        assert trigger.poke_interval == 10
+
+    def test_should_publish_snapshot_from_trigger_event(self):
+        task_instance_mock = MagicMock(name='ti')
+        snapshot = {'snapshot_timestamp': TIMESTAMP_2.isoformat(), 'new_objects': {}}
+        _create_sensor(deferrable=True).execute_complete(
+            {'ti': task_instance_mock},
+            {'status': 'success', 'snapshot': snapshot}
+        )
+        task_instance_mock.xcom_push.assert_called_with(
+            key=NEW_S3_OBJECTS_SNAPSHOT_XCOM_KEY, value=snapshot
+        )
+
+    def test_should_fail_on_trigger_error_event(self):
+        with pytest.raises(AirflowException):
+            _create_sensor(deferrable=True).execute_complete(
+                {'ti': MagicMock(name='ti')},
+                {'status': 'error', 'message': 'failed'}
+            )
@@ -0,0 +1,98 @@
+import marshal
+import os
+from typing import Optional
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ejp_xml_pipeline.utils.dags.data_pipeline_dag_utils import (
+    PROFILE_TASKS_ENV_VAR_NAME,
+    get_profiled_python_callable,
+    is_task_selected_for_profiling
+)
+
+
+TASK_ID_1 = 'task1'
+
+
+def _get_context(dag_run_conf: Optional[dict] = None) -> dict:
+    task_mock = MagicMock(name='task')
+    task_mock.task_id = TASK_ID_1
+    dag_run_mock = MagicMock(name='dag_run')
+    dag_run_mock.conf = dag_run_conf
+    return {'task': task_mock, 'dag_run': dag_run_mock}
+
+
+@pytest.fixture(name='env_without_profile_tasks', autouse=True)
+def _env_without_profile_tasks():
+    with patch.dict(os.environ, {PROFILE_TASKS_ENV_VAR_NAME: ''}):
+        yield
+
+
+class TestIsTaskSelectedForProfiling:
+    def test_should_not_select_task_without_value(self):
+        assert not is_task_selected_for_profiling(None, TASK_ID_1)
+        assert not is_task_selected_for_profiling('', TASK_ID_1)
+
+    def test_should_select_all_tasks(self):
+        assert is_task_selected_for_profiling(True, TASK_ID_1)
+        assert is_task_selected_for_profiling('true', TASK_ID_1)
+        assert is_task_selected_for_profiling('all', TASK_ID_1)
+
+    def test_should_select_listed_task_ids_only(self):
+        assert is_task_selected_for_profiling('other, task1', TASK_ID_1)
+        assert is_task_selected_for_profiling([TASK_ID_1], TASK_ID_1)
+        assert not is_task_selected_for_profiling('other', TASK_ID_1)
+
+
+class TestGetProfiledPythonCallable:
+    def test_should_not_profile_if_not_enabled(self):
+        profile_output_handler = MagicMock(name='profile_output_handler')
+        profiled_python_callable = get_profiled_python_callable(
+            lambda **_: 'result', profile_output_handler
+        )
+        assert profiled_python_callable(**_get_context()) == 'result'
+        profile_output_handler.assert_not_called()
+
+    def test_should_profile_if_enabled_by_dag_run_conf(self):
+        profile_output_handler = MagicMock(name='profile_output_handler')
+        profiled_python_callable = get_profiled_python_callable(
+            lambda **_: 'result', profile_output_handler
+        )
+        context = _get_context({'profile_tasks': [TASK_ID_1]})
+        assert profiled_python_callable(**context) == 'result'
+        (profile_bytes, handler_context), _ = profile_output_handler.call_args
+        assert isinstance(marshal.loads(profile_bytes), dict)
+        assert handler_context == context
+
+    def test_should_profile_if_enabled_by_env_var(self):
+        profile_output_handler = MagicMock(name='profile_output_handler')
+        profiled_python_callable = get_profiled_python_callable(
+            lambda **_: 'result', profile_output_handler
+        )
+        with patch.dict(os.environ, {PROFILE_TASKS_ENV_VAR_NAME: TASK_ID_1}):
+            profiled_python_callable(**_get_context())
+        profile_output_handler.assert_called_once()
+
+    def test_should_handle_profile_and_reraise_if_callable_fails(self):
+        profile_output_handler = MagicMock(name='profile_output_handler')
+
+        def failing_python_callable(**_):
+            raise RuntimeError('failed')
+
+        profiled_python_callable = get_profiled_python_callable(
+            failing_python_callable, profile_output_handler
+        )
+        with pytest.raises(RuntimeError):
+            profiled_python_callable(**_get_context({'profile_tasks': True}))
+        profile_output_handler.assert_called_once()
+
+    def test_should_not_fail_task_if_profile_output_handler_fails(self):
+        profile_output_handler = MagicMock(name='profile_output_handler')
+        profile_output_handler.side_effect = RuntimeError('upload failed')
+        profiled_python_callable = get_profiled_python_callable(
+            lambda **_: 'result', profile_output_handler
+        )
+        assert profiled_python_callable(
+            **_get_context({'profile_tasks': True})
+        ) == 'result'
@@ -0,0 +1,31 @@
+from ejp_xml_pipeline.utils.pattern_matcher import (
+    get_glob_pattern_matcher,
+    get_regex_pattern_matcher
+)
+
+
+class TestGetGlobPatternMatcher:
+    def test_should_match_wildcard(self):
+        matcher = get_glob_pattern_matcher('prefix/ejp_elife_*')
+        assert matcher('prefix/ejp_elife_2021_03_15.zip')
+        assert not matcher('prefix/other_2021_03_15.zip')
+
+    def test_should_match_case_sensitive(self):
+        assert not get_glob_pattern_matcher('prefix/ejp_elife_*')(
+            'prefix/EJP_ELIFE_2021_03_15.zip'
+        )
+
+    def test_should_return_cached_matcher(self):
+        assert get_glob_pattern_matcher('a*') is get_glob_pattern_matcher('a*')
+
+
+class TestGetRegexPatternMatcher:
+    def test_should_return_none_for_empty_pattern(self):
+        assert get_regex_pattern_matcher('') is None
+        assert get_regex_pattern_matcher(None) is None
+
+    def test_should_match_from_start_like_re_match(self):
+        matcher = get_regex_pattern_matcher(r'415-0\.')
+        assert matcher is not None
+        assert matcher('415-0.xml')
+        assert not matcher('other-415-0.xml')
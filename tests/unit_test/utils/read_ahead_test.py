@@ -0,0 +1,50 @@
+import threading
+from typing import Iterable, List
+
+import pytest
+
+from ejp_xml_pipeline.utils.read_ahead import iter_read_ahead
+
+
+def _iter_values_and_record(values: Iterable[int], produced_values: List[int]):
+    for value in values:
+        produced_values.append(value)
+        yield value
+
+
+class TestIterReadAhead:
+    def test_should_return_values_in_order(self):
+        assert list(iter_read_ahead(range(10), max_queue_size=2)) == list(range(10))
+
+    def test_should_produce_values_in_background_thread(self):
+        thread_names = list(iter_read_ahead(
+            (threading.current_thread().name for _ in range(2)),
+            max_queue_size=1,
+            thread_name='test-read-ahead'
+        ))
+        assert thread_names == ['test-read-ahead'] * 2
+
+    def test_should_raise_error_of_producer(self):
+        def iter_values_and_fail():
+            yield 1
+            raise RuntimeError('test error')
+
+        values = iter_read_ahead(iter_values_and_fail(), max_queue_size=2)
+        assert next(values) == 1
+        with pytest.raises(RuntimeError, match='test error'):
+            next(values)
+
+    def test_should_stop_producer_when_closed(self):
+        produced_values = []
+        values = iter_read_ahead(
+            _iter_values_and_record(range(100), produced_values),
+            max_queue_size=1
+        )
+        assert next(values) == 0
+        values.close()
+        # the consumed value, one queued value and one waiting to be queued
+        assert len(produced_values) <= 3
+        assert not [
+            thread for thread in threading.enumerate()
+            if thread.name == 'read-ahead'
+        ]
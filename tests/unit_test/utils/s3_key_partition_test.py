@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from ejp_xml_pipeline.utils.s3_key_partition import (
+    S3KeyPartition,
+    get_s3_key_pattern_prefix,
+    get_date_partitioned_s3_key_partitions,
+    get_probe_s3_key_partition,
+    iter_year_month
+)
+
+
+KEY_PATTERN_1 = 'prefix/ejp_elife_*'
+
+
+class TestGetS3KeyPatternPrefix:
+    def test_should_return_prefix_before_wildcard(self):
+        assert get_s3_key_pattern_prefix(KEY_PATTERN_1) == 'prefix/ejp_elife_'
+
+    def test_should_return_pattern_without_wildcard(self):
+        assert get_s3_key_pattern_prefix('prefix/file.zip') == 'prefix/file.zip'
+
+
+class TestIterYearMonth:
+    def test_should_iterate_across_year_end(self):
+        assert list(iter_year_month((2020, 11), (2021, 2))) == [
+            (2020, 11), (2020, 12), (2021, 1), (2021, 2)
+        ]
+
+
+class TestGetDatePartitionedS3KeyPartitions:
+    def test_should_return_none_without_last_processed_key(self):
+        assert get_date_partitioned_s3_key_partitions(
+            KEY_PATTERN_1, None, datetime(2021, 3, 20)
+        ) is None
+
+    def test_should_return_none_if_last_processed_key_has_no_date(self):
+        assert get_date_partitioned_s3_key_partitions(
+            KEY_PATTERN_1, 'prefix/ejp_elife_latest.zip', datetime(2021, 3, 20)
+        ) is None
+
+    def test_should_return_none_if_last_processed_key_not_matching_prefix(self):
+        assert get_date_partitioned_s3_key_partitions(
+            KEY_PATTERN_1, 'other/ejp_elife_2021_03_15.zip', datetime(2021, 3, 20)
+        ) is None
+
+    def test_should_return_single_partition_for_current_month(self):
+        assert get_date_partitioned_s3_key_partitions(
+            KEY_PATTERN_1,
+            'prefix/ejp_elife_2021_03_15_eLife.zip',
+            datetime(2021, 3, 20)
+        ) == [S3KeyPartition(
+            prefix='prefix/ejp_elife_2021_03',
+            start_after='prefix/ejp_elife_2021_03_15'
+        )]
+
+    def test_should_return_monthly_partitions_until_end_date(self):
+        assert get_date_partitioned_s3_key_partitions(
+            KEY_PATTERN_1,
+            'prefix/ejp_elife_2020-12-15.zip',
+            datetime(2021, 2, 1)
+        ) == [
+            S3KeyPartition(
+                prefix='prefix/ejp_elife_2020-12',
+                start_after='prefix/ejp_elife_2020-12-15'
+            ),
+            S3KeyPartition(prefix='prefix/ejp_elife_2021-01'),
+            S3KeyPartition(prefix='prefix/ejp_elife_2021-02')
+        ]
+
+    def test_should_keep_constant_text_before_date(self):
+        assert get_date_partitioned_s3_key_partitions(
+            KEY_PATTERN_1,
+            'prefix/ejp_elife_eLife_20210315.zip',
+            datetime(2021, 3, 20)
+        ) == [S3KeyPartition(
+            prefix='prefix/ejp_elife_eLife_202103',
+            start_after='prefix/ejp_elife_eLife_20210315'
+        )]
+
+
+class TestGetProbeS3KeyPartition:
+    def test_should_return_none_without_last_processed_key(self):
+        assert get_probe_s3_key_partition(KEY_PATTERN_1, None) is None
+
+    def test_should_start_after_date_of_last_processed_key(self):
+        assert get_probe_s3_key_partition(
+            KEY_PATTERN_1, 'prefix/ejp_elife_2021_03_15_eLife.zip'
+        ) == S3KeyPartition(
+            prefix='prefix/ejp_elife_',
+            start_after='prefix/ejp_elife_2021_03_15'
+        )
+
+    def test_should_start_after_last_processed_key_without_date(self):
+        assert get_probe_s3_key_partition(
+            KEY_PATTERN_1, 'prefix/ejp_elife_latest.zip'
+        ) == S3KeyPartition(
+            prefix='prefix/ejp_elife_',
+            start_after='prefix/ejp_elife_latest.zip'
+        )
@@ -0,0 +1,170 @@
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ejp_xml_pipeline.processed_object_manifest import ProcessedObjectManifest
+from ejp_xml_pipeline.utils.dags.s3_new_file_monitor import (
+    S3HookNewFileMonitor
+)
+
+from ..ejp_xml_pipeline.processed_object_manifest_test import (
+    TIMESTAMP_1,
+    TIMESTAMP_2,
+    S3_OBJECT_META_1,
+    S3_OBJECT_META_2
+)
+
+
+KEY_PATTERN_1 = 'prefix/ejp_elife_*'
+
+S3_OBJECT_META_OTHER = {
+    'Key': 'prefix/other_2020_01_01.zip',
+    'ETag': '"etag3"',
+    'Size': 789,
+    'LastModified': TIMESTAMP_2
+}
+
+
+@pytest.fixture(name='s3_client_mock')
+def _s3_client_mock():
+    with patch.object(S3HookNewFileMonitor, 'get_conn') as mock:
+        yield mock.return_value
+
+
+def set_listed_objects(s3_client_mock: MagicMock, s3_object_metas: list):
+    s3_client_mock.get_paginator.return_value.paginate.return_value = [
+        {'Contents': s3_object_metas}
+    ]
+
+
+class TestS3HookNewFileMonitor:
+    def test_should_return_objects_matching_pattern_after_latest_date(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [
+            S3_OBJECT_META_1, S3_OBJECT_META_OTHER
+        ])
+        hook = S3HookNewFileMonitor()
+        assert hook.get_new_object_key_names(
+            {KEY_PATTERN_1: datetime(2020, 1, 1, tzinfo=timezone.utc)},
+            'bucket1'
+        ) == {KEY_PATTERN_1: [S3_OBJECT_META_1]}
+
+    def test_should_include_unprocessed_objects_at_watermark_with_manifest(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [
+            S3_OBJECT_META_1, S3_OBJECT_META_2
+        ])
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        hook = S3HookNewFileMonitor()
+        assert hook.get_new_object_key_names(
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            'bucket1',
+            processed_object_manifest=processed_object_manifest
+        ) == {KEY_PATTERN_1: [S3_OBJECT_META_2]}
+        assert not hook.get_new_object_key_names(
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            'bucket1'
+        )
+
+    def test_should_list_date_partitions_starting_after_last_processed_date(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [])
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        hook = S3HookNewFileMonitor(date_partitioned_listing=True)
+        hook.get_new_object_key_names(
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            'bucket1',
+            processed_object_manifest=processed_object_manifest
+        )
+        paginate_calls = (
+            s3_client_mock.get_paginator.return_value.paginate.call_args_list
+        )
+        assert paginate_calls[0].kwargs['Prefix'] == 'prefix/ejp_elife_2020_01'
+        assert paginate_calls[0].kwargs['StartAfter'] == (
+            'prefix/ejp_elife_2020_01_01'
+        )
+        assert paginate_calls[1].kwargs['Prefix'] == 'prefix/ejp_elife_2020_02'
+        assert 'StartAfter' not in paginate_calls[1].kwargs
+
+    def test_should_list_full_prefix_without_manifest(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [])
+        hook = S3HookNewFileMonitor(date_partitioned_listing=True)
+        hook.get_new_object_key_names({KEY_PATTERN_1: TIMESTAMP_1}, 'bucket1')
+        s3_client_mock.get_paginator.return_value.paginate.assert_called_once()
+        _, paginate_kwargs = (
+            s3_client_mock.get_paginator.return_value.paginate.call_args
+        )
+        assert paginate_kwargs['Prefix'] == 'prefix/ejp_elife_'
+        assert 'StartAfter' not in paginate_kwargs
+
+
+class TestS3HookNewFileMonitorProbe:
+    def _get_processed_object_manifest(self) -> ProcessedObjectManifest:
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        return processed_object_manifest
+
+    def test_should_skip_full_listing_if_probe_finds_no_keys(
+            self, s3_client_mock: MagicMock
+    ):
+        s3_client_mock.list_objects_v2.return_value = {
+            'Contents': [S3_OBJECT_META_1], 'IsTruncated': False
+        }
+        hook = S3HookNewFileMonitor(probe_max_keys=10)
+        assert not hook.get_new_object_key_names(
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            'bucket1',
+            processed_object_manifest=self._get_processed_object_manifest()
+        )
+        _, list_objects_kwargs = s3_client_mock.list_objects_v2.call_args
+        assert list_objects_kwargs['MaxKeys'] == 10
+        assert list_objects_kwargs['StartAfter'] == 'prefix/ejp_elife_2020_01_01'
+        s3_client_mock.get_paginator.return_value.paginate.assert_not_called()
+
+    def test_should_list_pattern_if_probe_finds_new_key(
+            self, s3_client_mock: MagicMock
+    ):
+        s3_client_mock.list_objects_v2.return_value = {
+            'Contents': [S3_OBJECT_META_1, S3_OBJECT_META_2],
+            'IsTruncated': True
+        }
+        hook = S3HookNewFileMonitor(probe_max_keys=10)
+        assert hook.get_bucket_key_patterns_to_list(
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            'bucket1',
+            processed_object_manifest=self._get_processed_object_manifest()
+        ) == {KEY_PATTERN_1: TIMESTAMP_1}
+        s3_client_mock.get_paginator.return_value.paginate.assert_not_called()
+
+    def test_should_fall_back_to_full_listing_if_probe_is_truncated(
+            self, s3_client_mock: MagicMock
+    ):
+        s3_client_mock.list_objects_v2.return_value = {
+            'Contents': [S3_OBJECT_META_1], 'IsTruncated': True
+        }
+        set_listed_objects(s3_client_mock, [S3_OBJECT_META_1, S3_OBJECT_META_2])
+        hook = S3HookNewFileMonitor(probe_max_keys=10)
+        assert hook.get_new_object_key_names(
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            'bucket1',
+            processed_object_manifest=self._get_processed_object_manifest()
+        ) == {KEY_PATTERN_1: [S3_OBJECT_META_2]}
+
+    def test_should_not_probe_without_manifest(
+            self, s3_client_mock: MagicMock
+    ):
+        set_listed_objects(s3_client_mock, [])
+        hook = S3HookNewFileMonitor(probe_max_keys=10)
+        assert not hook.get_new_object_key_names(
+            {KEY_PATTERN_1: TIMESTAMP_1}, 'bucket1'
+        )
+        s3_client_mock.list_objects_v2.assert_not_called()
+        s3_client_mock.get_paginator.return_value.paginate.assert_called_once()
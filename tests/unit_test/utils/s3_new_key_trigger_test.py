@@ -0,0 +1,154 @@
+import asyncio
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ejp_xml_pipeline.processed_object_manifest import ProcessedObjectManifest
+from ejp_xml_pipeline.utils.dags.s3_new_key_trigger import (
+    S3NewKeyFromLastDataDownloadDateTrigger,
+    to_serializable_latest_dates,
+    from_serializable_latest_dates
+)
+
+from ..ejp_xml_pipeline.processed_object_manifest_test import (
+    TIMESTAMP_1,
+    TIMESTAMP_2,
+    S3_OBJECT_META_1,
+    S3_OBJECT_META_2
+)
+
+
+KEY_PATTERN_1 = 'prefix/ejp_elife_*'
+
+
+class AsyncPageIterator:
+    def __init__(self, pages: list):
+        self.pages = pages
+
+    def __aiter__(self):
+        return self._iter_pages()
+
+    async def _iter_pages(self):
+        for page in self.pages:
+            yield page
+
+
+class AsyncClientContextManager:
+    def __init__(self, client):
+        self.client = client
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, *_):
+        return False
+
+
+@pytest.fixture(name='async_s3_client_mock')
+def _async_s3_client_mock():
+    client = MagicMock(name='async_s3_client')
+    with patch.object(
+            S3NewKeyFromLastDataDownloadDateTrigger, 'hook'
+    ) as hook_mock:
+        hook_mock.async_conn = AsyncClientContextManager(client)
+        yield client
+
+
+@pytest.fixture(name='sleep_mock')
+def _sleep_mock():
+    with patch.object(asyncio, 'sleep') as mock:
+        mock.side_effect = asyncio.CancelledError()
+        yield mock
+
+
+def _set_listed_objects(async_s3_client_mock: MagicMock, s3_object_metas: list):
+    async_s3_client_mock.get_paginator.return_value.paginate.return_value = (
+        AsyncPageIterator([{'Contents': s3_object_metas}])
+    )
+
+
+def _create_trigger(**kwargs) -> S3NewKeyFromLastDataDownloadDateTrigger:
+    return S3NewKeyFromLastDataDownloadDateTrigger(
+        bucket_name='bucket1',
+        bucket_key_wildcard_pattern_with_latest_date=to_serializable_latest_dates(
+            {KEY_PATTERN_1: TIMESTAMP_1}
+        ),
+        **kwargs
+    )
+
+
+async def _get_first_event(trigger: S3NewKeyFromLastDataDownloadDateTrigger):
+    async for event in trigger.run():
+        return event
+    return None
+
+
+class TestSerializableLatestDates:
+    def test_should_convert_latest_dates_back_and_forth(self):
+        latest_dates = {KEY_PATTERN_1: TIMESTAMP_1}
+        assert from_serializable_latest_dates(
+            to_serializable_latest_dates(latest_dates)
+        ) == latest_dates
+
+
+class TestS3NewKeyFromLastDataDownloadDateTrigger:
+    def test_should_serialize_to_recreatable_kwargs(self):
+        trigger = _create_trigger(
+            processed_object_manifest_entries=[],
+            date_partitioned_listing=True,
+            poke_interval=10
+        )
+        classpath, kwargs = trigger.serialize()
+        assert classpath.endswith('.S3NewKeyFromLastDataDownloadDateTrigger')
+        assert S3NewKeyFromLastDataDownloadDateTrigger(
+            **kwargs
+        ).serialize() == (classpath, kwargs)
+
+    def test_should_yield_snapshot_of_new_objects(
+            self, async_s3_client_mock: MagicMock
+    ):
+        new_s3_object_meta = {**S3_OBJECT_META_2, 'LastModified': TIMESTAMP_2}
+        _set_listed_objects(async_s3_client_mock, [
+            S3_OBJECT_META_1, new_s3_object_meta
+        ])
+        event = asyncio.run(_get_first_event(_create_trigger()))
+        assert event.payload['status'] == 'success'
+        assert [
+            s3_object_meta['Key']
+            for s3_object_meta
+            in event.payload['snapshot']['new_objects'][KEY_PATTERN_1]
+        ] == [new_s3_object_meta['Key']]
+
+    def test_should_exclude_objects_in_manifest(
+            self, async_s3_client_mock: MagicMock
+    ):
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        _set_listed_objects(async_s3_client_mock, [
+            S3_OBJECT_META_1, S3_OBJECT_META_2
+        ])
+        event = asyncio.run(_get_first_event(_create_trigger(
+            processed_object_manifest_entries=list(
+                processed_object_manifest.entry_by_key.values()
+            )
+        )))
+        assert [
+            s3_object_meta['Key']
+            for s3_object_meta
+            in event.payload['snapshot']['new_objects'][KEY_PATTERN_1]
+        ] == [S3_OBJECT_META_2['Key']]
+
+    def test_should_sleep_for_poke_interval_without_new_objects(
+            self, async_s3_client_mock: MagicMock, sleep_mock: MagicMock
+    ):
+        _set_listed_objects(async_s3_client_mock, [S3_OBJECT_META_1])
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(_get_first_event(_create_trigger(poke_interval=10)))
+        sleep_mock.assert_called_with(10)
+
+    def test_should_yield_error_event_on_listing_failure(
+            self, async_s3_client_mock: MagicMock
+    ):
+        async_s3_client_mock.get_paginator.side_effect = RuntimeError('failed')
+        event = asyncio.run(_get_first_event(_create_trigger()))
+        assert event.payload == {'status': 'error', 'message': 'failed'}
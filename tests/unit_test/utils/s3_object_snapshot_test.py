@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from ejp_xml_pipeline.processed_object_manifest import ProcessedObjectManifest
+from ejp_xml_pipeline.utils.s3_object_snapshot import (
+    get_new_s3_objects_snapshot,
+    get_new_object_key_names_from_snapshot
+)
+
+from ..ejp_xml_pipeline.processed_object_manifest_test import (
+    TIMESTAMP_1,
+    S3_OBJECT_META_1,
+    S3_OBJECT_META_2
+)
+
+
+KEY_PATTERN_1 = 'prefix/ejp_elife_*'
+
+MAX_AGE = timedelta(minutes=30)
+
+WATERMARK_TIMESTAMP = TIMESTAMP_1 - timedelta(days=1)
+
+
+class TestGetNewObjectKeyNamesFromSnapshot:
+    def test_should_return_none_without_snapshot(self):
+        assert get_new_object_key_names_from_snapshot(
+            None,
+            {KEY_PATTERN_1: WATERMARK_TIMESTAMP},
+            max_age=MAX_AGE,
+            now=TIMESTAMP_1
+        ) is None
+
+    def test_should_restore_new_objects_from_fresh_snapshot(self):
+        snapshot = get_new_s3_objects_snapshot(
+            {KEY_PATTERN_1: [S3_OBJECT_META_1]},
+            snapshot_timestamp=TIMESTAMP_1
+        )
+        assert get_new_object_key_names_from_snapshot(
+            snapshot,
+            {KEY_PATTERN_1: WATERMARK_TIMESTAMP},
+            max_age=MAX_AGE,
+            now=TIMESTAMP_1 + timedelta(minutes=1)
+        ) == {KEY_PATTERN_1: [S3_OBJECT_META_1]}
+
+    def test_should_return_none_for_stale_snapshot(self):
+        snapshot = get_new_s3_objects_snapshot(
+            {KEY_PATTERN_1: [S3_OBJECT_META_1]},
+            snapshot_timestamp=TIMESTAMP_1
+        )
+        assert get_new_object_key_names_from_snapshot(
+            snapshot,
+            {KEY_PATTERN_1: WATERMARK_TIMESTAMP},
+            max_age=MAX_AGE,
+            now=TIMESTAMP_1 + MAX_AGE + timedelta(minutes=1)
+        ) is None
+
+    def test_should_return_none_for_snapshot_of_other_pattern(self):
+        snapshot = get_new_s3_objects_snapshot(
+            {'other/*': [S3_OBJECT_META_1]},
+            snapshot_timestamp=TIMESTAMP_1
+        )
+        assert get_new_object_key_names_from_snapshot(
+            snapshot,
+            {KEY_PATTERN_1: WATERMARK_TIMESTAMP},
+            max_age=MAX_AGE,
+            now=TIMESTAMP_1
+        ) is None
+
+    def test_should_exclude_objects_processed_since_snapshot(self):
+        snapshot = get_new_s3_objects_snapshot(
+            {KEY_PATTERN_1: [S3_OBJECT_META_1, S3_OBJECT_META_2]},
+            snapshot_timestamp=TIMESTAMP_1
+        )
+        processed_object_manifest = ProcessedObjectManifest()
+        processed_object_manifest.add(S3_OBJECT_META_1)
+        assert get_new_object_key_names_from_snapshot(
+            snapshot,
+            {KEY_PATTERN_1: TIMESTAMP_1},
+            max_age=MAX_AGE,
+            now=TIMESTAMP_1,
+            processed_object_manifest=processed_object_manifest
+        ) == {KEY_PATTERN_1: [S3_OBJECT_META_2]}
@@ -0,0 +1,41 @@
+from ejp_xml_pipeline.utils.xml_transform_util.string_interning import (
+    StringInternTable,
+    intern_string,
+    string_intern_table_scope
+)
+
+
+def _get_new_string(value: str) -> str:
+    return ''.join(list(value))
+
+
+class TestStringInternTable:
+    def test_should_return_first_string_for_equal_values(self):
+        string_intern_table = StringInternTable()
+        value_1 = _get_new_string('value1')
+        value_2 = _get_new_string('value1')
+        assert value_1 is not value_2
+        assert string_intern_table.intern(value_1) is value_1
+        assert string_intern_table.intern(value_2) is value_1
+        assert string_intern_table.shared_count == 1
+        assert string_intern_table.shared_bytes > 0
+        assert len(string_intern_table) == 1
+
+
+class TestInternString:
+    def test_should_return_value_unchanged_outside_of_scope(self):
+        value_1 = _get_new_string('value1')
+        assert intern_string(value_1) is value_1
+
+    def test_should_use_table_of_current_scope(self):
+        value_1 = _get_new_string('value1')
+        value_2 = _get_new_string('value1')
+        with string_intern_table_scope(StringInternTable()):
+            assert intern_string(value_1) is value_1
+            assert intern_string(value_2) is value_1
+        assert intern_string(value_2) is value_2
+
+    def test_should_not_intern_empty_values(self):
+        with string_intern_table_scope(StringInternTable()):
+            assert intern_string(None) is None
+            assert intern_string('') == ''
@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ejp_xml_pipeline.utils.xml_transform_util.xml_parser_pool import (
+    XmlParserOptions,
+    XmlParserPool,
+    get_xml_parser_pool
+)
+
+
+class TestXmlParserPool:
+    def test_should_reuse_parser_within_thread(self):
+        xml_parser_pool = XmlParserPool()
+        assert xml_parser_pool.get_parser() is xml_parser_pool.get_parser()
+
+    def test_should_use_separate_parser_per_thread(self):
+        xml_parser_pool = XmlParserPool()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_parser = executor.submit(xml_parser_pool.get_parser).result()
+        assert other_thread_parser is not xml_parser_pool.get_parser()
+
+    def test_should_parse_multiple_documents_with_reused_parser(self):
+        parser = XmlParserPool().get_parser()
+        parser.feed(b'<xml>1</xml>')
+        assert parser.close().text == '1'
+        parser.feed(b'<xml>2<!-- comment --></xml>')
+        root = parser.close()
+        assert root.text == '2'
+        assert len(root) == 0
+
+    def test_should_not_truncate_large_text(self):
+        # libxml2 limits text nodes to 10 MB unless huge_tree is enabled
+        text = 'x' * 11_000_000
+        parser = XmlParserPool().get_parser()
+        parser.feed(f'<xml>{text}</xml>'.encode())
+        assert len(parser.close().text) == len(text)
+
+
+class TestGetXmlParserPool:
+    def test_should_return_same_pool_for_same_options(self):
+        assert get_xml_parser_pool(XmlParserOptions()) is get_xml_parser_pool(
+            XmlParserOptions()
+        )
+
+    def test_should_return_separate_pool_for_other_options(self):
+        assert get_xml_parser_pool(
+            XmlParserOptions(remove_blank_text=True)
+        ) is not get_xml_parser_pool(XmlParserOptions())
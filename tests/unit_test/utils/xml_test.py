@@ -1,9 +1,18 @@
+from io import BytesIO
+
+import pytest
 # pylint: disable=no-name-in-module
 from lxml.builder import E
+from lxml.etree import XMLParser
 
 from ejp_xml_pipeline.utils.xml_transform_util.xml import (
+    DECODE_CACHE_MAX_TEXT_LENGTH,
+    LineTrackingReader,
     decode_html_entities,
-    get_and_decode_xml_child_text
+    get_and_decode_xml_child_text,
+    get_xml_error_count_by_type,
+    get_xml_text,
+    parse_xml_and_show_error_line
 )
 
 
@@ -11,6 +20,65 @@ ENCODED_TEXT = '&apos;'
 DECODED_TEXT = "'"
 
 
+INVALID_XML_BYTES = b'<xml>\n<title>mismatched</name>\n</xml>'
+
+
+class _OpenCounter:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.open_count = 0
+
+    def __call__(self):
+        self.open_count += 1
+        return BytesIO(self.data)
+
+
+class TestLineTrackingReader:
+    def test_should_return_data_read_from_source(self):
+        reader = LineTrackingReader(BytesIO(b'line 1\nline 2'))
+        assert reader.read(3) + reader.read(-1) == b'line 1\nline 2'
+
+    def test_should_return_line_across_chunks(self):
+        reader = LineTrackingReader(BytesIO(b'line 1\nline 2\nline 3'))
+        while reader.read(4):
+            pass
+        assert reader.get_line(2) == 'line 2'
+
+    def test_should_return_none_for_line_no_longer_retained(self):
+        reader = LineTrackingReader(
+            BytesIO(b'line 1\nline 2\nline 3\n'), max_retained_bytes=7
+        )
+        while reader.read(7):
+            pass
+        assert reader.get_line(1) is None
+        assert reader.get_line(3) == 'line 3'
+
+
+class TestParseXmlAndShowErrorLine:
+    @pytest.mark.parametrize('track_lines', [False, True])
+    def test_should_show_error_line(self, track_lines: bool):
+        with pytest.raises(ValueError, match='mismatched'):
+            parse_xml_and_show_error_line(
+                _OpenCounter(INVALID_XML_BYTES), track_lines=track_lines
+            )
+
+    def test_should_not_reopen_source_when_tracking_lines(self):
+        open_fn = _OpenCounter(INVALID_XML_BYTES)
+        with pytest.raises(ValueError):
+            parse_xml_and_show_error_line(open_fn, track_lines=True)
+        assert open_fn.open_count == 1
+
+    def test_should_count_recovered_errors_by_type(self):
+        parser = XMLParser(recover=True)
+        root = parse_xml_and_show_error_line(
+            _OpenCounter(INVALID_XML_BYTES), track_lines=True, parser=parser
+        ).getroot()
+        assert root.tag == 'xml'
+        assert get_xml_error_count_by_type(parser.feed_error_log) == {
+            'ERR_TAG_NAME_MISMATCH': 1
+        }
+
+
 class TestDecodeHtmlEntities:
     def test_should_return_none_if_text_is_none(self):
         assert decode_html_entities(None) is None
@@ -24,6 +92,26 @@ class TestDecodeHtmlEntities:
     def test_should_decode_named_entity(self):
         assert decode_html_entities('&apos;') == "'"
 
+    def test_should_decode_repeated_short_text_consistently(self):
+        assert [decode_html_entities('A &amp; B') for _ in range(2)] == ['A & B'] * 2
+
+    def test_should_decode_long_text(self):
+        text = 'x' * DECODE_CACHE_MAX_TEXT_LENGTH + ' &amp;'
+        assert decode_html_entities(text) == 'x' * DECODE_CACHE_MAX_TEXT_LENGTH + ' &'
+
+
+class TestGetXmlText:
+    def test_should_return_text_of_leaf_element(self):
+        assert get_xml_text(E.node('text')) == 'text'
+
+    def test_should_return_default_value_for_empty_leaf_element(self):
+        assert get_xml_text(E.node(), default_value=None) is None
+
+    def test_should_join_text_of_nested_elements(self):
+        assert get_xml_text(E.node('text1 ', E.b('text2'), ' text3')) == (
+            'text1 text2 text3'
+        )
+
 
 class TestGetAndDecodeXmlChildText:
     def test_should_return_none_if_child_element_was_not_found(self):